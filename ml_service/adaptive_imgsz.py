@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Adaptive YOLO Input Size
+================================================================================
+
+Per-camera YOLO input sizing from rolling person-size statistics.
+
+Every frame used to go to YOLO at the same input size regardless of camera
+resolution or subject size. Near-field cameras (large, close people) can use
+a much smaller imgsz without losing detections, while wide shots with small,
+distant people need a larger one. The sizer keeps a rolling window of person
+box heights (relative to the frame) per camera and picks the smallest size
+from the ladder at which a small person (low percentile of recent heights)
+still spans at least `min_person_px` pixels of model input.
+
+Cameras are keyed by (userId, cameraId) (camera_hub.camera_key). The chosen
+size and the latest pose latency are reported per camera in the WebSocket
+response (`response_fields`), in addition to the log line on size changes.
+
+Features:
+- Size ladder (multiples of 32) with a default for cameras without people
+- Hysteresis: a new size must be chosen several times in a row
+- Per-camera log line on every size change
+- Per-camera, per-size pose latency statistics
+- Per-frame imgsz / pose latency response fields
+
+Usage:
+    from adaptive_imgsz import AdaptiveInputSizer
+
+    sizer = AdaptiveInputSizer()
+
+    imgsz = sizer.choose(camera_id, user_id)
+    start = time.perf_counter()
+    pose = pose_batcher.extract(camera_id, frame, imgsz=imgsz)
+    sizer.record(camera_id, user_id, pose, frame.shape, (time.perf_counter() - start) * 1000)
+
+    response.update(sizer.response_fields(camera_id, user_id))
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from camera_hub import CameraKey, camera_key
+
+# Defaults
+DEFAULT_IMGSZ_LADDER = (320, 416, 512, 640)
+DEFAULT_IMGSZ = 640              # Used until people have been seen
+DEFAULT_MIN_PERSON_PX = 96       # Small person height needed at model input
+DEFAULT_HISTORY = 120            # Person heights kept per camera
+DEFAULT_PERCENTILE = 20          # "Small person" = 20th percentile height
+DEFAULT_SWITCH_AFTER = 10        # Consecutive decisions before switching
+MIN_SAMPLES = 10                 # Heights needed before adapting
+
+
+@dataclass
+class CameraSizing:
+    """Sizing state for one camera"""
+    imgsz: int
+    heights: Deque[float] = field(default_factory=deque)   # person height / long side
+    candidate: int = 0
+    candidate_count: int = 0
+    latency: Dict[int, Deque[float]] = field(default_factory=dict)
+    frames: int = 0
+    last_imgsz: int = 0              # Size the latest frame ran at
+    last_pose_ms: float = 0.0
+
+
+class AdaptiveInputSizer:
+    """
+    Chooses the YOLO imgsz for each camera.
+
+    Supports:
+    - Rolling person-size statistics per camera
+    - Hysteresis between sizes
+    - Per-size pose latency tracking
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        ladder: Sequence[int] = DEFAULT_IMGSZ_LADDER,
+        default_imgsz: int = DEFAULT_IMGSZ,
+        min_person_px: int = DEFAULT_MIN_PERSON_PX,
+        history: int = DEFAULT_HISTORY,
+        percentile: float = DEFAULT_PERCENTILE,
+        switch_after: int = DEFAULT_SWITCH_AFTER,
+    ):
+        """
+        Initialize the sizer.
+
+        Args:
+            ladder: Allowed input sizes (ascending, multiples of 32)
+            default_imgsz: Size used before people have been observed
+            min_person_px: Required height of a small person at model input
+            history: Person heights kept per camera
+            percentile: Percentile of recent heights treated as "small person"
+            switch_after: Consecutive identical decisions needed to switch
+        """
+        self.ladder = tuple(sorted(ladder))
+        self.default_imgsz = default_imgsz
+        self.min_person_px = min_person_px
+        self.history = history
+        self.percentile = percentile
+        self.switch_after = switch_after
+        self._cameras: Dict[CameraKey, CameraSizing] = {}
+        self._lock = threading.Lock()
+
+    def choose(self, camera_id: str, user_id: Optional[str]) -> int:
+        """Current YOLO input size for a camera"""
+        with self._lock:
+            return self._get_or_create(camera_key(user_id, camera_id)).imgsz
+
+    def record(
+        self,
+        camera_id: str,
+        user_id: Optional[str],
+        pose: Any,
+        frame_shape: Tuple[int, ...],
+        pose_ms: float,
+    ):
+        """
+        Feed back the result of a pose call.
+
+        Args:
+            camera_id: Camera identifier
+            user_id: Tenant (userId)
+            pose: PoseResult (uses its boxes)
+            frame_shape: Shape of the decoded frame (H, W, ...)
+            pose_ms: Pose latency for this frame in ms
+        """
+        long_side = float(max(frame_shape[0], frame_shape[1]))
+
+        with self._lock:
+            state = self._get_or_create(camera_key(user_id, camera_id))
+            state.frames += 1
+            state.last_imgsz = state.imgsz
+            state.last_pose_ms = pose_ms
+            latencies = state.latency.setdefault(state.imgsz, deque(maxlen=self.history))
+            latencies.append(pose_ms)
+
+            for box in pose.boxes:
+                state.heights.append(float(box[3] - box[1]) / long_side)
+
+            if len(state.heights) < MIN_SAMPLES:
+                return
+
+            target = self._target_size(state.heights)
+            if target == state.imgsz:
+                state.candidate_count = 0
+                return
+
+            if target != state.candidate:
+                state.candidate = target
+                state.candidate_count = 0
+            state.candidate_count += 1
+
+            if state.candidate_count >= self.switch_after:
+                print(f"[AdaptiveImgsz] {user_id}/{camera_id}: imgsz {state.imgsz} -> {target} "
+                      f"(p{self.percentile:g} person height {self._small_height(state.heights):.3f}, "
+                      f"pose {self._mean(latencies):.1f} ms)")
+                state.imgsz = target
+                state.candidate_count = 0
+
+    def response_fields(self, camera_id: str, user_id: Optional[str]) -> Dict[str, Any]:
+        """Fields to merge into the per-frame WebSocket response"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            if state is None or not state.frames:
+                return {'pose_input': {'imgsz': self.default_imgsz, 'pose_ms': None}}
+            return {'pose_input': {'imgsz': state.last_imgsz, 'pose_ms': round(state.last_pose_ms, 2)}}
+
+    def get_camera_stats(self, camera_id: str, user_id: Optional[str]) -> Dict[str, Any]:
+        """Chosen size and pose latency per size for one camera"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            if state is None:
+                return {'imgsz': self.default_imgsz, 'pose_ms': {}, 'frames': 0}
+            return {
+                'imgsz': state.imgsz,
+                'frames': state.frames,
+                'small_person_height': round(self._small_height(state.heights), 4),
+                'pose_ms': {size: round(self._mean(v), 2) for size, v in sorted(state.latency.items())},
+            }
+
+    def remove_camera(self, camera_id: str, user_id: Optional[str]):
+        """Forget state for a disconnected camera"""
+        with self._lock:
+            self._cameras.pop(camera_key(user_id, camera_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Number of cameras at each input size"""
+        with self._lock:
+            sizes: Dict[int, int] = {}
+            for state in self._cameras.values():
+                sizes[state.imgsz] = sizes.get(state.imgsz, 0) + 1
+            return {'cameras': len(self._cameras), 'cameras_by_imgsz': dict(sorted(sizes.items()))}
+
+    def _small_height(self, heights: Deque[float]) -> float:
+        """Relative height of a 'small' person in recent frames"""
+        if not heights:
+            return 0.0
+        return float(np.percentile(np.fromiter(heights, dtype=np.float32), self.percentile))
+
+    def _target_size(self, heights: Deque[float]) -> int:
+        """Smallest ladder size at which a small person is still large enough"""
+        small = self._small_height(heights)
+        for size in self.ladder:
+            if small * size >= self.min_person_px:
+                return size
+        return self.ladder[-1]
+
+    def _mean(self, values: Deque[float]) -> float:
+        return sum(values) / len(values) if values else 0.0
+
+    def _get_or_create(self, key: CameraKey) -> CameraSizing:
+        """Get camera state (caller holds the lock)"""
+        state = self._cameras.get(key)
+        if state is None:
+            state = CameraSizing(imgsz=self.default_imgsz, heights=deque(maxlen=self.history))
+            self._cameras[key] = state
+        return state
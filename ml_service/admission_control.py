@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Admission Control
+================================================================================
+
+Capacity-aware admission of /ws/live camera sessions.
+
+The server accepted every connection, so once saturated every camera's
+latency degraded together. The controller estimates how many frames per
+second the node can sustain from recent per-stage timings
+(StagedPipeline.get_stats()): each stage can process
+workers * 1000 / service_ms items per second, scaled by the fraction of
+frames that reach it (strides and gates filter frames before the GCN stage),
+and the slowest stage bounds the node. A headroom factor keeps latency
+within SLO instead of running at 100%.
+
+New cameras are admitted while the admitted demand (sum of each camera's
+expected or measured fps) plus theirs fits the capacity. Otherwise the
+session is redirected to a node with room (via an optional locator, e.g.
+the CameraRouter's other nodes) or rejected with a retry-after hint.
+Cameras already admitted are always accepted again on reconnect. Cameras
+are keyed by (userId, cameraId), as in camera_hub: every tenant names its
+cells camera-0..N, so another tenant's camera-0 is a new camera, not a
+reconnect.
+
+When capacity drops below the admitted demand (e.g. models slowed down),
+plan_shedding() lists the lowest-priority cameras to throttle or close
+first, until the remaining demand fits.
+
+Features:
+- Sustainable fps from per-stage service times and pass-through ratios
+- Admit / redirect / reject with retry_after
+- Priority-ordered load shedding
+- Thread-safe operations
+
+Usage:
+    from admission_control import AdmissionController
+
+    admission = AdmissionController(headroom=0.8)
+
+    # Periodically
+    admission.update_capacity(pipeline.get_stats())
+    fps = ingress.get_camera_stats(camera_id, user_id)['input_fps']
+    admission.update_camera_fps(camera_id, user_id, fps)
+
+    # On a new /ws/live camera
+    decision = admission.admit(camera_id, user_id, expected_fps=10, priority=1)
+    if not decision.admitted:
+        await websocket.send_json(decision.to_message())
+        await websocket.close(code=1013)      # Try Again Later
+
+    for user_id, camera_id, fps in admission.plan_shedding():
+        ...                                    # throttle or close lowest priority first
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from camera_hub import CameraKey, camera_key
+
+# Defaults
+DEFAULT_HEADROOM = 0.8              # Fraction of estimated capacity to admit
+DEFAULT_CAMERA_FPS = 10.0           # Assumed fps for cameras without a measurement
+DEFAULT_RETRY_AFTER = 30.0          # Seconds suggested to rejected clients
+DEFAULT_MIN_SAMPLES = 20            # Stage items before timings are trusted
+CAPACITY_EMA = 0.3                  # Smoothing of the capacity estimate
+
+DECISION_ADMITTED = 'admitted'
+DECISION_REDIRECTED = 'redirected'
+DECISION_REJECTED = 'rejected'
+
+
+@dataclass
+class AdmissionDecision:
+    """Outcome of an admission request"""
+    status: str
+    camera_id: str
+    reason: str = ''
+    retry_after: Optional[float] = None
+    redirect: Optional[str] = None
+    capacity_fps: Optional[float] = None
+    demand_fps: float = 0.0
+
+    @property
+    def admitted(self) -> bool:
+        return self.status == DECISION_ADMITTED
+
+    def to_message(self) -> Dict[str, Any]:
+        """WebSocket message sent before closing a refused session"""
+        message = {
+            'type': 'admission',
+            'cameraId': self.camera_id,
+            'status': self.status,
+            'reason': self.reason,
+        }
+        if self.retry_after is not None:
+            message['retry_after'] = round(self.retry_after, 1)
+        if self.redirect is not None:
+            message['redirect'] = self.redirect
+        return message
+
+
+@dataclass
+class AdmittedCamera:
+    """Admission state for one camera"""
+    user_id: Optional[str]
+    fps: float
+    priority: float
+    measured: bool = False
+    admitted_at: float = 0.0
+
+
+def estimate_capacity(pipeline_stats: Dict[str, Any], min_samples: int = DEFAULT_MIN_SAMPLES) -> Optional[float]:
+    """
+    Sustainable input frames/s from StagedPipeline.get_stats().
+
+    Args:
+        pipeline_stats: Output of StagedPipeline.get_stats()
+        min_samples: Items a stage must have processed to be trusted
+
+    Returns:
+        Frames per second the slowest stage can sustain, or None while
+        there is not enough data
+    """
+    stages = list(pipeline_stats.get('stages', {}).values())
+    if not stages:
+        return None
+    frames = stages[0].get('processed', 0)
+    if frames < min_samples:
+        return None
+
+    capacity = None
+    for stage in stages:
+        processed = stage.get('processed', 0)
+        service_ms = stage.get('service_ms', {}).get('p50', 0.0)
+        if processed < min_samples or service_ms <= 0:
+            continue
+        # Share of input frames that reach this stage
+        reach = min(processed / frames, 1.0)
+        stage_fps = stage.get('workers', 1) * 1000.0 / (service_ms * reach)
+        capacity = stage_fps if capacity is None else min(capacity, stage_fps)
+    return capacity
+
+
+class AdmissionController:
+    """
+    Admits, redirects or rejects camera sessions by node capacity.
+
+    Supports:
+    - Capacity estimation from pipeline stage timings
+    - Redirect to another node through a locator callback
+    - Retry-after hints
+    - Priority-ordered shedding plans
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        headroom: float = DEFAULT_HEADROOM,
+        default_camera_fps: float = DEFAULT_CAMERA_FPS,
+        retry_after: float = DEFAULT_RETRY_AFTER,
+        locator: Optional[Callable[[str, float], Optional[str]]] = None,
+        static_capacity_fps: Optional[float] = None,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            headroom: Fraction of the estimated capacity that may be admitted
+            default_camera_fps: Demand assumed for a new camera
+            retry_after: Seconds suggested to rejected clients
+            locator: Called as locator(camera_id, fps) to find another node
+                with room; returns its URL / node ID or None
+            static_capacity_fps: Capacity to use until timings are available
+                (None = admit everything until then)
+        """
+        self.headroom = headroom
+        self.default_camera_fps = default_camera_fps
+        self.retry_after = retry_after
+        self.locator = locator
+        self._capacity_fps = static_capacity_fps
+        self._cameras: Dict[CameraKey, AdmittedCamera] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self._decisions = {DECISION_ADMITTED: 0, DECISION_REDIRECTED: 0, DECISION_REJECTED: 0}
+        self._shed_planned = 0
+
+    def update_capacity(self, pipeline_stats: Dict[str, Any]) -> Optional[float]:
+        """
+        Refresh the capacity estimate from pipeline statistics.
+
+        Returns:
+            Smoothed capacity (frames/s), None if still unknown
+        """
+        estimate = estimate_capacity(pipeline_stats)
+        with self._lock:
+            if estimate is not None:
+                if self._capacity_fps is None:
+                    self._capacity_fps = estimate
+                else:
+                    self._capacity_fps += CAPACITY_EMA * (estimate - self._capacity_fps)
+            return self._capacity_fps
+
+    def update_camera_fps(self, camera_id: str, user_id: Optional[str], fps: float):
+        """Replace a camera's assumed demand with its measured input fps"""
+        with self._lock:
+            camera = self._cameras.get(camera_key(user_id, camera_id))
+            if camera is not None and fps > 0:
+                camera.fps = fps
+                camera.measured = True
+
+    def set_priority(self, camera_id: str, user_id: Optional[str], priority: float):
+        """Change a camera's shedding priority (higher = kept longer)"""
+        with self._lock:
+            camera = self._cameras.get(camera_key(user_id, camera_id))
+            if camera is not None:
+                camera.priority = priority
+
+    def admit(
+        self,
+        camera_id: str,
+        user_id: Optional[str] = None,
+        expected_fps: Optional[float] = None,
+        priority: float = 0.0,
+    ) -> AdmissionDecision:
+        """
+        Decide whether a new camera session may start on this node.
+
+        Args:
+            camera_id: Camera identifier
+            user_id: Tenant (userId)
+            expected_fps: Frames/s the client will send (default_camera_fps if None)
+            priority: Shedding priority (higher = kept longer)
+
+        Returns:
+            AdmissionDecision
+        """
+        fps = expected_fps or self.default_camera_fps
+        key = camera_key(user_id, camera_id)
+        with self._lock:
+            demand = self._demand()
+            budget = None if self._capacity_fps is None else self._capacity_fps * self.headroom
+
+            if key in self._cameras:
+                decision = AdmissionDecision(DECISION_ADMITTED, camera_id, 'reconnect',
+                                             capacity_fps=budget, demand_fps=demand)
+            elif budget is None or demand + fps <= budget:
+                self._cameras[key] = AdmittedCamera(key[0], fps, priority, admitted_at=time.time())
+                decision = AdmissionDecision(DECISION_ADMITTED, camera_id, 'capacity_available',
+                                             capacity_fps=budget, demand_fps=demand + fps)
+            else:
+                decision = None
+
+        if decision is None:
+            redirect = self.locator(camera_id, fps) if self.locator is not None else None
+            status = DECISION_REDIRECTED if redirect else DECISION_REJECTED
+            decision = AdmissionDecision(status, camera_id, 'over_capacity',
+                                         retry_after=None if redirect else self.retry_after,
+                                         redirect=redirect, capacity_fps=budget, demand_fps=demand)
+            print(f"[Admission] {key[0]}/{camera_id} {status}: demand {demand + fps:.1f} fps > "
+                  f"budget {budget:.1f} fps")
+
+        with self._lock:
+            self._decisions[decision.status] += 1
+        return decision
+
+    def release(self, camera_id: str, user_id: Optional[str]):
+        """Free a camera's share when its session ends"""
+        with self._lock:
+            self._cameras.pop(camera_key(user_id, camera_id), None)
+
+    def plan_shedding(self) -> List[Tuple[str, str, float]]:
+        """
+        Cameras to throttle or close, lowest priority first, until the
+        admitted demand fits the capacity again.
+
+        Returns:
+            List of (user_id, camera_id, fps to shed); empty when within capacity
+        """
+        with self._lock:
+            if self._capacity_fps is None:
+                return []
+            excess = self._demand() - self._capacity_fps * self.headroom
+            if excess <= 0:
+                return []
+
+            plan = []
+            # Lowest priority first; among equals, the most recently admitted
+            order = sorted(self._cameras.items(), key=lambda item: (item[1].priority, -item[1].admitted_at))
+            for (user_id, camera_id), camera in order:
+                if excess <= 0:
+                    break
+                shed = min(camera.fps, excess)
+                plan.append((user_id, camera_id, round(shed, 2)))
+                excess -= shed
+            self._shed_planned += len(plan)
+            return plan
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Capacity, demand and decision counters"""
+        with self._lock:
+            demand = self._demand()
+            return {
+                'capacity_fps': round(self._capacity_fps, 1) if self._capacity_fps is not None else None,
+                'admit_budget_fps': round(self._capacity_fps * self.headroom, 1)
+                if self._capacity_fps is not None else None,
+                'demand_fps': round(demand, 1),
+                'cameras': len(self._cameras),
+                'decisions': dict(self._decisions),
+                'shed_planned': self._shed_planned,
+            }
+
+    def _demand(self) -> float:
+        """Admitted frames/s (caller holds the lock)"""
+        return sum(camera.fps for camera in self._cameras.values())
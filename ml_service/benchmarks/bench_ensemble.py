@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Benchmark: Separate vs Fused PRIMARY + VETO
+================================================================================
+
+Milliseconds per Smart Veto evaluation for:
+
+- separate:   each model prepares its own input tensor, run one after the other
+- fused-seq:  shared input preparation, models run one after the other
+- fused-conc: shared input preparation, models run concurrently
+
+Windows are random (C, T, V, M) arrays; timing does not depend on content.
+The scores of the fused runs are compared to the separate run as a parity
+check (they should be identical).
+
+Usage:
+    python3 benchmarks/bench_ensemble.py --loader smart_veto_final:load_model \\
+        --windows 200 --batch 1 --threads 2
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from bench_utils import print_table, resolve_callable, score_windows
+from user_config_manager import DEFAULT_CONFIG
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--loader', required=True,
+                        help='module:function returning a loaded model for a model name')
+    parser.add_argument('--primary', default=DEFAULT_CONFIG['primary_model'])
+    parser.add_argument('--veto', default=DEFAULT_CONFIG['veto_model'])
+    parser.add_argument('--windows', type=int, default=200)
+    parser.add_argument('--batch', type=int, default=1, help='Windows per evaluation')
+    parser.add_argument('--threads', type=int, default=None, help='torch intra-op threads')
+    parser.add_argument('--device', default='cpu')
+    args = parser.parse_args()
+
+    import torch
+
+    from ensemble_runner import SmartVetoEnsemble
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    load_model = resolve_callable(args.loader)
+    primary_model = load_model(args.primary)
+    veto_model = load_model(args.veto)
+
+    rng = np.random.default_rng(0)
+    windows = [rng.standard_normal((3, 32, 17, 2), dtype=np.float32) for _ in range(args.windows)]
+    batches = [windows[i:i + args.batch] for i in range(0, len(windows), args.batch)]
+
+    # Warm-up
+    score_windows(primary_model, windows[:args.batch], device=args.device)
+    score_windows(veto_model, windows[:args.batch], device=args.device)
+
+    start = time.perf_counter()
+    reference = []
+    for batch in batches:
+        primary = score_windows(primary_model, batch, batch_size=len(batch), device=args.device)
+        veto = score_windows(veto_model, batch, batch_size=len(batch), device=args.device)
+        reference.extend(zip(primary, veto))
+    separate_ms = (time.perf_counter() - start) * 1000 / len(batches)
+
+    rows = [['separate', round(separate_ms, 2), round(separate_ms / args.batch, 2), 1.0, 0.0]]
+    for name, concurrent in (('fused-seq', False), ('fused-conc', True)):
+        ensemble = SmartVetoEnsemble(primary_model, veto_model, device=args.device, concurrent=concurrent)
+        ensemble.run(batches[0])
+        start = time.perf_counter()
+        scores = []
+        for batch in batches:
+            primary, veto, _ = ensemble.run(batch)
+            scores.extend(zip(primary, veto))
+        elapsed_ms = (time.perf_counter() - start) * 1000 / len(batches)
+        delta = max(max(abs(p - rp), abs(v - rv)) for (p, v), (rp, rv) in zip(scores, reference))
+        rows.append([name, round(elapsed_ms, 2), round(elapsed_ms / args.batch, 2),
+                     round(separate_ms / elapsed_ms, 2), round(delta, 4)])
+        print(f"{name}: mean breakdown {ensemble.get_stats()['mean_ms']}")
+        ensemble.close()
+
+    print(f"\n{args.primary} + {args.veto}, {args.windows} windows, batch {args.batch}, "
+          f"{torch.get_num_threads()} torch threads, {args.device}\n")
+    print_table(['mode', 'ms/eval', 'ms/window', 'speedup', 'max score delta'], rows)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
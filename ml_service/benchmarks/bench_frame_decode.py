@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Benchmark: Frame Decode Paths
+================================================================================
+
+Micro-benchmark of JPEG decoding over a corpus of recorded frames (*.jpg).
+
+Compared per target size:
+- baseline: base64.b64decode / raw bytes + cv2.imdecode at native resolution
+            + cv2.resize to the target (what YOLO preprocessing pays for)
+- scaled:   FrameDecoder (header probe + DCT-domain scaled decode)
+
+Both the base64 (JSON `frames` array) and binary (/ws/live) inputs are
+measured.
+
+Usage:
+    python3 benchmarks/bench_frame_decode.py --corpus recordings/frames --sizes 640,320
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import base64
+import glob
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from bench_utils import print_table
+from frame_decoder import FrameDecoder
+
+
+def baseline_decode(data: bytes, target: int) -> np.ndarray:
+    """Full-resolution decode followed by a resize to the target long side"""
+    image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    height, width = image.shape[:2]
+    ratio = target / float(max(height, width))
+    if ratio < 1:
+        image = cv2.resize(image, (int(width * ratio), int(height * ratio)), interpolation=cv2.INTER_AREA)
+    return image
+
+
+def time_per_frame(fn, items, repeats: int) -> float:
+    """Mean ms per item"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - start) * 1000 / (repeats * len(items))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', required=True, help='Directory of recorded JPEG frames')
+    parser.add_argument('--sizes', default='640,320', help='Comma-separated YOLO input sizes')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--limit', type=int, default=500)
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.corpus, '*.jpg')))[:args.limit]
+    if not paths:
+        print(f"No *.jpg frames in {args.corpus}")
+        return 1
+
+    raw = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            raw.append(f.read())
+    encoded = [base64.b64encode(data).decode('ascii') for data in raw]
+    avg_kb = sum(len(d) for d in raw) / len(raw) / 1024
+    first = cv2.imdecode(np.frombuffer(raw[0], dtype=np.uint8), cv2.IMREAD_COLOR)
+    print(f"{len(raw)} frames, {first.shape[1]}x{first.shape[0]}, avg {avg_kb:.1f} KB")
+
+    rows = []
+    for size in [int(s) for s in args.sizes.split(',')]:
+        decoder = FrameDecoder(target_size=size)
+        base_bin = time_per_frame(lambda d: baseline_decode(d, size), raw, args.repeats)
+        fast_bin = time_per_frame(decoder.decode, raw, args.repeats)
+        base_b64 = time_per_frame(lambda s: baseline_decode(base64.b64decode(s), size), encoded, args.repeats)
+        fast_b64 = time_per_frame(decoder.decode_base64, encoded, args.repeats)
+        scale = decoder.decode(raw[0]).scale
+        rows.append(['binary', size, decoder.backend, scale, base_bin, fast_bin, base_bin / fast_bin])
+        rows.append(['base64', size, decoder.backend, scale, base_b64, fast_b64, base_b64 / fast_b64])
+
+    print_table(['input', 'imgsz', 'backend', 'scale', 'baseline ms', 'scaled ms', 'speedup'], rows)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
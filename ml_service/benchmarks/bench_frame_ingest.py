@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Benchmark: Frame Ingest (JSON/base64 vs Binary Protocol)
+================================================================================
+
+Measures server-side ingest throughput for `analyze_frames` messages:
+
+- json:   json.loads + base64 decode of every frame (legacy path)
+- binary: frame_protocol.parse_binary_message (memoryviews, no copies)
+
+Throughput is reported both in wire MB/s (bytes received) and in JPEG
+payload MB/s, plus the wire size overhead of each format.
+
+Usage:
+    python3 benchmarks/bench_frame_ingest.py --corpus recordings/frames --frames-per-message 1
+    python3 benchmarks/bench_frame_ingest.py --synthetic-kb 60     # no corpus needed
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import base64
+import glob
+import json
+import os
+import sys
+import time
+
+from bench_utils import print_table
+from frame_protocol import encode_binary_message, parse_binary_message, parse_json_message
+
+
+def build_messages(payloads, per_message):
+    """JSON and binary messages carrying the same frames"""
+    json_messages = []
+    binary_messages = []
+    for start in range(0, len(payloads), per_message):
+        frames = payloads[start:start + per_message]
+        json_messages.append(json.dumps({
+            'type': 'analyze_frames',
+            'frames': [base64.b64encode(f).decode('ascii') for f in frames],
+            'cameraId': 'camera-01',
+            'userId': '00000000-0000-0000-0000-000000000000',
+            'metadata': {'timestamp': 1760000000000, 'frameCount': len(frames)},
+        }))
+        binary_messages.append(encode_binary_message(
+            frames, 'camera-01', '00000000-0000-0000-0000-000000000000', 1760000000000.0))
+    return json_messages, binary_messages
+
+
+def measure(parse, messages, repeats):
+    """Seconds to parse all messages `repeats` times"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for message in messages:
+            parse(message)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default='', help='Directory of recorded JPEG frames')
+    parser.add_argument('--synthetic-kb', type=int, default=60, help='Payload size without a corpus')
+    parser.add_argument('--frames-per-message', type=int, default=1)
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.corpus:
+        payloads = []
+        for path in sorted(glob.glob(os.path.join(args.corpus, '*.jpg')))[:args.count]:
+            with open(path, 'rb') as f:
+                payloads.append(f.read())
+        if not payloads:
+            print(f"No *.jpg frames in {args.corpus}")
+            return 1
+    else:
+        payloads = [b'\xff\xd8' + os.urandom(args.synthetic_kb * 1024) for _ in range(args.count)]
+
+    json_messages, binary_messages = build_messages(payloads, args.frames_per_message)
+    payload_bytes = sum(len(p) for p in payloads) * args.repeats
+    json_bytes = sum(len(m) for m in json_messages) * args.repeats
+    binary_bytes = sum(len(m) for m in binary_messages) * args.repeats
+
+    json_s = measure(parse_json_message, json_messages, args.repeats)
+    binary_s = measure(parse_binary_message, binary_messages, args.repeats)
+    frames = len(payloads) * args.repeats
+
+    mb = 1024 * 1024
+    rows = [
+        ['json', json_bytes / payload_bytes, json_bytes / mb / json_s, payload_bytes / mb / json_s,
+         frames / json_s],
+        ['binary', binary_bytes / payload_bytes, binary_bytes / mb / binary_s, payload_bytes / mb / binary_s,
+         frames / binary_s],
+    ]
+    print(f"{len(payloads)} frames, avg {sum(len(p) for p in payloads) / len(payloads) / 1024:.1f} KB, "
+          f"{args.frames_per_message} frame(s)/message")
+    print_table(['format', 'wire/payload', 'wire MB/s', 'payload MB/s', 'frames/s'], rows)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
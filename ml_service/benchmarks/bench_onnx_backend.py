@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Benchmark: Eager PyTorch vs ONNX fp32 vs ONNX int8 on CPU
+================================================================================
+
+Milliseconds per skeleton window for each Smart Veto model on the three
+inference backends (see onnx_backend.py), at batch sizes 1 (one camera)
+and 16 (GCNBatcher under load). Export the graphs first:
+
+    python3 onnx_backend.py --loader smart_veto_final:load_model --int8
+
+Windows are random (C, T, V, M) arrays; timing does not depend on content.
+Use benchmarks/eval_onnx_parity.py for accuracy.
+
+Usage:
+    python3 benchmarks/bench_onnx_backend.py --loader smart_veto_final:load_model \\
+        --batch-sizes 1 16 --iterations 50 --threads 4
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from bench_utils import print_table, resolve_callable
+from gcn_batcher import stack_windows
+from onnx_backend import BACKEND_ONNX, BACKEND_ONNX_INT8, BACKEND_TORCH, OnnxModel, onnx_path
+from user_config_manager import DEFAULT_CONFIG, ONNX_MODEL_DIR
+
+
+def time_model(model, batch, iterations: int) -> float:
+    """Mean ms per forward pass after one warm-up call"""
+    import torch
+
+    with torch.inference_mode():
+        model(batch)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            model(batch)
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--loader', required=True,
+                        help='module:function returning a loaded model for a model name')
+    parser.add_argument('--models', nargs='+',
+                        default=[DEFAULT_CONFIG['primary_model'], DEFAULT_CONFIG['veto_model']])
+    parser.add_argument('--batch-sizes', nargs='+', type=int, default=[1, 16])
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--threads', type=int, default=None, help='Intra-op threads for both runtimes')
+    parser.add_argument('--onnx-dir', default=ONNX_MODEL_DIR)
+    args = parser.parse_args()
+
+    import torch
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    load_model = resolve_callable(args.loader)
+    rng = np.random.default_rng(0)
+
+    rows = []
+    for name in args.models:
+        backends = {BACKEND_TORCH: load_model(name)}
+        for backend in (BACKEND_ONNX, BACKEND_ONNX_INT8):
+            path = onnx_path(name, int8=backend == BACKEND_ONNX_INT8, out_dir=args.onnx_dir)
+            if os.path.exists(path):
+                backends[backend] = OnnxModel(path, intra_op_threads=args.threads)
+            else:
+                print(f"{name}: {path} not found, {backend} skipped")
+
+        for batch_size in args.batch_sizes:
+            windows = [rng.standard_normal((3, 32, 17, 2), dtype=np.float32) for _ in range(batch_size)]
+            batch = torch.from_numpy(stack_windows(windows))
+            eager_ms = None
+            for backend, model in backends.items():
+                ms = time_model(model, batch, args.iterations)
+                eager_ms = ms if backend == BACKEND_TORCH else eager_ms
+                rows.append([name, backend, batch_size, ms / batch_size, eager_ms / ms])
+
+    print(f"\nCPU, {torch.get_num_threads()} torch threads, {args.iterations} iterations\n")
+    print_table(['model', 'backend', 'batch', 'ms/window', 'speedup vs eager'], rows)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
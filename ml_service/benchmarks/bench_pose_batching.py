@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Benchmark: Batched YOLO Pose vs Per-Frame Calls
+================================================================================
+
+Measures pose extraction throughput (frames/s) against the number of active
+cameras on CPU, comparing:
+
+- per-frame: each camera thread calls yolo_model(frame) (shared model, one
+  call at a time, as in smart_veto_final.py)
+- batched:   each camera thread submits to PoseBatcher
+
+Frames come from a recorded clip (--video) or from random noise when no clip
+is given (useful for raw compute numbers only; nobody is detected).
+
+Usage:
+    python3 benchmarks/bench_pose_batching.py \\
+        --model /app/nexaravision/models/yolo26m-pose.pt \\
+        --video recordings/crowd.mp4 --cameras 1,2,4,8,16
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import Callable, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pose_batcher import PoseBatcher  # noqa: E402
+from pose_utils import select_skeletons_from_result  # noqa: E402
+
+
+def load_frames(video: str, count: int, width: int, height: int) -> List[np.ndarray]:
+    """Read up to `count` frames from a clip, or generate noise frames"""
+    if not video:
+        rng = np.random.default_rng(0)
+        return [rng.integers(0, 255, (height, width, 3), dtype=np.uint8) for _ in range(count)]
+
+    import cv2
+
+    cap = cv2.VideoCapture(video)
+    frames = []
+    while len(frames) < count:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(cv2.resize(frame, (width, height)))
+    cap.release()
+    if not frames:
+        raise SystemExit(f"No frames read from {video}")
+    return frames
+
+
+def run_cameras(num_cameras: int, frames: List[np.ndarray], frames_per_camera: int,
+                process: Callable[[str, np.ndarray], object]) -> float:
+    """Run camera threads and return aggregate frames/s"""
+    def camera(index: int):
+        camera_id = f"cam-{index}"
+        for i in range(frames_per_camera):
+            process(camera_id, frames[(index + i) % len(frames)])
+
+    threads = [threading.Thread(target=camera, args=(i,)) for i in range(num_cameras)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return num_cameras * frames_per_camera / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model', default='/app/nexaravision/models/yolo26m-pose.pt')
+    parser.add_argument('--video', default='', help='Recorded clip used as frame source')
+    parser.add_argument('--cameras', default='1,2,4,8', help='Comma-separated camera counts')
+    parser.add_argument('--frames-per-camera', type=int, default=40)
+    parser.add_argument('--max-batch', type=int, default=8)
+    parser.add_argument('--max-delay-ms', type=float, default=15.0)
+    parser.add_argument('--imgsz', type=int, default=640)
+    parser.add_argument('--width', type=int, default=640)
+    parser.add_argument('--height', type=int, default=480)
+    args = parser.parse_args()
+
+    from ultralytics import YOLO
+
+    yolo_model = YOLO(args.model)
+    frames = load_frames(args.video, 64, args.width, args.height)
+
+    # Warm up
+    for frame in frames[:3]:
+        yolo_model(frame, imgsz=args.imgsz, verbose=False)
+
+    model_lock = threading.Lock()
+
+    def per_frame(camera_id: str, frame: np.ndarray):
+        with model_lock:
+            results = yolo_model(frame, imgsz=args.imgsz, verbose=False)
+        return select_skeletons_from_result(results[0] if results else None)
+
+    print(f"{'cameras':>8} {'per-frame fps':>14} {'batched fps':>12} {'speedup':>8} "
+          f"{'avg batch':>10} {'p95 queue ms':>13}")
+
+    for num_cameras in [int(c) for c in args.cameras.split(',')]:
+        baseline = run_cameras(num_cameras, frames, args.frames_per_camera, per_frame)
+
+        batcher = PoseBatcher(yolo_model, max_batch_size=args.max_batch,
+                              max_delay_ms=args.max_delay_ms, default_imgsz=args.imgsz)
+        batcher.start()
+        batched = run_cameras(num_cameras, frames, args.frames_per_camera,
+                              lambda cam, frame: batcher.extract(cam, frame))
+        stats = batcher.get_stats()
+        batcher.stop()
+
+        print(f"{num_cameras:>8} {baseline:>14.1f} {batched:>12.1f} {batched / baseline:>7.2f}x "
+              f"{stats['avg_batch_size']:>10.2f} {stats['queue_delay_ms']['p95']:>13.1f}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Benchmark: Detection Response Encoding (JSON vs Compact)
+================================================================================
+
+Bytes per message and serialize time for detection responses with 0-10
+visualized skeletons:
+
+- json:    tolist() on keypoint arrays + json.dumps (current responses)
+- compact: result_codec.encode_compact (binary header + int16 keypoints)
+
+Usage:
+    python3 benchmarks/bench_result_encoding.py --people 0,2,5,10
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from bench_utils import print_table
+from result_codec import encode_compact, encode_json
+
+
+def make_response(people: int, rng: np.random.Generator) -> dict:
+    """Typical /ws/live response with `people` visualized skeletons"""
+    kpts = rng.random((people, 17, 3), dtype=np.float32) * np.array([640, 480, 1], dtype=np.float32)
+    return {
+        'type': 'result',
+        'buffer': 32,
+        'inference_ms': 25.3,
+        'primary': 45.2,
+        'veto': None,
+        'veto_skipped': True,
+        'result': 'SAFE',
+        'violence_score': 0.452,
+        'violence': False,
+        'num_detected': people,
+        'all_skeletons': kpts,
+        'skeletons': kpts[:2],
+        'stats': {'violence_alerts': 0, 'vetoed': 5, 'safe': 1000},
+        'inference_rate': {'stride': 1, 'target_wps': None, 'input_fps': 10.0,
+                           'inference_wps': 10.0, 'inference_ratio': 1.0},
+    }
+
+
+def time_us(fn, response, repeats: int) -> float:
+    """Mean µs per call"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn(response)
+    return (time.perf_counter() - start) * 1e6 / repeats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--people', default='0,1,2,5,10', help='Comma-separated skeleton counts')
+    parser.add_argument('--repeats', type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    rows = []
+    for people in [int(p) for p in args.people.split(',')]:
+        response = make_response(people, rng)
+        json_bytes = len(encode_json(response).encode('utf-8'))
+        compact_bytes = len(encode_compact(response))
+        json_us = time_us(encode_json, response, args.repeats)
+        compact_us = time_us(encode_compact, response, args.repeats)
+        rows.append([people, json_bytes, compact_bytes, json_bytes / compact_bytes,
+                     json_us, compact_us, json_us / compact_us])
+
+    print_table(['people', 'json B', 'compact B', 'size x', 'json µs', 'compact µs', 'speed x'], rows)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Benchmark: ROI-Cropped Pose vs Full-Frame Pose
+================================================================================
+
+Compares full-frame YOLO pose on every frame against RoiPoseRunner (periodic
+full frame + crops around tracked people) on recorded clips. Run it on at
+least one crowd clip and one sparse clip: crops pay off when few people cover
+a small part of the frame and fall back to full frame in crowds.
+
+Reported per clip:
+- ms per frame and speedup
+- people found per frame relative to full frame (recall proxy)
+- mean keypoint offset (px) of matched people versus full frame
+- share of frames served from crops
+
+Usage:
+    python3 benchmarks/bench_roi_pose.py \\
+        --clips recordings/crowd.mp4 recordings/sparse.mp4 --interval 10
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from bench_utils import DEFAULT_YOLO_PATH, iter_video_frames, print_table
+from pose_utils import KEYPOINT_CONF, calc_iou, select_skeletons_from_result
+from roi_pose import RoiPoseRunner
+
+
+def keypoint_offset(full_pose, roi_pose) -> float:
+    """Mean visible-joint distance between people matched by IoU"""
+    offsets = []
+    for box, skeleton in zip(roi_pose.boxes, roi_pose.kpts_visual):
+        ious = [calc_iou(box, other) for other in full_pose.boxes]
+        if not ious or max(ious) < 0.5:
+            continue
+        ref = full_pose.kpts_visual[int(np.argmax(ious))]
+        both = (ref[:, 2] > KEYPOINT_CONF) & (skeleton[:, 2] > KEYPOINT_CONF)
+        if both.any():
+            offsets.append(float(np.linalg.norm(ref[both, :2] - skeleton[both, :2], axis=1).mean()))
+    return float(np.mean(offsets)) if offsets else 0.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clips', nargs='+', required=True, help='Recorded video clips')
+    parser.add_argument('--yolo', default=DEFAULT_YOLO_PATH)
+    parser.add_argument('--interval', type=int, default=10, help='Full-frame refresh interval')
+    parser.add_argument('--crop-imgsz', type=int, default=320)
+    parser.add_argument('--imgsz', type=int, default=640)
+    parser.add_argument('--max-frames', type=int, default=300)
+    args = parser.parse_args()
+
+    from ultralytics import YOLO
+
+    yolo_model = YOLO(args.yolo)
+
+    rows = []
+    for clip in args.clips:
+        frames = list(iter_video_frames(clip, args.max_frames))
+        if not frames:
+            print(f"{clip}: no frames, skipped")
+            continue
+        yolo_model(frames[0], imgsz=args.imgsz, verbose=False)  # warm up
+
+        start = time.perf_counter()
+        full_poses = []
+        for frame in frames:
+            results = yolo_model(frame, imgsz=args.imgsz, verbose=False)
+            full_poses.append(select_skeletons_from_result(results[0] if results else None))
+        full_ms = (time.perf_counter() - start) * 1000 / len(frames)
+
+        runner = RoiPoseRunner(yolo_model, full_frame_interval=args.interval,
+                               crop_imgsz=args.crop_imgsz, full_imgsz=args.imgsz)
+        start = time.perf_counter()
+        roi_poses = [runner.extract(clip, frame) for frame in frames]
+        roi_ms = (time.perf_counter() - start) * 1000 / len(frames)
+
+        full_people = sum(p.num_valid for p in full_poses)
+        roi_people = sum(p.num_valid for p in roi_poses)
+        offsets = [keypoint_offset(f, r) for f, r in zip(full_poses, roi_poses)]
+        stats = runner.get_camera_stats(clip)
+
+        rows.append([
+            clip,
+            len(frames),
+            full_people / len(frames),
+            full_ms,
+            roi_ms,
+            full_ms / roi_ms if roi_ms else 0.0,
+            roi_people / full_people if full_people else 1.0,
+            float(np.mean(offsets)),
+            stats['roi_frames'] / len(frames),
+            stats['fallbacks'],
+        ])
+
+    print_table(
+        ['clip', 'frames', 'people/frame', 'full ms', 'roi ms', 'speedup',
+         'recall', 'kpt offset px', 'roi share', 'fallbacks'],
+        rows,
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
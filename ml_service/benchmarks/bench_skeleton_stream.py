@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Benchmark: Skeleton Stream Bandwidth (JSON vs Full int16 vs Delta)
+================================================================================
+
+Downstream bytes per camera for the visualized skeletons:
+
+- json:  `all_skeletons` as nested float lists (current responses)
+- full:  result_codec int16 skeleton block every frame
+- delta: skeleton_stream.SkeletonDeltaEncoder (per-track deltas + keyframes)
+
+Skeletons are either simulated (people walking with keypoint jitter) or
+taken from a video with a YOLO pose model (--video, --yolo).
+
+Usage:
+    python3 benchmarks/bench_skeleton_stream.py --people 1,3,10 --fps 10
+    python3 benchmarks/bench_skeleton_stream.py --video clip.mp4 --yolo yolo11m-pose.pt
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from bench_utils import iter_video_frames, print_table
+from result_codec import BLOCK_HEADER, quantize_skeletons
+from skeleton_stream import SkeletonDeltaDecoder, SkeletonDeltaEncoder
+
+
+def simulate(people: int, frames: int, jitter_px: float, seed: int = 0):
+    """Yield (P, 17, 3) keypoints for people walking across a 640x480 frame"""
+    rng = np.random.default_rng(seed)
+    pose = rng.random((people, 17, 2)).astype(np.float32) * [60, 160]
+    origin = rng.random((people, 1, 2)).astype(np.float32) * [560, 300]
+    velocity = rng.normal(0, 2.0, (people, 1, 2)).astype(np.float32)
+    conf = rng.uniform(0.5, 1.0, (people, 17, 1)).astype(np.float32)
+    for _ in range(frames):
+        origin += velocity
+        xy = origin + pose + rng.normal(0, jitter_px, pose.shape).astype(np.float32)
+        conf = np.clip(conf + rng.normal(0, 0.01, conf.shape).astype(np.float32), 0, 1)
+        yield np.concatenate([xy, conf], axis=2)
+
+
+def from_video(video: str, yolo_path: str, max_frames: int):
+    """Yield kpts_visual from YOLO pose on a video"""
+    from ultralytics import YOLO
+    from pose_utils import select_skeletons_from_result
+
+    model = YOLO(yolo_path)
+    for frame in iter_video_frames(video, max_frames=max_frames):
+        pose = select_skeletons_from_result(model(frame, verbose=False)[0])
+        yield np.asarray(pose.kpts_visual, dtype=np.float32).reshape(-1, 17, 3)
+
+
+def measure(stream):
+    """Mean bytes per frame for each encoding"""
+    encoder = SkeletonDeltaEncoder()
+    decoder = SkeletonDeltaDecoder()
+    totals = {'json': 0, 'full': 0, 'delta': 0}
+    frames = 0
+    for skeletons in stream:
+        totals['json'] += len(json.dumps({'all_skeletons': skeletons.tolist()}))
+        totals['full'] += BLOCK_HEADER.size + quantize_skeletons(skeletons).nbytes
+        message = encoder.encode(skeletons)
+        decoder.decode(message)
+        totals['delta'] += len(message)
+        frames += 1
+    return {k: v / max(frames, 1) for k, v in totals.items()}, encoder.get_stats()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--people', default='1,3,10', help='Simulated people counts')
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--jitter', type=float, default=0.7, help='Keypoint jitter (px)')
+    parser.add_argument('--fps', type=float, default=10.0, help='Frames per second per camera')
+    parser.add_argument('--video', default='', help='Measure on YOLO skeletons from this video')
+    parser.add_argument('--yolo', default='yolo11m-pose.pt')
+    args = parser.parse_args()
+
+    if args.video:
+        cases = [('video', from_video(args.video, args.yolo, args.frames))]
+    else:
+        cases = [(int(p), simulate(int(p), args.frames, args.jitter)) for p in args.people.split(',')]
+
+    rows = []
+    for label, stream in cases:
+        per_frame, stats = measure(stream)
+        kbps = {k: v * args.fps * 8 / 1000 for k, v in per_frame.items()}
+        rows.append([label, per_frame['json'], per_frame['full'], per_frame['delta'],
+                     kbps['json'], kbps['delta'], per_frame['json'] / per_frame['delta'], stats['keyframes']])
+
+    print_table(['people', 'json B', 'full B', 'delta B', 'json kbit/s', 'delta kbit/s', 'vs json', 'keyframes'], rows)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
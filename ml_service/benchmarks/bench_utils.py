@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Shared helpers for the ml_service benchmarks and offline evaluations
+================================================================================
+
+- Recorded clip loading (OpenCV)
+- Resolving `module:function` loaders passed on the command line
+- Scoring skeleton windows with loaded GCN models
+- Small table printing helper
+
+The GCN architectures are defined by the production server, so evaluations
+take a `--loader module:function` argument: a callable that receives a model
+name from MODEL_PATHS and returns a loaded torch.nn.Module in eval mode.
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import importlib
+import os
+import sys
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+ML_SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ML_SERVICE_DIR not in sys.path:
+    sys.path.insert(0, ML_SERVICE_DIR)
+
+DEFAULT_YOLO_PATH = '/app/nexaravision/models/yolo26m-pose.pt'
+
+
+def iter_video_frames(
+    path: str,
+    max_frames: Optional[int] = None,
+    size: Optional[Tuple[int, int]] = None,
+) -> Iterator[np.ndarray]:
+    """
+    Yield decoded BGR frames from a recorded clip.
+
+    Args:
+        path: Video file path
+        max_frames: Stop after this many frames
+        size: Optional (width, height) to resize to
+    """
+    import cv2
+
+    cap = cv2.VideoCapture(path)
+    count = 0
+    try:
+        while max_frames is None or count < max_frames:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            if size is not None:
+                frame = cv2.resize(frame, size)
+            count += 1
+            yield frame
+    finally:
+        cap.release()
+
+
+def resolve_callable(spec: str) -> Callable[..., Any]:
+    """Import `package.module:attribute` and return the attribute"""
+    module_name, _, attr = spec.partition(':')
+    if not module_name or not attr:
+        raise SystemExit(f"Expected module:function, got {spec!r}")
+    module = importlib.import_module(module_name)
+    return getattr(module, attr)
+
+
+def score_windows(model: Any, windows: Sequence[np.ndarray], batch_size: int = 32,
+                  device: str = 'cpu') -> List[float]:
+    """
+    Violence probabilities (0-100) for (C, T, V, M) windows.
+
+    Args:
+        model: Loaded torch.nn.Module
+        windows: Skeleton windows
+        batch_size: Windows per forward pass
+        device: Torch device
+    """
+    import torch
+
+    from gcn_batcher import VIOLENCE_CLASS, stack_windows
+
+    scores: List[float] = []
+    with torch.inference_mode():
+        for start in range(0, len(windows), batch_size):
+            batch = torch.from_numpy(stack_windows(list(windows[start:start + batch_size]))).to(device)
+            probs = torch.softmax(model(batch), dim=1)[:, VIOLENCE_CLASS]
+            scores.extend((probs.float().cpu().numpy() * 100).tolist())
+    return scores
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]):
+    """Print a fixed-width table"""
+    cells = [[str(h) for h in headers]] + [
+        [f"{v:.2f}" if isinstance(v, float) else str(v) for v in row] for row in rows
+    ]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for index, row in enumerate(cells):
+        print('  '.join(value.rjust(width) for value, width in zip(row, widths)))
+        if index == 0:
+            print('  '.join('-' * width for width in widths))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Benchmark: Inference Worker Scaling
+================================================================================
+
+Frames/s through WorkerSupervisor with 1..N worker processes, using a
+CPU-bound handler that holds the GIL (Python-level keypoint post-processing
+on a decoded frame) or a real handler factory.
+
+Usage:
+    python3 benchmarks/bench_worker_scaling.py --workers 1,2,4 --cameras 8
+    python3 benchmarks/bench_worker_scaling.py --factory live_worker:make_handler
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from bench_utils import print_table
+from inference_workers import WorkerSupervisor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _spin(iterations: int) -> int:
+    total = 0
+    for i in range(iterations):
+        total += i * i % 7
+    return total
+
+
+def calibrate(work_ms: float) -> int:
+    """Loop iterations taking ~work_ms on one core (measured in the parent)"""
+    start = time.perf_counter()
+    _spin(200000)
+    return int(200000 * work_ms / ((time.perf_counter() - start) * 1000))
+
+
+def make_cpu_handler(iterations: int = 100000):
+    """Handler doing a fixed amount of GIL-holding CPU work per frame"""
+    def handler(camera_id, frame, meta):
+        checksum = int(frame[::64, ::64].sum())
+        return {'checksum': checksum, 'work': _spin(iterations)}
+    return handler
+
+
+def run(num_workers: int, factory: str, frames: int, cameras: int, shape, kwargs) -> float:
+    """Frames per second with num_workers processes"""
+    supervisor = WorkerSupervisor(factory, num_workers=num_workers, slot_bytes=int(np.prod(shape)),
+                                  factory_kwargs=kwargs)
+    supervisor.start()
+    frame = np.random.default_rng(0).integers(0, 255, shape, dtype=np.uint8)
+
+    done = 0
+    sent = 0
+    start = time.perf_counter()
+    while done < frames:
+        while sent < frames and supervisor.submit(f"camera-{sent % cameras}", frame):
+            sent += 1
+        for _ in supervisor.poll_results(timeout=0.01):
+            done += 1
+    elapsed = time.perf_counter() - start
+    supervisor.stop()
+    return frames / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', default='1,2,4')
+    parser.add_argument('--cameras', type=int, default=8)
+    parser.add_argument('--frames', type=int, default=400)
+    parser.add_argument('--work-ms', type=float, default=10.0)
+    parser.add_argument('--factory', default='bench_worker_scaling:make_cpu_handler')
+    args = parser.parse_args()
+
+    if BENCH_DIR not in sys.path:
+        sys.path.insert(0, BENCH_DIR)
+
+    shape = (480, 640, 3)
+    kwargs = {'iterations': calibrate(args.work_ms)} if args.factory.endswith(':make_cpu_handler') else {}
+    rows = []
+    base = None
+    for n in [int(w) for w in args.workers.split(',')]:
+        fps = run(n, args.factory, args.frames, args.cameras, shape, kwargs)
+        base = base or fps
+        rows.append([n, fps, fps / base])
+    print(f"cpu cores: {os.cpu_count()}, frame {shape}, {args.cameras} cameras")
+    print_table(['workers', 'frames/s', 'speedup'], rows)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Evaluation: Keyframe Pose + Interpolation vs Full-Rate Pose
+================================================================================
+
+Quantifies the accuracy/throughput trade-off of keyframe pose estimation
+(keyframe_pose.py) on recorded clips.
+
+For each clip YOLO pose runs on every frame once. The full-rate skeleton
+sequence and the keyframe/interpolated sequence are then cut into the same
+32-frame windows and scored by the PRIMARY and VETO models. Reported per clip:
+
+- YOLO calls in keyframe mode as a fraction of full rate
+- Mean / max absolute PRIMARY and VETO score difference (percentage points)
+- Agreement of the Smart Veto decision (SAFE / VETOED / VIOLENCE)
+
+Usage:
+    python3 benchmarks/eval_keyframe_pose.py \\
+        --loader smart_veto_final:load_model \\
+        --clips recordings/violence.mp4 recordings/crowd.mp4 --max-k 4
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from bench_utils import (DEFAULT_YOLO_PATH, iter_video_frames, print_table,
+                         resolve_callable, score_windows)
+from cascade import smart_veto_decision
+from keyframe_pose import KeyframePoseEstimator
+from pose_utils import select_skeletons_from_result
+from skeleton_buffer import SkeletonRingBuffer
+from user_config_manager import DEFAULT_CONFIG
+
+
+def collect_windows(frames_kpts: List[np.ndarray], stride: int) -> Dict[int, np.ndarray]:
+    """Windows ending at every `stride`-th frame once the buffer is full"""
+    buffer = SkeletonRingBuffer()
+    windows = {}
+    for index, kpts in enumerate(frames_kpts):
+        buffer.append(kpts)
+        if buffer.is_full() and index % stride == 0:
+            windows[index] = buffer.window()
+    return windows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clips', nargs='+', required=True, help='Recorded video clips')
+    parser.add_argument('--loader', required=True,
+                        help='module:function returning a loaded model for a model name')
+    parser.add_argument('--yolo', default=DEFAULT_YOLO_PATH)
+    parser.add_argument('--primary', default=DEFAULT_CONFIG['primary_model'])
+    parser.add_argument('--veto', default=DEFAULT_CONFIG['veto_model'])
+    parser.add_argument('--primary-threshold', type=float, default=DEFAULT_CONFIG['primary_threshold'])
+    parser.add_argument('--veto-threshold', type=float, default=DEFAULT_CONFIG['veto_threshold'])
+    parser.add_argument('--min-k', type=int, default=1)
+    parser.add_argument('--max-k', type=int, default=4)
+    parser.add_argument('--stride', type=int, default=4, help='Score every N-th window')
+    parser.add_argument('--max-frames', type=int, default=None)
+    parser.add_argument('--device', default='cpu')
+    args = parser.parse_args()
+
+    from ultralytics import YOLO
+
+    yolo_model = YOLO(args.yolo)
+    load_model = resolve_callable(args.loader)
+    primary_model = load_model(args.primary)
+    veto_model = load_model(args.veto)
+
+    rows = []
+    for clip in args.clips:
+        poses = []
+        pose_ms = []
+        for frame in iter_video_frames(clip, args.max_frames):
+            start = time.perf_counter()
+            results = yolo_model(frame, verbose=False)
+            poses.append(select_skeletons_from_result(results[0] if results else None))
+            pose_ms.append((time.perf_counter() - start) * 1000)
+
+        # Keyframe mode replayed over the same per-frame poses
+        estimator = KeyframePoseEstimator(min_k=args.min_k, max_k=args.max_k)
+        keyframe_kpts: List[np.ndarray] = []
+        for pose in poses:
+            if estimator.on_frame(clip):
+                keyframe_kpts.extend(estimator.add_keyframe(clip, pose))
+
+        full = collect_windows([p.kpts for p in poses], args.stride)
+        keyed = collect_windows(keyframe_kpts, args.stride)
+        indices = sorted(set(full) & set(keyed))
+        if not indices:
+            print(f"{clip}: too short for a {SkeletonRingBuffer().window_size}-frame window, skipped")
+            continue
+
+        full_windows = [full[i] for i in indices]
+        keyed_windows = [keyed[i] for i in indices]
+        p_full = np.array(score_windows(primary_model, full_windows, device=args.device))
+        p_key = np.array(score_windows(primary_model, keyed_windows, device=args.device))
+        v_full = np.array(score_windows(veto_model, full_windows, device=args.device))
+        v_key = np.array(score_windows(veto_model, keyed_windows, device=args.device))
+
+        agree = np.mean([
+            smart_veto_decision(pf, vf, args.primary_threshold, args.veto_threshold)
+            == smart_veto_decision(pk, vk, args.primary_threshold, args.veto_threshold)
+            for pf, vf, pk, vk in zip(p_full, v_full, p_key, v_key)
+        ])
+        stats = estimator.get_stats()
+        rows.append([
+            clip,
+            len(poses),
+            stats['yolo_call_ratio'],
+            float(np.mean(pose_ms)) * stats['yolo_calls'] / 1000,
+            float(np.sum(pose_ms)) / 1000,
+            float(np.mean(np.abs(p_full - p_key))),
+            float(np.max(np.abs(p_full - p_key))),
+            float(np.mean(np.abs(v_full - v_key))),
+            float(np.max(np.abs(v_full - v_key))),
+            float(agree * 100),
+        ])
+
+    print_table(
+        ['clip', 'frames', 'yolo ratio', 'pose s (kf)', 'pose s (full)',
+         'mean dP', 'max dP', 'mean dV', 'max dV', 'decision agree %'],
+        rows,
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
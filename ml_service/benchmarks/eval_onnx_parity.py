@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+Evaluation: ONNX fp32 / int8 Score Parity vs Eager PyTorch
+================================================================================
+
+Scores recorded skeleton windows with the eager PRIMARY and VETO models and
+with their exported ONNX graphs (onnx_backend.py), and reports per model and
+backend:
+
+- Mean / p99 / max absolute score difference (percentage points)
+- Windows whose side of the model's threshold changed (PRIMARY 94, VETO 85)
+- Agreement of the Smart Veto decision (SAFE / VETOED / VIOLENCE)
+
+Windows come from a saved .npy file of shape (N, C, T, V, M), or are
+recorded from clips with YOLO pose (optionally saved with --save for later
+runs). Exits with status 1 if any max delta exceeds --tolerance, or if no
+exported graph was found to compare.
+
+Usage:
+    python3 benchmarks/eval_onnx_parity.py --loader smart_veto_final:load_model \\
+        --clips recordings/violence.mp4 recordings/crowd.mp4 --save windows.npy
+    python3 benchmarks/eval_onnx_parity.py --loader smart_veto_final:load_model \\
+        --windows windows.npy --tolerance 1.0
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import argparse
+import os
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from bench_utils import DEFAULT_YOLO_PATH, iter_video_frames, print_table, resolve_callable, score_windows
+from cascade import smart_veto_decision
+from onnx_backend import BACKEND_ONNX, BACKEND_ONNX_INT8, OnnxModel, onnx_path
+from user_config_manager import DEFAULT_CONFIG, ONNX_MODEL_DIR
+
+
+def record_windows(clips: List[str], yolo_path: str, stride: int,
+                   max_frames: Optional[int] = None) -> np.ndarray:
+    """
+    Skeleton windows from clips, one every `stride` frames once the buffer is full.
+
+    Returns an empty array if no clip fills a window.
+    """
+    from ultralytics import YOLO
+
+    from pose_utils import select_skeletons_from_result
+    from skeleton_buffer import SkeletonRingBuffer
+
+    yolo_model = YOLO(yolo_path)
+    windows = []
+    for clip in clips:
+        buffer = SkeletonRingBuffer()
+        for index, frame in enumerate(iter_video_frames(clip, max_frames)):
+            results = yolo_model(frame, verbose=False)
+            buffer.append(select_skeletons_from_result(results[0] if results else None).kpts)
+            if buffer.is_full() and index % stride == 0:
+                windows.append(buffer.window().copy())
+    return np.stack(windows) if windows else np.empty((0,), dtype=np.float32)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--loader', required=True,
+                        help='module:function returning a loaded model for a model name')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--windows', help='.npy file of (N, C, T, V, M) windows')
+    source.add_argument('--clips', nargs='+', help='Record windows from these clips')
+    parser.add_argument('--save', help='Save recorded windows to this .npy file')
+    parser.add_argument('--yolo', default=DEFAULT_YOLO_PATH)
+    parser.add_argument('--stride', type=int, default=4, help='Record every N-th window')
+    parser.add_argument('--max-frames', type=int, default=None)
+    parser.add_argument('--primary', default=DEFAULT_CONFIG['primary_model'])
+    parser.add_argument('--veto', default=DEFAULT_CONFIG['veto_model'])
+    parser.add_argument('--primary-threshold', type=float, default=DEFAULT_CONFIG['primary_threshold'])
+    parser.add_argument('--veto-threshold', type=float, default=DEFAULT_CONFIG['veto_threshold'])
+    parser.add_argument('--onnx-dir', default=ONNX_MODEL_DIR)
+    parser.add_argument('--tolerance', type=float, default=1.0, help='Max allowed score delta (pp)')
+    args = parser.parse_args()
+
+    if args.windows:
+        windows = np.load(args.windows).astype(np.float32)
+    else:
+        windows = record_windows(args.clips, args.yolo, args.stride, args.max_frames)
+        if args.save:
+            np.save(args.save, windows)
+            print(f"Saved {len(windows)} windows to {args.save}")
+    if not len(windows):
+        print("No windows to score")
+        return 1
+
+    load_model = resolve_callable(args.loader)
+    thresholds = {args.primary: args.primary_threshold, args.veto: args.veto_threshold}
+    scores: Dict[str, Dict[str, np.ndarray]] = {}
+    for name in (args.primary, args.veto):
+        scores[name] = {'eager': np.array(score_windows(load_model(name), windows))}
+        for backend in (BACKEND_ONNX, BACKEND_ONNX_INT8):
+            path = onnx_path(name, int8=backend == BACKEND_ONNX_INT8, out_dir=args.onnx_dir)
+            if os.path.exists(path):
+                scores[name][backend] = np.array(score_windows(OnnxModel(path), windows))
+            else:
+                print(f"{name}: {path} not found, {backend} skipped")
+
+    rows = []
+    worst = 0.0
+    for name, by_backend in scores.items():
+        eager = by_backend['eager']
+        threshold = thresholds[name]
+        for backend, values in by_backend.items():
+            if backend == 'eager':
+                continue
+            delta = np.abs(values - eager)
+            flips = int(np.sum((values >= threshold) != (eager >= threshold)))
+            worst = max(worst, float(delta.max()))
+            rows.append([name, backend, float(delta.mean()), float(np.percentile(delta, 99)),
+                         float(delta.max()), flips])
+
+    if not rows:
+        print("FAIL: no exported ONNX graph found, nothing compared")
+        return 1
+
+    print(f"\n{len(windows)} windows\n")
+    print_table(['model', 'backend', 'mean |d|', 'p99 |d|', 'max |d|', 'threshold flips'], rows)
+
+    print()
+    for backend in (BACKEND_ONNX, BACKEND_ONNX_INT8):
+        if backend in scores[args.primary] and backend in scores[args.veto]:
+            agree = np.mean([
+                smart_veto_decision(p, v, args.primary_threshold, args.veto_threshold)
+                == smart_veto_decision(pe, ve, args.primary_threshold, args.veto_threshold)
+                for p, v, pe, ve in zip(scores[args.primary][backend], scores[args.veto][backend],
+                                        scores[args.primary]['eager'], scores[args.veto]['eager'])
+            ])
+            print(f"Smart Veto decision agreement ({backend}): {agree * 100:.2f}%")
+
+    if worst > args.tolerance:
+        print(f"\nFAIL: max score delta {worst:.3f} pp > tolerance {args.tolerance} pp")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
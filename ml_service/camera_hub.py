@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Camera Hub
+================================================================================
+
+One pipeline per (userId, cameraId), fanned out to every viewer.
+
+When two operators or browser tabs watched the same camera, each connection
+submitted frames and got its own inference run. The hub tracks, per camera,
+which connections publish frames and which subscribe to results.
+
+Cameras are scoped to the user (tenant) that owns them: every dashboard names
+its cells camera-0..N, so tenant B's camera-0 is a different camera from
+tenant A's. The server binds each connection to the user it authenticated
+(`bind_user`, e.g. after verifying the session token); a connection can only
+publish to or subscribe to that user's cameras, and unbound connections are
+refused. The userId a client puts in its messages is never trusted.
+
+- Only one publisher per camera (the first) feeds the pipeline; frames
+  from duplicate streams of the same camera are dropped before decode.
+  If that publisher disconnects, the next one takes over.
+- Results, skeleton overlays and alerts are published once per camera and
+  delivered to every subscriber. Publishers are subscribed automatically;
+  viewers join with {"type": "subscribe", "cameraId": ...} and leave with
+  {"type": "unsubscribe", "cameraId": ...}.
+
+Each subscriber's `send` callable does its own encoding (JSON / compact /
+skeleton deltas, as negotiated on that connection).
+
+Features:
+- Duplicate stream detection and publisher failover
+- Per-tenant camera namespaces with subscribe ownership checks
+- Fan-out to all subscribers, dropping subscribers whose send fails
+- Counters for frames accepted / deduplicated and messages delivered
+- Thread-safe registry; publish works with sync or async send callables
+
+Usage:
+    from camera_hub import CameraHub
+
+    hub = CameraHub()
+
+    # On connect, once the session is authenticated server-side
+    hub.bind_user(conn_id, authenticated_user_id)
+
+    # WebSocket handler
+    if message['type'] == 'subscribe':
+        if not hub.subscribe(message['cameraId'], conn_id, send):
+            await send({'type': 'error', 'error': 'forbidden'})
+    elif message['type'] == 'unsubscribe':
+        hub.unsubscribe(message['cameraId'], conn_id)
+    elif hub.accept_frame(camera_id, conn_id, send):
+        pipeline.submit(camera_id, frame)
+    ...
+    await hub.publish(authenticated_user_id, camera_id, response)  # from the publish stage
+    hub.disconnect(conn_id)                                         # on close
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import asyncio
+import inspect
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+SendFn = Callable[[Dict[str, Any]], Any]
+CameraKey = Tuple[str, str]     # (user_id, camera_id)
+
+ANONYMOUS_USER = 'anonymous'
+
+
+def camera_key(user_id: Optional[str], camera_id: str) -> CameraKey:
+    """Hub key of a camera (cameras are scoped to their owner)"""
+    if not user_id or user_id in ('undefined', 'null'):
+        user_id = ANONYMOUS_USER
+    return user_id, camera_id
+
+
+@dataclass
+class CameraChannel:
+    """Publishers and subscribers of one camera"""
+    publishers: List[str] = field(default_factory=list)   # First = active
+    subscribers: Dict[str, SendFn] = field(default_factory=dict)
+    frames_accepted: int = 0
+    frames_deduplicated: int = 0
+    messages_published: int = 0
+
+
+class CameraHub:
+    """
+    Per-camera publisher/subscriber registry, scoped by owning user.
+
+    Supports:
+    - One active publisher per camera, with failover
+    - Result fan-out to all subscribers
+    - Ownership checks: a connection only reaches its own user's cameras
+    - Thread-safe operations
+    """
+
+    def __init__(self):
+        """Initialize the hub."""
+        self._channels: Dict[CameraKey, CameraChannel] = {}
+        self._connections: Dict[str, Set[CameraKey]] = {}   # conn_id -> camera keys
+        self._users: Dict[str, str] = {}                    # conn_id -> authenticated user
+        self._lock = threading.Lock()
+        self.deliveries = 0
+        self.delivery_failures = 0
+        self.rejected = 0
+
+    def bind_user(self, conn_id: str, user_id: Optional[str]) -> bool:
+        """
+        Bind a connection to its authenticated user.
+
+        Only call this with a user the server has verified (never with a
+        userId taken from a client message); it is the sole source of a
+        connection's identity.
+
+        Returns:
+            False if the connection is already bound to a different user
+        """
+        user = camera_key(user_id, '')[0]
+        with self._lock:
+            bound = self._users.setdefault(conn_id, user)
+            if bound != user:
+                self.rejected += 1
+                print(f"[CameraHub] {conn_id} is bound to {bound}, rejected as {user}")
+                return False
+            return True
+
+    def subscribe(self, camera_id: str, conn_id: str, send: SendFn) -> bool:
+        """
+        Deliver a camera of the connection's user to it.
+
+        Args:
+            camera_id: Camera of the connection's own user
+            conn_id: Subscribing connection (must be bound with bind_user)
+            send: Delivery callable
+
+        Returns:
+            False if the connection has not been bound to a user
+        """
+        with self._lock:
+            owner = self._users.get(conn_id)
+            if owner is None:
+                self.rejected += 1
+                print(f"[CameraHub] Subscribe to {camera_id} by unauthenticated {conn_id} rejected")
+                return False
+            key = (owner, camera_id)
+            channel = self._channels.setdefault(key, CameraChannel())
+            channel.subscribers[conn_id] = send
+            self._connections.setdefault(conn_id, set()).add(key)
+            return True
+
+    def unsubscribe(self, camera_id: str, conn_id: str):
+        """Stop delivering a camera of the connection's user to it"""
+        with self._lock:
+            owner = self._users.get(conn_id)
+            if owner is not None:
+                self._unsubscribe((owner, camera_id), conn_id)
+
+    def accept_frame(self, camera_id: str, conn_id: str, send: Optional[SendFn] = None) -> bool:
+        """
+        Register a frame from a connection.
+
+        The connection (which must be bound with bind_user) becomes a
+        publisher (and subscriber, if `send` is given) of its user's camera.
+
+        Returns:
+            True if the frame should be processed, False if another
+            connection is already streaming this camera or the connection
+            has not been bound to a user
+        """
+        with self._lock:
+            owner = self._users.get(conn_id)
+            if owner is None:
+                self.rejected += 1
+                return False
+            key = (owner, camera_id)
+            channel = self._channels.setdefault(key, CameraChannel())
+            if conn_id not in channel.publishers:
+                channel.publishers.append(conn_id)
+                self._connections.setdefault(conn_id, set()).add(key)
+                if len(channel.publishers) > 1:
+                    print(f"[CameraHub] Duplicate stream for {key[0]}/{camera_id} from {conn_id}; "
+                          f"sharing pipeline of {channel.publishers[0]}")
+            if send is not None and conn_id not in channel.subscribers:
+                channel.subscribers[conn_id] = send
+
+            if channel.publishers[0] == conn_id:
+                channel.frames_accepted += 1
+                return True
+            channel.frames_deduplicated += 1
+            return False
+
+    def disconnect(self, conn_id: str):
+        """Remove a closed connection from all cameras"""
+        with self._lock:
+            self._users.pop(conn_id, None)
+            for key in self._connections.pop(conn_id, set()):
+                channel = self._channels.get(key)
+                if channel is None:
+                    continue
+                channel.subscribers.pop(conn_id, None)
+                if conn_id in channel.publishers:
+                    was_active = channel.publishers[0] == conn_id
+                    channel.publishers.remove(conn_id)
+                    if was_active and channel.publishers:
+                        print(f"[CameraHub] {key[0]}/{key[1]}: publisher {channel.publishers[0]} takes over")
+                self._drop_if_idle(key, channel)
+
+    def subscribers(self, user_id: Optional[str], camera_id: str) -> List[str]:
+        """Connection IDs receiving a camera's results"""
+        with self._lock:
+            channel = self._channels.get(camera_key(user_id, camera_id))
+            return list(channel.subscribers) if channel else []
+
+    async def publish(self, user_id: Optional[str], camera_id: str, message: Dict[str, Any]) -> int:
+        """
+        Deliver a message to every subscriber of a user's camera.
+
+        Subscribers whose send raises are removed.
+
+        Returns:
+            Number of successful deliveries
+        """
+        key = camera_key(user_id, camera_id)
+        with self._lock:
+            channel = self._channels.get(key)
+            if channel is None:
+                return 0
+            channel.messages_published += 1
+            targets = list(channel.subscribers.items())
+
+        results = await asyncio.gather(*(self._deliver(send, message) for _, send in targets),
+                                       return_exceptions=True)
+        delivered = 0
+        for (conn_id, _), result in zip(targets, results):
+            if isinstance(result, Exception):
+                self.delivery_failures += 1
+                print(f"[CameraHub] Delivery of {key[0]}/{camera_id} to {conn_id} failed: {result}")
+                with self._lock:
+                    self._unsubscribe(key, conn_id)
+            else:
+                delivered += 1
+        self.deliveries += delivered
+        return delivered
+
+    def get_camera_stats(self, user_id: Optional[str], camera_id: str) -> Dict[str, Any]:
+        """Publishers, subscribers and dedup counters for one camera"""
+        with self._lock:
+            channel = self._channels.get(camera_key(user_id, camera_id))
+            if channel is None:
+                return {'publishers': 0, 'subscribers': 0}
+            return {
+                'active_publisher': channel.publishers[0] if channel.publishers else None,
+                'publishers': len(channel.publishers),
+                'subscribers': len(channel.subscribers),
+                'frames_accepted': channel.frames_accepted,
+                'frames_deduplicated': channel.frames_deduplicated,
+                'messages_published': channel.messages_published,
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Totals over all cameras"""
+        with self._lock:
+            channels = list(self._channels.values())
+            return {
+                'cameras': len(channels),
+                'users': len({user for user, _ in self._channels}),
+                'connections': len(self._connections),
+                'subscribers': sum(len(c.subscribers) for c in channels),
+                'shared_cameras': sum(1 for c in channels if len(c.subscribers) > 1),
+                'frames_deduplicated': sum(c.frames_deduplicated for c in channels),
+                'deliveries': self.deliveries,
+                'delivery_failures': self.delivery_failures,
+                'rejected': self.rejected,
+            }
+
+    @staticmethod
+    async def _deliver(send: SendFn, message: Dict[str, Any]):
+        result = send(message)
+        if inspect.isawaitable(result):
+            await result
+
+    def _unsubscribe(self, key: CameraKey, conn_id: str):
+        """Remove a subscriber (caller holds the lock)"""
+        channel = self._channels.get(key)
+        if channel is None:
+            return
+        channel.subscribers.pop(conn_id, None)
+        if conn_id not in channel.publishers:
+            keys = self._connections.get(conn_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._connections[conn_id]
+        self._drop_if_idle(key, channel)
+
+    def _drop_if_idle(self, key: CameraKey, channel: CameraChannel):
+        """Forget a camera nobody publishes or watches (caller holds the lock)"""
+        if not channel.publishers and not channel.subscribers:
+            del self._channels[key]
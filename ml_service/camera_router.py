@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Camera Router
+================================================================================
+
+Consistent-hash routing of cameras to ML nodes.
+
+Each camera's 32-frame skeleton buffer and tracker live in one server
+process, so scaling out means every camera must keep going to the same node.
+The router places nodes on a hash ring with virtual nodes and sends each
+cameraId to the first node clockwise from its hash. When a node joins or
+leaves, only the cameras whose owner changed are moved (about 1/N of them),
+and their state is handed from the old node to the new one through a
+transfer callback, so detection continues without refilling the buffer.
+
+Features:
+- Consistent hashing with virtual nodes (and optional node weights)
+- Minimal moves on join/leave, with per-camera state handoff
+- Failed nodes: cameras move without handoff (start fresh or from snapshot)
+- Local multi-process demo (run this file)
+
+Usage:
+    from camera_router import CameraRouter
+
+    router = CameraRouter(transfer=handoff)   # handoff(camera_id, source, target)
+    router.add_node('ml-1')
+    router.add_node('ml-2')
+    node = router.route(camera_id)            # forward frames to this node
+
+    router.add_node('ml-3')                   # moves ~1/3 of the cameras
+    router.remove_node('ml-1')                # graceful leave, with handoff
+    router.remove_node('ml-2', failed=True)   # crash, no handoff
+
+Local demo:
+    python3 camera_router.py --nodes 3 --cameras 30
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import bisect
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Defaults
+DEFAULT_VNODES = 128   # Virtual nodes per unit of weight
+
+
+def _hash(key: str) -> int:
+    """Stable 64-bit hash (independent of PYTHONHASHSEED)"""
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+@dataclass
+class CameraMove:
+    """A camera whose owner changed"""
+    camera_id: str
+    source: Optional[str]
+    target: str
+    handed_off: bool = False
+
+
+class ConsistentHashRing:
+    """Hash ring with virtual nodes (not thread-safe; CameraRouter locks)"""
+
+    def __init__(self, vnodes: int = DEFAULT_VNODES):
+        self.vnodes = vnodes
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        self._weights: Dict[str, float] = {}
+
+    @property
+    def nodes(self) -> List[str]:
+        return sorted(self._weights)
+
+    def add(self, node_id: str, weight: float = 1.0):
+        """Place a node's virtual nodes on the ring"""
+        if node_id in self._weights:
+            return
+        self._weights[node_id] = weight
+        for i in range(max(1, int(round(self.vnodes * weight)))):
+            point = _hash(f"{node_id}#{i}")
+            index = bisect.bisect_left(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, node_id)
+
+    def remove(self, node_id: str):
+        """Take a node's virtual nodes off the ring"""
+        if self._weights.pop(node_id, None) is None:
+            return
+        keep = [(p, o) for p, o in zip(self._points, self._owners) if o != node_id]
+        self._points = [p for p, _ in keep]
+        self._owners = [o for _, o in keep]
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Node owning a key"""
+        if not self._points:
+            return None
+        index = bisect.bisect_right(self._points, _hash(key)) % len(self._points)
+        return self._owners[index]
+
+
+class CameraRouter:
+    """
+    Routes cameras to nodes and moves them on membership changes.
+
+    Supports:
+    - Consistent-hash placement with virtual nodes
+    - State handoff for moved cameras
+    - Per-node camera counts
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        vnodes: int = DEFAULT_VNODES,
+        transfer: Optional[Callable[[str, str, str], None]] = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            vnodes: Virtual nodes per node (more = more even spread)
+            transfer: Called as transfer(camera_id, source, target) for each
+                camera moving between live nodes; should export the camera's
+                state from source and import it on target
+        """
+        self.ring = ConsistentHashRing(vnodes)
+        self.transfer = transfer
+        self._assignments: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.moves_total = 0
+        self.handoffs_failed = 0
+
+    def route(self, camera_id: str) -> Optional[str]:
+        """Node for a camera (recorded so it can be moved later)"""
+        with self._lock:
+            node = self._assignments.get(camera_id)
+            if node is None:
+                node = self.ring.lookup(camera_id)
+                if node is not None:
+                    self._assignments[camera_id] = node
+            return node
+
+    def add_node(self, node_id: str, weight: float = 1.0) -> List[CameraMove]:
+        """Add a node; moves the cameras it now owns from their old nodes"""
+        with self._lock:
+            self.ring.add(node_id, weight)
+            return self._rebalance(failed=())
+
+    def remove_node(self, node_id: str, failed: bool = False) -> List[CameraMove]:
+        """
+        Remove a node and move its cameras.
+
+        Args:
+            node_id: Node leaving the ring
+            failed: True if the node is gone (no state handoff possible)
+        """
+        with self._lock:
+            self.ring.remove(node_id)
+            return self._rebalance(failed=(node_id,) if failed else ())
+
+    def forget_camera(self, camera_id: str):
+        """Drop a disconnected camera's assignment"""
+        with self._lock:
+            self._assignments.pop(camera_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Nodes, camera counts per node and move counters"""
+        with self._lock:
+            per_node = {node: 0 for node in self.ring.nodes}
+            for node in self._assignments.values():
+                per_node[node] = per_node.get(node, 0) + 1
+            return {
+                'nodes': self.ring.nodes,
+                'cameras': len(self._assignments),
+                'cameras_per_node': per_node,
+                'moves_total': self.moves_total,
+                'handoffs_failed': self.handoffs_failed,
+            }
+
+    def _rebalance(self, failed: Tuple[str, ...]) -> List[CameraMove]:
+        """Reassign cameras whose owner changed (caller holds the lock)"""
+        moves = []
+        for camera_id, source in list(self._assignments.items()):
+            target = self.ring.lookup(camera_id)
+            if target == source:
+                continue
+            if target is None:
+                del self._assignments[camera_id]
+                continue
+            move = CameraMove(camera_id, None if source in failed else source, target)
+            if move.source is not None and self.transfer is not None:
+                try:
+                    self.transfer(camera_id, move.source, target)
+                    move.handed_off = True
+                except Exception as e:
+                    self.handoffs_failed += 1
+                    print(f"[Router] Handoff of {camera_id} {source} -> {target} failed: {e}")
+            self._assignments[camera_id] = target
+            moves.append(move)
+
+        self.moves_total += len(moves)
+        if moves:
+            print(f"[Router] Moved {len(moves)}/{len(self._assignments)} cameras "
+                  f"({sum(m.handed_off for m in moves)} with state)")
+        return moves
+
+
+# =============================================================================
+# Local multi-process demo
+# =============================================================================
+
+def _demo_node(node_id: str, commands: Any, replies: Any):
+    """Minimal ML node: per-camera skeleton buffer and tracker"""
+    from skeleton_buffer import SkeletonRingBuffer
+    from skeleton_tracker import SkeletonTracker
+
+    sessions: Dict[str, Tuple[SkeletonRingBuffer, SkeletonTracker]] = {}
+    while True:
+        command, camera_id, payload = commands.get()
+        if command == 'stop':
+            return
+        if command == 'frame':
+            buffer, tracker = sessions.setdefault(camera_id, (SkeletonRingBuffer(), SkeletonTracker()))
+            kpts, boxes = payload
+            tracker.update(boxes)
+            buffer.append(kpts)
+        elif command == 'export':
+            session = sessions.pop(camera_id, None)
+            state = None if session is None else {
+                'buffer': session[0].get_state(), 'tracker': session[1].get_state(),
+            }
+            replies.put(state)
+        elif command == 'import':
+            buffer, tracker = SkeletonRingBuffer(), SkeletonTracker()
+            if payload is not None:
+                buffer.set_state(payload['buffer'])
+                tracker.set_state(payload['tracker'])
+            sessions[camera_id] = (buffer, tracker)
+        elif command == 'status':
+            replies.put({cam: (len(b), b.frames_seen) for cam, (b, _) in sessions.items()})
+
+
+def _run_demo(num_nodes: int, num_cameras: int, frames: int):
+    import multiprocessing
+
+    import numpy as np
+
+    ctx = multiprocessing.get_context('spawn')
+    nodes: Dict[str, Tuple[Any, Any, Any]] = {}
+
+    def start_node(node_id: str):
+        commands, replies = ctx.Queue(), ctx.Queue()
+        process = ctx.Process(target=_demo_node, args=(node_id, commands, replies), daemon=True)
+        process.start()
+        nodes[node_id] = (process, commands, replies)
+
+    def handoff(camera_id: str, source: str, target: str):
+        _, source_commands, source_replies = nodes[source]
+        source_commands.put(('export', camera_id, None))
+        state = source_replies.get(timeout=10)
+        nodes[target][1].put(('import', camera_id, state))
+
+    def send_frames(count: int):
+        rng = np.random.default_rng(0)
+        for _ in range(count):
+            for c in range(num_cameras):
+                camera_id = f"camera-{c:02d}"
+                kpts = rng.random((2, 17, 3), dtype=np.float32)
+                boxes = [np.array([10, 10, 100, 200], dtype=np.float32)]
+                nodes[router.route(camera_id)][1].put(('frame', camera_id, (kpts, boxes)))
+
+    def status() -> Dict[str, Tuple[int, int]]:
+        merged = {}
+        for node_id, (_, commands, replies) in nodes.items():
+            commands.put(('status', None, None))
+            merged.update({cam: (node_id, *s) for cam, s in replies.get(timeout=10).items()})
+        return merged
+
+    router = CameraRouter(transfer=handoff)
+    for i in range(num_nodes):
+        start_node(f"ml-{i + 1}")
+        router.add_node(f"ml-{i + 1}")
+
+    send_frames(frames)
+    print("[Demo] Cameras per node:", router.get_stats()['cameras_per_node'])
+
+    new_node = f"ml-{num_nodes + 1}"
+    start_node(new_node)
+    moves = router.add_node(new_node)
+    print(f"[Demo] {new_node} joined: {len(moves)}/{num_cameras} cameras moved "
+          f"(ideal {num_cameras / (num_nodes + 1):.1f})")
+    after_join = status()
+    for move in moves:
+        node_id, buffered, seen = after_join[move.camera_id]
+        print(f"  {move.camera_id}: {move.source} -> {node_id}, buffer {buffered}/32, frames_seen {seen}")
+
+    leaving = 'ml-1'
+    moves = router.remove_node(leaving)
+    _, commands, _ = nodes.pop(leaving)
+    commands.put(('stop', None, None))
+    send_frames(1)
+    ready = sum(1 for _, buffered, _ in status().values() if buffered == 32)
+    print(f"[Demo] {leaving} left: {len(moves)} cameras moved with state; "
+          f"{ready}/{num_cameras} cameras still have a full window")
+    print("[Demo] Cameras per node:", router.get_stats()['cameras_per_node'])
+
+    for _, commands, _ in nodes.values():
+        commands.put(('stop', None, None))
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Local consistent-hash routing demo')
+    parser.add_argument('--nodes', type=int, default=3)
+    parser.add_argument('--cameras', type=int, default=30)
+    parser.add_argument('--frames', type=int, default=40)
+    args = parser.parse_args()
+    _run_demo(args.nodes, args.cameras, args.frames)
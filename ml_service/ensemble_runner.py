@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Smart Veto Ensemble Runner
+================================================================================
+
+Fused PRIMARY + VETO forward on one shared input.
+
+STGCNPP and MSG3D consume the same (C, T, V, M) skeleton window, yet each
+model converted it to the (N, M, T, V, C) tensor and moved it to the device
+on its own, and the two forward passes ran one after the other. The
+ensemble runner prepares the input tensor once and runs both models on it
+concurrently on a two-thread pool (PyTorch releases the GIL inside
+operators), so the latency of an ensemble evaluation approaches the slower
+model instead of the sum of both.
+
+The two checkpoints have different architectures, so they cannot be merged
+into a single batched call; when PRIMARY and VETO are the same module (e.g.
+a single-model config) it runs once and both scores come from that pass.
+
+On CPU both forwards share the intra-op thread pool; the overlap gain is
+largest when torch.get_num_threads() is below the core count (e.g. several
+server workers per box) or on GPU.
+
+Features:
+- Shared input preparation (stacking, tensor conversion, device copy)
+- Concurrent PRIMARY / VETO forward passes
+- Per-model timing breakdown (prepare, primary, veto, total)
+- Smart Veto decision with each user's thresholds
+
+Usage:
+    from ensemble_runner import SmartVetoEnsemble
+
+    ensemble = SmartVetoEnsemble(primary_model, veto_model, device='cpu')
+    result = ensemble.evaluate(window, config_manager.get_user_config(user_id))
+
+    response.update({
+        'primary': result.primary,
+        'veto': result.veto,
+        'result': result.result,
+        'timing_ms': result.timing(),
+    })
+
+Benchmark: benchmarks/bench_ensemble.py
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import torch
+
+from cascade import smart_veto_decision
+from gcn_batcher import VIOLENCE_CLASS, stack_windows
+from user_config_manager import DEFAULT_CONFIG
+
+
+@dataclass
+class EnsembleResult:
+    """Both scores for one window, with a timing breakdown"""
+    primary: float                  # PRIMARY score (%)
+    veto: Optional[float]           # VETO score (%), None if Smart Veto is disabled
+    result: str                     # SAFE / VETOED / VIOLENCE
+    prepare_ms: float = 0.0
+    primary_ms: float = 0.0
+    veto_ms: float = 0.0
+    total_ms: float = 0.0
+
+    def timing(self) -> Dict[str, float]:
+        return {
+            'prepare': self.prepare_ms,
+            'primary': self.primary_ms,
+            'veto': self.veto_ms,
+            'total': self.total_ms,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class SmartVetoEnsemble:
+    """
+    Runs PRIMARY and VETO together on a shared input tensor.
+
+    Supports:
+    - Single windows or batches of windows
+    - Concurrent or sequential execution (for comparison)
+    - Timing statistics
+    - Thread-safe calls
+    """
+
+    def __init__(
+        self,
+        primary_model: torch.nn.Module,
+        veto_model: torch.nn.Module,
+        device: str = 'cpu',
+        concurrent: bool = True,
+    ):
+        """
+        Initialize the ensemble.
+
+        Args:
+            primary_model: Loaded PRIMARY model (eval mode)
+            veto_model: Loaded VETO model (eval mode)
+            device: Torch device both models live on
+            concurrent: Run the two forward passes in parallel
+        """
+        self.primary_model = primary_model
+        self.veto_model = veto_model
+        self.device = torch.device(device)
+        self.concurrent = concurrent
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ensemble')
+        self._lock = threading.Lock()
+
+        # Stats
+        self._runs = 0
+        self._windows = 0
+        self._totals = {'prepare': 0.0, 'primary': 0.0, 'veto': 0.0, 'total': 0.0}
+
+    def prepare(self, windows: Sequence[np.ndarray]) -> torch.Tensor:
+        """Stack (C, T, V, M) windows into one (N, M, T, V, C) device tensor"""
+        batch = torch.from_numpy(stack_windows(list(windows)))
+        if self.device.type == 'cuda':
+            return batch.pin_memory().to(self.device, non_blocking=True)
+        return batch.to(self.device)
+
+    def run(
+        self,
+        windows: Sequence[np.ndarray],
+        with_veto: bool = True,
+    ) -> Tuple[List[float], Optional[List[float]], Dict[str, float]]:
+        """
+        Score a batch of windows with both models.
+
+        Args:
+            windows: Skeleton windows (C, T, V, M)
+            with_veto: Also run the VETO model
+
+        Returns:
+            (primary scores %, veto scores % or None, timing ms)
+        """
+        start = time.perf_counter()
+        batch = self.prepare(windows)
+        prepare_ms = (time.perf_counter() - start) * 1000
+
+        shared = self.veto_model is self.primary_model
+        if not with_veto or shared:
+            primary, primary_ms = self._forward(self.primary_model, batch)
+            veto, veto_ms = (primary, 0.0) if with_veto else (None, 0.0)
+        elif self.concurrent:
+            veto_future = self._pool.submit(self._forward, self.veto_model, batch)
+            primary, primary_ms = self._forward(self.primary_model, batch)
+            veto, veto_ms = veto_future.result()
+        else:
+            primary, primary_ms = self._forward(self.primary_model, batch)
+            veto, veto_ms = self._forward(self.veto_model, batch)
+
+        timing = {
+            'prepare': round(prepare_ms, 2),
+            'primary': round(primary_ms, 2),
+            'veto': round(veto_ms, 2),
+            'total': round((time.perf_counter() - start) * 1000, 2),
+        }
+        with self._lock:
+            self._runs += 1
+            self._windows += len(windows)
+            for key, value in timing.items():
+                self._totals[key] += value
+        return primary, veto, timing
+
+    def evaluate(self, window: np.ndarray, config: Optional[Dict[str, Any]] = None) -> EnsembleResult:
+        """
+        Score one window and apply the Smart Veto rule.
+
+        Args:
+            window: Skeleton window (C, T, V, M)
+            config: User configuration (defaults to DEFAULT_CONFIG)
+
+        Returns:
+            EnsembleResult
+        """
+        config = config or DEFAULT_CONFIG
+        primary_threshold = config.get('primary_threshold', DEFAULT_CONFIG['primary_threshold'])
+        veto_threshold = config.get('veto_threshold', DEFAULT_CONFIG['veto_threshold'])
+        veto_enabled = config.get('smart_veto_enabled', True)
+
+        primary_scores, veto_scores, timing = self.run([window], with_veto=veto_enabled)
+        primary = round(primary_scores[0], 1)
+        veto = round(veto_scores[0], 1) if veto_scores is not None else None
+
+        return EnsembleResult(
+            primary=primary,
+            veto=veto,
+            result=smart_veto_decision(primary, veto, primary_threshold, veto_threshold),
+            prepare_ms=timing['prepare'],
+            primary_ms=timing['primary'],
+            veto_ms=timing['veto'],
+            total_ms=timing['total'],
+        )
+
+    def close(self):
+        """Shut down the thread pool"""
+        self._pool.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Mean timing per run and the overlap achieved"""
+        with self._lock:
+            runs = max(self._runs, 1)
+            mean = {key: round(value / runs, 2) for key, value in self._totals.items()}
+            sequential = mean['prepare'] + mean['primary'] + mean['veto']
+            return {
+                'runs': self._runs,
+                'windows': self._windows,
+                'concurrent': self.concurrent,
+                'mean_ms': mean,
+                # > 1 when the two forward passes overlapped
+                'speedup_vs_sequential': round(sequential / mean['total'], 2) if mean['total'] else 0.0,
+            }
+
+    def _forward(self, model: torch.nn.Module, batch: torch.Tensor) -> Tuple[List[float], float]:
+        """One forward pass; violence scores (%) and elapsed ms"""
+        start = time.perf_counter()
+        with torch.inference_mode():
+            probs = torch.softmax(model(batch), dim=1)[:, VIOLENCE_CLASS]
+            scores = (probs.float().cpu().numpy() * 100).tolist()
+        return scores, (time.perf_counter() - start) * 1000
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Frame Decoder
+================================================================================
+
+Fast JPEG decode path for incoming camera frames.
+
+Clients send JPEG frames (binary on /ws/live, or base64 strings in the
+`analyze_frames` `frames` array) and the server used to fully decode each one
+at native resolution before YOLO resized it again. JPEG supports decoding
+directly at 1/2, 1/4 or 1/8 scale in the DCT domain, which skips most of the
+IDCT and color conversion work. The decoder reads the frame size from the
+JPEG header, picks the largest reduction that still covers the YOLO input
+size, and decodes straight to that scale.
+
+Backends (first available):
+- PyTurboJPEG (libjpeg-turbo scaling factors)
+- OpenCV IMREAD_REDUCED_COLOR_2/4/8 (libjpeg scaled decode)
+
+Keypoints found on a reduced frame must be mapped back to the client's
+coordinates with `DecodedFrame.scale_xy` (see `to_source_coords`); x and y
+factors differ when exact_size changes the aspect ratio.
+
+Features:
+- Header-only size probe (no decode) to choose the scale
+- base64 input decoded with binascii (C) and wrapped without extra copies
+- Optional reuse of a preallocated output buffer for exact-size resizes
+
+Usage:
+    from frame_decoder import FrameDecoder
+
+    decoder = FrameDecoder(target_size=imgsz)
+    decoded = decoder.decode(jpeg_bytes)            # or decoder.decode_base64(frame_str)
+    pose = pose_batcher.extract(camera_id, decoded.image, imgsz=imgsz)
+    kpts_visual = [to_source_coords(k, decoded.scale_xy) for k in pose.kpts_visual]
+
+Benchmark: benchmarks/bench_frame_decode.py
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import binascii
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import cv2
+
+try:
+    from turbojpeg import TurboJPEG
+    _turbojpeg: Optional[TurboJPEG] = TurboJPEG()
+except Exception:  # Library or shared object not installed
+    _turbojpeg = None
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Reduction factors supported by libjpeg scaled decoding
+SCALE_FACTORS = (8, 4, 2, 1)
+CV2_REDUCED_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# JPEG start-of-frame markers carrying the image size
+_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+@dataclass
+class DecodedFrame:
+    """Decoded frame and its relation to the original JPEG"""
+    image: np.ndarray            # BGR (H, W, 3)
+    scale: float                 # Source pixels per decoded pixel (x)
+    source_size: Tuple[int, int]  # (width, height) of the JPEG
+    scale_xy: Tuple[float, float] = (1.0, 1.0)   # Per-axis (sx, sy)
+
+
+def jpeg_size(data: BytesLike) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) from a JPEG header without decoding.
+
+    Returns:
+        (width, height) or None if no start-of-frame marker was found
+    """
+    view = memoryview(data)
+    n = len(view)
+    if n < 4 or view[0] != 0xFF or view[1] != 0xD8:
+        return None
+    i = 2
+    while i + 9 < n:
+        if view[i] != 0xFF:
+            i += 1
+            continue
+        marker = view[i + 1]
+        if marker == 0xFF:
+            i += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            i += 2
+            continue
+        length = (view[i + 2] << 8) | view[i + 3]
+        if marker in _SOF_MARKERS:
+            height = (view[i + 5] << 8) | view[i + 6]
+            width = (view[i + 7] << 8) | view[i + 8]
+            return width, height
+        i += 2 + length
+    return None
+
+
+def choose_scale(width: int, height: int, target_size: int) -> int:
+    """Largest reduction factor keeping the long side >= target_size"""
+    long_side = max(width, height)
+    for factor in SCALE_FACTORS:
+        if long_side // factor >= target_size:
+            return factor
+    return 1
+
+
+def to_source_coords(keypoints: np.ndarray, scale: Union[float, Tuple[float, float]]) -> np.ndarray:
+    """
+    Map (…, 3) keypoints from a reduced frame back to JPEG coordinates.
+
+    Args:
+        keypoints: Keypoints on the decoded frame
+        scale: DecodedFrame.scale_xy (or one factor for both axes)
+    """
+    sx, sy = (scale, scale) if isinstance(scale, (int, float)) else scale
+    if sx == 1 and sy == 1:
+        return keypoints
+    out = keypoints.copy()
+    out[..., 0] *= sx
+    out[..., 1] *= sy
+    return out
+
+
+class FrameDecoder:
+    """
+    Scaled JPEG decoder for YOLO input.
+
+    One decoder per worker thread: with exact_size the returned image is a
+    reused buffer, valid until the next decode call.
+    """
+
+    def __init__(self, target_size: int = 640, exact_size: Optional[Tuple[int, int]] = None):
+        """
+        Initialize the decoder.
+
+        Args:
+            target_size: YOLO input size; frames are decoded at the largest
+                reduction whose long side is still >= target_size
+            exact_size: Optional (width, height) to resize into after decode,
+                using a reused output buffer
+        """
+        self.target_size = target_size
+        self.exact_size = exact_size
+        self._out: Optional[np.ndarray] = None
+        self.backend = 'turbojpeg' if _turbojpeg is not None else 'opencv'
+
+    def decode(self, data: BytesLike, target_size: Optional[int] = None) -> Optional[DecodedFrame]:
+        """
+        Decode a JPEG frame at reduced scale.
+
+        Args:
+            data: JPEG bytes (bytes, bytearray or memoryview; not copied)
+            target_size: Override the decoder's target size
+
+        Returns:
+            DecodedFrame, or None if the data is not a decodable JPEG
+        """
+        size = jpeg_size(data)
+        if size is None:
+            return None
+        scale = choose_scale(size[0], size[1], target_size or self.target_size)
+
+        if _turbojpeg is not None:
+            try:
+                image = _turbojpeg.decode(data, scaling_factor=(1, scale))
+            except Exception:
+                image = self._decode_cv2(data, scale)
+        else:
+            image = self._decode_cv2(data, scale)
+
+        if image is None:
+            return None
+
+        if self.exact_size is not None and (image.shape[1], image.shape[0]) != self.exact_size:
+            width, height = self.exact_size
+            if self._out is None or self._out.shape[:2] != (height, width):
+                self._out = np.empty((height, width, 3), dtype=np.uint8)
+            cv2.resize(image, self.exact_size, dst=self._out, interpolation=cv2.INTER_AREA)
+            image = self._out
+
+        # Per-axis factors from the actual decoded size: exact_size may change
+        # the aspect ratio, and reduced decodes round odd dimensions up
+        scale_xy = (size[0] / float(image.shape[1]), size[1] / float(image.shape[0]))
+        return DecodedFrame(image=image, scale=scale_xy[0], source_size=size, scale_xy=scale_xy)
+
+    def decode_base64(self, frame: Union[str, BytesLike], target_size: Optional[int] = None) -> Optional[DecodedFrame]:
+        """
+        Decode a base64 JPEG (optionally a data URL) at reduced scale.
+
+        Args:
+            frame: base64 string or ASCII bytes, with or without a
+                'data:image/jpeg;base64,' prefix
+            target_size: Override the decoder's target size
+        """
+        if isinstance(frame, str):
+            comma = frame.find(',', 0, 64)
+            if comma != -1:
+                frame = frame[comma + 1:]
+        try:
+            data = binascii.a2b_base64(frame)
+        except (binascii.Error, ValueError):
+            return None
+        return self.decode(data, target_size)
+
+    def _decode_cv2(self, data: BytesLike, scale: int) -> Optional[np.ndarray]:
+        """OpenCV scaled decode (zero-copy view over the input bytes)"""
+        buf = np.frombuffer(data, dtype=np.uint8)
+        return cv2.imdecode(buf, CV2_REDUCED_FLAGS[scale])
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Binary Frame Protocol
+================================================================================
+
+Versioned binary message format for submitting camera frames over WebSocket.
+
+`analyze_frames` JSON messages carry frames as base64 strings, which costs
+~33% extra bytes plus a JSON parse and a base64 decode per frame on the
+server. Binary messages carry the raw JPEG payloads after a small header and
+are parsed into memoryviews over the received buffer, without copies.
+
+Layout (little-endian), version 1:
+
+    offset  size  field
+    0       4     magic 'NXVF'
+    4       1     version (1)
+    5       1     flags (reserved, 0)
+    6       2     frame count N
+    8       8     timestamp (float64, ms since epoch)
+    16      1     cameraId length A (UTF-8 bytes)
+    17      1     userId length B (UTF-8 bytes)
+    18      A     cameraId
+    18+A    B     userId
+    ...     4*N   frame lengths (uint32)
+    ...           frame payloads (JPEG), concatenated
+
+The TypeScript encoder lives in src/lib/frame-protocol.ts. The JSON path is
+kept for compatibility; `parse_message` accepts both.
+
+Usage:
+    from frame_protocol import parse_message
+
+    # In the WebSocket handler
+    message = parse_message(data)           # bytes (binary) or str (JSON)
+    if message.type != FRAME_MESSAGE_TYPE:  # subscribe / hello / resync / ping ...
+        handle_control(message.payload)
+    for jpeg in message.frames:             # memoryviews (binary path)
+        decoded = decoder.decode(jpeg)
+
+Benchmark: benchmarks/bench_frame_ingest.py
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import binascii
+import json
+import struct
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+MAGIC = b'NXVF'
+VERSION = 1
+HEADER = struct.Struct('<4sBBHdBB')
+HEADER_SIZE = HEADER.size  # 18 bytes
+MAX_FRAMES = 64
+FRAME_MESSAGE_TYPE = 'analyze_frames'
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class ProtocolError(ValueError):
+    """Raised for malformed or unsupported frame messages"""
+
+
+@dataclass
+class FrameMessage:
+    """Frames submitted for analysis, from either protocol"""
+    camera_id: Optional[str]
+    user_id: Optional[str]
+    timestamp: float
+    frames: List[BytesLike] = field(default_factory=list)
+    binary: bool = False
+    type: str = FRAME_MESSAGE_TYPE               # JSON 'type' (control messages differ)
+    payload: Optional[Dict[str, Any]] = None     # Parsed JSON object, if JSON
+
+
+def is_binary_frame_message(data: BytesLike) -> bool:
+    """True if data starts with the binary frame message magic"""
+    return len(data) >= HEADER_SIZE and bytes(data[:4]) == MAGIC
+
+
+def parse_binary_message(data: BytesLike) -> FrameMessage:
+    """
+    Parse a binary frame message without copying payloads.
+
+    Args:
+        data: Received WebSocket message bytes
+
+    Returns:
+        FrameMessage whose frames are memoryviews into `data`
+
+    Raises:
+        ProtocolError: On bad magic, unsupported version, truncated data or
+            ids that are not valid UTF-8
+    """
+    view = memoryview(data)
+    if len(view) < HEADER_SIZE:
+        raise ProtocolError(f"Message too short: {len(view)} bytes")
+
+    magic, version, _flags, count, timestamp, camera_len, user_len = HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ProtocolError("Bad magic")
+    if version != VERSION:
+        raise ProtocolError(f"Unsupported protocol version {version}")
+    if count > MAX_FRAMES:
+        raise ProtocolError(f"Too many frames: {count}")
+
+    offset = HEADER_SIZE
+    lengths_end = offset + camera_len + user_len + 4 * count
+    if lengths_end > len(view):
+        raise ProtocolError("Truncated header")
+
+    try:
+        camera_id = str(view[offset:offset + camera_len], 'utf-8') if camera_len else None
+        offset += camera_len
+        user_id = str(view[offset:offset + user_len], 'utf-8') if user_len else None
+        offset += user_len
+    except UnicodeDecodeError as e:
+        raise ProtocolError(f"cameraId / userId is not valid UTF-8: {e}") from e
+
+    lengths = struct.unpack_from(f'<{count}I', view, offset)
+    offset = lengths_end
+
+    frames = []
+    for length in lengths:
+        end = offset + length
+        if end > len(view):
+            raise ProtocolError("Truncated frame payload")
+        frames.append(view[offset:end])
+        offset = end
+
+    return FrameMessage(camera_id, user_id, timestamp, frames, binary=True)
+
+
+def parse_json_message(text: Union[str, bytes]) -> FrameMessage:
+    """
+    Parse a JSON message: legacy `analyze_frames` or a control message.
+
+    Frames (base64, optionally data URLs) are decoded to bytes. Control
+    messages (any other `type`) carry no frames; their fields are in
+    `payload`.
+
+    Raises:
+        ProtocolError: On invalid JSON, fields of the wrong type (including
+            a non-list `frames`), too many frames, invalid base64 or empty frames
+    """
+    try:
+        message = json.loads(text)
+        if not isinstance(message, dict):
+            raise ValueError("message is not an object")
+        message_type = message.get('type') or FRAME_MESSAGE_TYPE
+        camera_id = message.get('cameraId')
+        user_id = message.get('userId')
+        if not isinstance(message_type, str):
+            raise ValueError("type must be a string")
+        if camera_id is not None and not isinstance(camera_id, str):
+            raise ValueError("cameraId must be a string")
+        if user_id is not None and not isinstance(user_id, str):
+            raise ValueError("userId must be a string")
+
+        metadata = message.get('metadata') or {}
+        if not isinstance(metadata, dict):
+            raise ValueError("metadata must be an object")
+        timestamp = float(metadata.get('timestamp', 0))
+
+        frames = []
+        if message_type == FRAME_MESSAGE_TYPE:
+            raw_frames = message.get('frames') or []
+            if not isinstance(raw_frames, list):
+                raise ValueError("frames must be a list")
+            if len(raw_frames) > MAX_FRAMES:
+                raise ValueError(f"too many frames: {len(raw_frames)}")
+            for frame in raw_frames:
+                if not isinstance(frame, str):
+                    raise ValueError("frames must be strings")
+                comma = frame.find(',', 0, 64)
+                payload = binascii.a2b_base64(frame[comma + 1:] if comma != -1 else frame)
+                if not payload:
+                    raise ValueError("empty frame")
+                frames.append(payload)
+    except (ValueError, TypeError, AttributeError, binascii.Error) as e:
+        raise ProtocolError(f"Invalid JSON message: {e}") from e
+
+    return FrameMessage(
+        camera_id=camera_id,
+        user_id=user_id,
+        timestamp=timestamp,
+        frames=frames,
+        type=message_type,
+        payload=message,
+    )
+
+
+def parse_message(data: Union[str, BytesLike]) -> FrameMessage:
+    """
+    Parse a frame message from any supported format.
+
+    - str: `analyze_frames` or control JSON (see FrameMessage.type)
+    - bytes starting with 'NXVF': binary frame message
+    - bytes starting with a JPEG SOI marker: single raw JPEG (legacy /ws/live)
+    - other bytes: JSON sent as a binary message
+    """
+    if isinstance(data, str):
+        return parse_json_message(data)
+    if is_binary_frame_message(data):
+        return parse_binary_message(data)
+    if len(data) >= 2 and data[0] == 0xFF and data[1] == 0xD8:
+        return FrameMessage(None, None, 0.0, [memoryview(data)], binary=True)
+    return parse_json_message(bytes(data))
+
+
+def encode_binary_message(
+    frames: Sequence[BytesLike],
+    camera_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    timestamp: float = 0.0,
+) -> bytes:
+    """
+    Build a binary frame message (used by tools, benchmarks and tests).
+
+    Mirrors encodeFrameMessage() in src/lib/frame-protocol.ts.
+    """
+    camera = (camera_id or '').encode('utf-8')
+    user = (user_id or '').encode('utf-8')
+    if len(camera) > 255 or len(user) > 255:
+        raise ProtocolError("cameraId / userId longer than 255 bytes")
+    if len(frames) > MAX_FRAMES:
+        raise ProtocolError(f"Too many frames: {len(frames)}")
+
+    parts = [
+        HEADER.pack(MAGIC, VERSION, 0, len(frames), timestamp, len(camera), len(user)),
+        camera,
+        user,
+        struct.pack(f'<{len(frames)}I', *[len(f) for f in frames]),
+    ]
+    parts.extend(bytes(f) for f in frames)
+    return b''.join(parts)
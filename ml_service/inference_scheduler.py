@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Inference Scheduler
+================================================================================
+
+Decides, per camera, when a new skeleton window should go through the
+Smart Veto models (STGCNPP + MSG3D).
+
+Consecutive 32-frame windows overlap by 31 frames, so running both graph
+networks on every incoming frame spends most of the compute re-scoring data
+that was already seen. The scheduler supports two complementary policies:
+
+- Frame stride: run every k-th frame once the buffer is full
+- Time-based rate: run at a target windows-per-second, independent of the
+  FPS the client happens to send
+
+When both are configured, a window runs only when both conditions are met.
+The effective input FPS and inference rate are tracked per camera and can be
+merged into the WebSocket response for dashboards.
+
+Cameras are keyed by (userId, cameraId) (camera_hub.camera_key), so
+same-named cameras of different tenants are scheduled independently.
+
+Usage:
+    from inference_scheduler import InferenceScheduler
+
+    scheduler = InferenceScheduler(default_stride=4)
+    scheduler.configure_camera('cam-1', user_id, target_wps=2.0)
+
+    # In the frame loop
+    buffer.append(kpts)
+    if scheduler.on_frame(camera_id, user_id, buffer_ready=buffer.is_full()):
+        primary, veto = run_models(buffer.window())
+        scheduler.mark_inference(camera_id, user_id)
+
+    response.update(scheduler.response_fields(camera_id, user_id))
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import time
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Any
+
+from camera_hub import CameraKey, camera_key
+
+# Defaults (every frame, no rate cap = previous behaviour)
+DEFAULT_STRIDE = 1
+DEFAULT_TARGET_WPS: Optional[float] = None
+DEFAULT_RATE_WINDOW = 10.0  # seconds of history used for effective rates
+
+
+@dataclass
+class CameraSchedule:
+    """Scheduling state for one camera"""
+    stride: int
+    target_wps: Optional[float]
+    frames_since_inference: int = 0
+    next_due_ts: float = 0.0
+    frames_received: int = 0
+    windows_run: int = 0
+    frame_times: Deque[float] = field(default_factory=deque)
+    inference_times: Deque[float] = field(default_factory=deque)
+
+
+class InferenceScheduler:
+    """
+    Per-camera inference stride and rate control.
+
+    Supports:
+    - Per-camera stride (run every k frames)
+    - Per-camera target windows-per-second
+    - Effective input FPS / inference rate reporting
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        default_stride: int = DEFAULT_STRIDE,
+        default_target_wps: Optional[float] = DEFAULT_TARGET_WPS,
+        rate_window: float = DEFAULT_RATE_WINDOW,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            default_stride: Frames between inferences for unconfigured cameras
+            default_target_wps: Target windows/second (None = no time limit)
+            rate_window: Seconds of history used to compute effective rates
+        """
+        self.default_stride = max(1, int(default_stride))
+        self.default_target_wps = default_target_wps
+        self.rate_window = rate_window
+
+        self._cameras: Dict[CameraKey, CameraSchedule] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self._frames_total = 0
+        self._windows_total = 0
+
+    def configure_camera(
+        self,
+        camera_id: str,
+        user_id: Optional[str],
+        stride: Optional[int] = None,
+        target_wps: Optional[float] = None,
+    ):
+        """
+        Set the stride and/or target rate for a camera.
+
+        Args:
+            camera_id: Camera identifier
+            user_id: Tenant (userId)
+            stride: Run every k frames (None = keep current / default)
+            target_wps: Target windows per second (None = keep current / default,
+                0 = disable the time-based limit)
+        """
+        with self._lock:
+            schedule = self._get_or_create(camera_key(user_id, camera_id))
+            if stride is not None:
+                schedule.stride = max(1, int(stride))
+            if target_wps is not None:
+                schedule.target_wps = target_wps if target_wps > 0 else None
+
+    def on_frame(
+        self,
+        camera_id: str,
+        user_id: Optional[str],
+        buffer_ready: bool = True,
+        now: Optional[float] = None,
+    ) -> bool:
+        """
+        Record an incoming frame and decide whether to run inference.
+
+        Args:
+            camera_id: Camera identifier
+            user_id: Tenant (userId)
+            buffer_ready: Whether the skeleton window is full
+            now: Current time (defaults to time.time())
+
+        Returns:
+            True if the models should run on the current window
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            schedule = self._get_or_create(camera_key(user_id, camera_id))
+            schedule.frames_received += 1
+            schedule.frames_since_inference += 1
+            schedule.frame_times.append(now)
+            self._trim(schedule.frame_times, now)
+            self._frames_total += 1
+
+            if not buffer_ready:
+                return False
+
+            if schedule.frames_since_inference < schedule.stride:
+                return False
+
+            if schedule.target_wps and now < schedule.next_due_ts:
+                return False
+
+            return True
+
+    def mark_inference(self, camera_id: str, user_id: Optional[str], now: Optional[float] = None):
+        """
+        Record that a window was scored for a camera.
+
+        Args:
+            camera_id: Camera identifier
+            user_id: Tenant (userId)
+            now: Current time (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            schedule = self._get_or_create(camera_key(user_id, camera_id))
+            schedule.frames_since_inference = 0
+            if schedule.target_wps:
+                # Advance on a fixed grid so frame jitter does not erode the
+                # rate; resynchronize after long gaps instead of bursting.
+                interval = 1.0 / schedule.target_wps
+                due = schedule.next_due_ts + interval
+                schedule.next_due_ts = due if due > now - interval else now + interval
+            schedule.windows_run += 1
+            schedule.inference_times.append(now)
+            self._trim(schedule.inference_times, now)
+            self._windows_total += 1
+
+    def get_camera_rate(
+        self,
+        camera_id: str,
+        user_id: Optional[str],
+        now: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the effective rates for a camera.
+
+        Returns:
+            Dict with stride, target_wps, input_fps, inference_wps and
+            inference_ratio (fraction of frames that triggered inference)
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            schedule = self._cameras.get(camera_key(user_id, camera_id))
+            if schedule is None:
+                return {
+                    'stride': self.default_stride,
+                    'target_wps': self.default_target_wps,
+                    'input_fps': 0.0,
+                    'inference_wps': 0.0,
+                    'inference_ratio': 0.0,
+                }
+
+            self._trim(schedule.frame_times, now)
+            self._trim(schedule.inference_times, now)
+            input_fps = self._rate(schedule.frame_times, now)
+            inference_wps = self._rate(schedule.inference_times, now)
+
+            return {
+                'stride': schedule.stride,
+                'target_wps': schedule.target_wps,
+                'input_fps': round(input_fps, 2),
+                'inference_wps': round(inference_wps, 2),
+                'inference_ratio': round(inference_wps / input_fps, 3) if input_fps > 0 else 0.0,
+            }
+
+    def response_fields(self, camera_id: str, user_id: Optional[str]) -> Dict[str, Any]:
+        """Fields to merge into the per-frame WebSocket response"""
+        return {'inference_rate': self.get_camera_rate(camera_id, user_id)}
+
+    def remove_camera(self, camera_id: str, user_id: Optional[str]):
+        """Forget scheduling state for a disconnected camera"""
+        with self._lock:
+            self._cameras.pop(camera_key(user_id, camera_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics"""
+        with self._lock:
+            return {
+                'cameras': len(self._cameras),
+                'frames_total': self._frames_total,
+                'windows_total': self._windows_total,
+                'windows_per_frame': round(self._windows_total / self._frames_total, 3)
+                if self._frames_total else 0.0,
+            }
+
+    def _get_or_create(self, key: CameraKey) -> CameraSchedule:
+        """Get camera state (caller holds the lock)"""
+        schedule = self._cameras.get(key)
+        if schedule is None:
+            schedule = CameraSchedule(
+                stride=self.default_stride,
+                target_wps=self.default_target_wps,
+            )
+            self._cameras[key] = schedule
+        return schedule
+
+    def _trim(self, times: Deque[float], now: float):
+        """Drop timestamps older than the rate window"""
+        cutoff = now - self.rate_window
+        while times and times[0] < cutoff:
+            times.popleft()
+
+    def _rate(self, times: Deque[float], now: float) -> float:
+        """Events per second over the retained history"""
+        if len(times) < 2:
+            return 0.0
+        span = max(now - times[0], 1e-6)
+        return (len(times) - 1) / span
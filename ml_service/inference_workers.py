@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Multi-Process Inference Workers
+================================================================================
+
+Supervisor running N inference worker processes on one box.
+
+The ML service ran as a single process, so YOLO post-processing, NumPy work
+and the event loop all shared one GIL. The supervisor starts N worker
+processes (spawn context, so each loads its own models safely) and hands
+them decoded frames or skeleton windows through per-worker shared-memory
+rings (shm_ring.SharedRing); only small descriptors and results are pickled.
+
+Cameras have worker affinity: each camera is pinned to the least-loaded
+worker when first seen, so its skeleton buffer, tracker and caches stay in
+that process. Crashed workers are restarted and keep their cameras. A
+worker that dies before its handler is ready (e.g. its factory now fails)
+is restarted with exponential backoff, and given up on after
+max_restart_failures consecutive failures.
+
+Workers are built from a factory given as "module:function". The factory
+runs once inside each worker and returns a handler:
+
+    handler(camera_id: str, array: np.ndarray, meta: dict) -> Optional[dict]
+
+The array is a view into shared memory, valid only during the call.
+Results (small dicts) are returned on a shared result queue.
+
+Usage:
+    from inference_workers import WorkerSupervisor
+
+    supervisor = WorkerSupervisor('live_worker:make_handler', num_workers=4)
+    supervisor.start()
+    supervisor.submit(camera_id, frame, {'ts': ts})     # False if worker is full
+    for camera_id, result in supervisor.poll_results():
+        ...
+    supervisor.stop()
+
+Benchmark: benchmarks/bench_worker_scaling.py
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import importlib
+import multiprocessing
+import queue
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from shm_ring import DEFAULT_SLOTS, SharedRing, SlotDescriptor
+
+# Defaults
+DEFAULT_SLOT_BYTES = 1280 * 720 * 3      # One 720p BGR frame
+DEFAULT_START_TIMEOUT = 120.0            # Model loading can be slow
+DEFAULT_MAX_RESTART_FAILURES = 5         # Failed restarts in a row before giving up
+RESTART_BACKOFF = 1.0                    # Seconds before the first retry, doubled per failure
+MAX_RESTART_BACKOFF = 60.0
+
+_STOP = None
+
+
+def default_num_workers() -> int:
+    """One worker per core, leaving one for the event loop"""
+    return max(1, (multiprocessing.cpu_count() or 2) - 1)
+
+
+def resolve_factory(spec: str) -> Callable[..., Any]:
+    """Import 'module:function'"""
+    module_name, _, attr = spec.partition(':')
+    if not attr:
+        raise ValueError(f"Expected 'module:function', got {spec!r}")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _worker_main(worker_id: int, factory_spec: str, factory_kwargs: Dict[str, Any],
+                 ring: SharedRing, tasks: Any, results: Any):
+    """Worker process entry point"""
+    try:
+        handler = resolve_factory(factory_spec)(**factory_kwargs)
+    except Exception:
+        results.put(('error', worker_id, traceback.format_exc(limit=3)))
+        ring.close()
+        return
+    results.put(('ready', worker_id, None))
+
+    while True:
+        task = tasks.get()
+        if task is _STOP:
+            break
+        camera_id, descriptor = task
+        try:
+            array, meta = ring.get(descriptor)
+            result = handler(camera_id, array, meta)
+        except Exception:
+            result = {'error': traceback.format_exc(limit=3)}
+        finally:
+            ring.release(descriptor)
+        results.put(('result', camera_id, result))
+
+    ring.close()
+
+
+@dataclass
+class WorkerHandle:
+    """Supervisor-side state for one worker process"""
+    worker_id: int
+    ring: SharedRing
+    tasks: Any
+    process: Optional[multiprocessing.Process] = None
+    cameras: List[str] = field(default_factory=list)
+    submitted: int = 0
+    dropped: int = 0
+    completed: int = 0
+    restarts: int = 0
+    ready: bool = False                 # Handler loaded since the last spawn
+    restart_failures: int = 0           # Consecutive deaths before ready
+    next_restart_at: float = 0.0
+    last_error: Optional[str] = None
+    disabled: bool = False              # Gave up restarting
+
+
+class WorkerSupervisor:
+    """
+    Starts, feeds and monitors inference worker processes.
+
+    Supports:
+    - Shared-memory frame handoff (no pickling of arrays)
+    - Sticky camera-to-worker affinity
+    - Restart of crashed workers, with backoff for failing factories
+    - Thread-safe submission
+    """
+
+    def __init__(
+        self,
+        factory: str,
+        num_workers: Optional[int] = None,
+        slots: int = DEFAULT_SLOTS,
+        slot_bytes: int = DEFAULT_SLOT_BYTES,
+        factory_kwargs: Optional[Dict[str, Any]] = None,
+        max_restart_failures: int = DEFAULT_MAX_RESTART_FAILURES,
+    ):
+        """
+        Initialize the supervisor.
+
+        Args:
+            factory: "module:function" returning the per-worker handler
+            num_workers: Number of worker processes (None = default_num_workers())
+            slots: Frames in flight per worker before submit() reports full
+            slot_bytes: Largest array that can be submitted
+            factory_kwargs: Keyword arguments for the factory
+            max_restart_failures: Consecutive failed restarts of a worker
+                before it is no longer restarted
+        """
+        self.factory = factory
+        self.num_workers = max(1, default_num_workers() if num_workers is None else num_workers)
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.factory_kwargs = factory_kwargs or {}
+        self.max_restart_failures = max_restart_failures
+        self._ctx = multiprocessing.get_context('spawn')
+        self._results = self._ctx.Queue()
+        self._workers: List[WorkerHandle] = []
+        self._affinity: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self, timeout: float = DEFAULT_START_TIMEOUT):
+        """
+        Start all workers and wait until their handlers are loaded.
+
+        On failure all workers are stopped and their shared memory freed
+        before the error is raised.
+
+        Raises:
+            RuntimeError: If a worker's factory failed (with its traceback)
+            TimeoutError: If the workers are not ready within `timeout`
+        """
+        if self._running:
+            return
+        self._running = True
+        try:
+            for worker_id in range(self.num_workers):
+                handle = WorkerHandle(
+                    worker_id=worker_id,
+                    ring=SharedRing.create(self.slots, self.slot_bytes, ctx=self._ctx),
+                    tasks=self._ctx.Queue(),
+                )
+                self._workers.append(handle)
+                self._spawn(handle)
+
+            ready = 0
+            deadline = time.monotonic() + timeout
+            while ready < self.num_workers:
+                try:
+                    kind, worker_id, payload = self._results.get(
+                        timeout=max(0.1, deadline - time.monotonic()))
+                except queue.Empty:
+                    raise TimeoutError(f"{self.num_workers - ready} of {self.num_workers} workers "
+                                       f"not ready after {timeout}s ({self.factory})") from None
+                if kind == 'error':
+                    raise RuntimeError(f"Worker {worker_id} failed to load {self.factory}:\n{payload}")
+                if kind == 'ready':
+                    self._workers[worker_id].ready = True
+                    ready += 1
+        except BaseException:
+            self.stop(timeout=1.0)
+            raise
+        print(f"[Workers] {self.num_workers} workers ready ({self.factory})")
+
+    def stop(self, timeout: float = 10.0):
+        """Stop workers and free shared memory"""
+        if not self._running:
+            return
+        self._running = False
+        for handle in self._workers:
+            handle.tasks.put(_STOP)
+        for handle in self._workers:
+            if handle.process is not None:
+                handle.process.join(timeout)
+                if handle.process.is_alive():
+                    handle.process.terminate()
+            handle.ring.close()
+        self._workers = []
+        self._affinity = {}
+
+    def worker_for(self, camera_id: str) -> int:
+        """Worker a camera is pinned to (assigned on first use)"""
+        with self._lock:
+            return self._assign(camera_id)
+
+    def submit(self, camera_id: str, array: np.ndarray, meta: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Copy an array into the camera's worker ring and queue it.
+
+        Returns:
+            False if the worker has no free slot (frame dropped)
+        """
+        with self._lock:
+            handle = self._workers[self._assign(camera_id)]
+            descriptor: Optional[SlotDescriptor] = handle.ring.put(array, meta)
+            if descriptor is None:
+                handle.dropped += 1
+                return False
+            handle.submitted += 1
+            # Under the lock so check_workers cannot swap the ring / queue in between
+            handle.tasks.put((camera_id, descriptor))
+        return True
+
+    def poll_results(self, timeout: float = 0.0) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield (camera_id, result) for all finished tasks.
+
+        Readiness and factory errors of restarted workers are recorded
+        (and logged) here.
+
+        Args:
+            timeout: Seconds to wait for the first result
+        """
+        block = timeout > 0
+        while True:
+            try:
+                kind, camera_id, result = self._results.get(block=block, timeout=timeout if block else None)
+            except queue.Empty:
+                return
+            block = False
+            if kind != 'result':
+                self._on_worker_status(kind, camera_id, result)
+                continue
+            with self._lock:
+                worker_id = self._affinity.get(camera_id)
+                if worker_id is not None:
+                    self._workers[worker_id].completed += 1
+            yield camera_id, result
+
+    def check_workers(self) -> int:
+        """
+        Restart dead workers (call periodically).
+
+        A worker that died before becoming ready counts as a failed restart:
+        the next attempt is delayed (RESTART_BACKOFF, doubling up to
+        MAX_RESTART_BACKOFF) and after max_restart_failures in a row the
+        worker is disabled.
+
+        Returns:
+            Number of workers restarted
+        """
+        restarted = 0
+        now = time.monotonic()
+        with self._lock:
+            for handle in self._workers:
+                if (not self._running or handle.disabled or handle.process is None
+                        or handle.process.is_alive()):
+                    continue
+                if not handle.ready and handle.next_restart_at == 0.0:
+                    handle.restart_failures += 1
+                    if handle.restart_failures >= self.max_restart_failures:
+                        handle.disabled = True
+                        print(f"[Workers] Worker {handle.worker_id} failed to start "
+                              f"{handle.restart_failures} times, giving up: {handle.last_error}")
+                        continue
+                    backoff = min(RESTART_BACKOFF * 2 ** (handle.restart_failures - 1), MAX_RESTART_BACKOFF)
+                    handle.next_restart_at = now + backoff
+                    print(f"[Workers] Worker {handle.worker_id} died before ready, "
+                          f"retrying in {backoff:.1f}s")
+                if now < handle.next_restart_at:
+                    continue
+                print(f"[Workers] Worker {handle.worker_id} exited "
+                      f"(code {handle.process.exitcode}), restarting")
+                handle.next_restart_at = 0.0
+                handle.ring.close()
+                handle.ring = SharedRing.create(self.slots, self.slot_bytes, ctx=self._ctx)
+                handle.tasks = self._ctx.Queue()
+                handle.restarts += 1
+                self._spawn(handle)
+                restarted += 1
+        return restarted
+
+    def remove_camera(self, camera_id: str):
+        """Release a camera's worker affinity"""
+        with self._lock:
+            worker_id = self._affinity.pop(camera_id, None)
+            if worker_id is not None:
+                self._workers[worker_id].cameras.remove(camera_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-worker cameras, counters and liveness"""
+        with self._lock:
+            return {
+                'num_workers': self.num_workers,
+                'cameras': len(self._affinity),
+                'workers': [
+                    {
+                        'worker_id': h.worker_id,
+                        'alive': h.process is not None and h.process.is_alive(),
+                        'cameras': list(h.cameras),
+                        'submitted': h.submitted,
+                        'completed': h.completed,
+                        'dropped': h.dropped,
+                        'restarts': h.restarts,
+                        'restart_failures': h.restart_failures,
+                        'disabled': h.disabled,
+                    }
+                    for h in self._workers
+                ],
+            }
+
+    def _assign(self, camera_id: str) -> int:
+        """Sticky least-loaded assignment (caller holds the lock)"""
+        worker_id = self._affinity.get(camera_id)
+        if worker_id is None:
+            worker_id = min(self._workers, key=lambda h: len(h.cameras)).worker_id
+            self._affinity[camera_id] = worker_id
+            self._workers[worker_id].cameras.append(camera_id)
+        return worker_id
+
+    def _on_worker_status(self, kind: str, worker_id: int, payload: Any):
+        """Record a 'ready' / 'error' message from a (re)started worker"""
+        with self._lock:
+            if not 0 <= worker_id < len(self._workers):
+                return
+            handle = self._workers[worker_id]
+            if kind == 'ready':
+                handle.ready = True
+                handle.restart_failures = 0
+                handle.last_error = None
+                print(f"[Workers] Worker {worker_id} ready after restart")
+            elif kind == 'error':
+                handle.last_error = payload
+                print(f"[Workers] Worker {worker_id} failed to load {self.factory}:\n{payload}")
+
+    def _spawn(self, handle: WorkerHandle):
+        """Start the process for a worker handle"""
+        handle.ready = False
+        handle.process = self._ctx.Process(
+            target=_worker_main,
+            args=(handle.worker_id, self.factory, self.factory_kwargs, handle.ring, handle.tasks, self._results),
+            name=f"nexara-worker-{handle.worker_id}",
+            daemon=True,
+        )
+        handle.process.start()
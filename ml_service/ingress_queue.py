@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Ingress Queues
+================================================================================
+
+Bounded per-camera frame queues with a drop-oldest policy.
+
+When inference falls behind, frames used to queue without limit and latency
+grew until alerts arrived seconds late. Each camera connection now has a
+small bounded queue: when it is full the oldest frame is dropped, so the
+pipeline always works on the freshest frames. Per-camera counters report
+queue depth and dropped frames, and a backpressure hint tells the client
+how many frames per second the server is actually keeping up with
+(fed into useAdaptiveFrameRate on the frontend).
+
+Queues are keyed by (userId, cameraId) (camera_hub.camera_key): every tenant
+names its cells camera-0..N, so same-named cameras of different tenants
+must not share, evict from or read each other's queue.
+
+Features:
+- Drop-oldest bounded queue per camera (default depth 2)
+- Received / processed / dropped counters and queue depth
+- Rate-limited backpressure hints with a suggested client FPS
+- Thread-safe operations
+
+Usage:
+    from ingress_queue import IngressManager
+
+    ingress = IngressManager(maxsize=2)
+
+    # WebSocket receive handler
+    ingress.put(camera_id, user_id, frame)
+    hint = ingress.backpressure_hint(camera_id, user_id)
+    if hint:
+        await websocket.send_json(hint)
+
+    # Inference worker
+    frame = ingress.get(camera_id, user_id, timeout=1.0)
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import time
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional
+
+from camera_hub import CameraKey, camera_key
+
+# Defaults
+DEFAULT_MAXSIZE = 2              # Frames buffered per camera
+DEFAULT_HINT_INTERVAL = 1.0      # Seconds between backpressure hints per camera
+DEFAULT_RATE_WINDOW = 5.0        # Seconds of history for rates and drop ratio
+DEFAULT_MIN_FPS = 1.0            # Never suggest less than this
+HEADROOM = 0.9                   # Suggest 90% of the processed rate
+
+
+@dataclass
+class CameraIngress:
+    """Queue and counters for one camera"""
+    frames: Deque[Any] = field(default_factory=deque)
+    received: int = 0
+    processed: int = 0
+    dropped: int = 0
+    max_depth: int = 0
+    put_times: Deque[float] = field(default_factory=deque)
+    get_times: Deque[float] = field(default_factory=deque)
+    drop_times: Deque[float] = field(default_factory=deque)
+    last_hint_ts: float = 0.0
+    last_level: str = 'ok'
+
+
+class IngressManager:
+    """
+    Bounded drop-oldest ingress queues for all cameras.
+
+    Supports:
+    - Per-camera bounded queues
+    - Blocking and non-blocking reads
+    - Backpressure hints for clients
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        hint_interval: float = DEFAULT_HINT_INTERVAL,
+        rate_window: float = DEFAULT_RATE_WINDOW,
+        min_fps: float = DEFAULT_MIN_FPS,
+    ):
+        """
+        Initialize the ingress manager.
+
+        Args:
+            maxsize: Frames kept per camera before the oldest is dropped
+            hint_interval: Minimum seconds between hints for one camera
+            rate_window: Seconds of history used for rates and drop ratio
+            min_fps: Lower bound for the suggested client FPS
+        """
+        self.maxsize = max(1, maxsize)
+        self.hint_interval = hint_interval
+        self.rate_window = rate_window
+        self.min_fps = min_fps
+        self._cameras: Dict[CameraKey, CameraIngress] = {}
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def put(self, camera_id: str, user_id: Optional[str], frame: Any, now: Optional[float] = None) -> bool:
+        """
+        Enqueue a frame, dropping the oldest one if the queue is full.
+
+        Returns:
+            True if the frame was queued without dropping another
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            state = self._get_or_create(camera_key(user_id, camera_id))
+            state.received += 1
+            state.put_times.append(now)
+            self._trim(state.put_times, now)
+
+            dropped = False
+            while len(state.frames) >= self.maxsize:
+                state.frames.popleft()
+                state.dropped += 1
+                state.drop_times.append(now)
+                dropped = True
+            self._trim(state.drop_times, now)
+
+            state.frames.append(frame)
+            state.max_depth = max(state.max_depth, len(state.frames))
+            self._not_empty.notify_all()
+            return not dropped
+
+    def get(self, camera_id: str, user_id: Optional[str], timeout: Optional[float] = None) -> Optional[Any]:
+        """
+        Dequeue the oldest queued frame, waiting up to `timeout` seconds.
+
+        Returns:
+            Frame, or None on timeout
+        """
+        key = camera_key(user_id, camera_id)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._not_empty:
+            state = self._get_or_create(key)
+            while not state.frames:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._not_empty.wait(remaining)
+                state = self._get_or_create(key)
+            return self._pop(state)
+
+    def get_nowait(self, camera_id: str, user_id: Optional[str]) -> Optional[Any]:
+        """Dequeue a frame if one is queued (for asyncio handlers)"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            if state is None or not state.frames:
+                return None
+            return self._pop(state)
+
+    def depth(self, camera_id: str, user_id: Optional[str]) -> int:
+        """Frames currently queued for a camera"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            return len(state.frames) if state else 0
+
+    def backpressure_hint(self, camera_id: str, user_id: Optional[str],
+                          now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Backpressure message for the client, if one is due.
+
+        Hints are sent at most every `hint_interval` seconds while the
+        camera is dropping frames, and once when it recovers.
+
+        Returns:
+            {'type': 'backpressure', 'level': 'high'|'ok', 'suggested_fps': ...}
+            or None
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            if state is None or now - state.last_hint_ts < self.hint_interval:
+                return None
+
+            self._trim(state.drop_times, now)
+            level = 'high' if state.drop_times else 'ok'
+            if level == 'ok' and state.last_level == 'ok':
+                return None
+
+            state.last_hint_ts = now
+            state.last_level = level
+            fields = self._camera_fields(state, now)
+
+        suggested = None
+        if level == 'high':
+            suggested = round(max(self.min_fps, fields['processed_fps'] * HEADROOM), 2)
+        return {
+            'type': 'backpressure',
+            'cameraId': camera_id,
+            'level': level,
+            'suggested_fps': suggested,
+            **fields,
+        }
+
+    def get_camera_stats(self, camera_id: str, user_id: Optional[str],
+                         now: Optional[float] = None) -> Dict[str, Any]:
+        """Queue depth, counters and rates for one camera"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            if state is None:
+                return {'queue_depth': 0, 'received': 0, 'processed': 0, 'dropped': 0}
+            return {
+                'received': state.received,
+                'processed': state.processed,
+                'dropped': state.dropped,
+                'max_depth': state.max_depth,
+                **self._camera_fields(state, now),
+            }
+
+    def remove_camera(self, camera_id: str, user_id: Optional[str]):
+        """Drop the queue of a disconnected camera"""
+        with self._lock:
+            self._cameras.pop(camera_key(user_id, camera_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Totals over all cameras"""
+        with self._lock:
+            received = sum(s.received for s in self._cameras.values())
+            dropped = sum(s.dropped for s in self._cameras.values())
+            return {
+                'cameras': len(self._cameras),
+                'maxsize': self.maxsize,
+                'queued': sum(len(s.frames) for s in self._cameras.values()),
+                'received': received,
+                'dropped': dropped,
+                'drop_ratio': round(dropped / received, 4) if received else 0.0,
+            }
+
+    def _pop(self, state: CameraIngress) -> Any:
+        """Dequeue a frame (caller holds the lock)"""
+        now = time.monotonic()
+        state.processed += 1
+        state.get_times.append(now)
+        self._trim(state.get_times, now)
+        return state.frames.popleft()
+
+    def _camera_fields(self, state: CameraIngress, now: float) -> Dict[str, Any]:
+        """Depth, drop ratio and rates (caller holds the lock)"""
+        for times in (state.put_times, state.get_times, state.drop_times):
+            self._trim(times, now)
+        recent = len(state.put_times)
+        return {
+            'queue_depth': len(state.frames),
+            'max_queue': self.maxsize,
+            'drop_ratio': round(len(state.drop_times) / recent, 4) if recent else 0.0,
+            'input_fps': round(self._rate(state.put_times, now), 2),
+            'processed_fps': round(self._rate(state.get_times, now), 2),
+        }
+
+    def _get_or_create(self, key: CameraKey) -> CameraIngress:
+        """Get camera state (caller holds the lock)"""
+        state = self._cameras.get(key)
+        if state is None:
+            state = CameraIngress()
+            self._cameras[key] = state
+        return state
+
+    def _trim(self, times: Deque[float], now: float):
+        """Drop timestamps older than the rate window"""
+        cutoff = now - self.rate_window
+        while times and times[0] < cutoff:
+            times.popleft()
+
+    def _rate(self, times: Deque[float], now: float) -> float:
+        """Events per second over the retained history"""
+        if len(times) < 2:
+            return 0.0
+        span = max(now - times[0], 1e-6)
+        return (len(times) - 1) / span
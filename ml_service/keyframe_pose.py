@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Keyframe Pose Estimation
+================================================================================
+
+Runs YOLO pose only on keyframes and fills the frames in between by
+interpolating keypoints per tracked person.
+
+At 8-12 FPS per camera, full-rate pose estimation caps how many cameras a CPU
+node can serve. In keyframe mode pose runs every k-th frame; when the next
+keyframe arrives, the skipped frames are reconstructed by linear
+interpolation between the two keyframes for each person (matched by track
+ID) and appended to the 32-frame window in order. The window therefore lags
+by up to k-1 frames.
+
+k adapts to motion: fast-moving people (large per-frame joint displacement
+relative to their box height) drop k towards min_k, calm scenes raise it to
+max_k.
+
+Features:
+- Adaptive keyframe interval per camera (min_k .. max_k)
+- Per-track interpolation with confidence-aware joint handling
+- YOLO call / interpolated frame counters
+
+Usage:
+    from keyframe_pose import KeyframePoseEstimator
+
+    keyframes = KeyframePoseEstimator(max_k=4)
+
+    if keyframes.on_frame(camera_id):
+        pose = select_skeletons_from_result(yolo_model(frame, verbose=False)[0])
+        for kpts in keyframes.add_keyframe(camera_id, pose):
+            buffer.append(kpts)
+
+Offline accuracy/throughput evaluation: benchmarks/eval_keyframe_pose.py
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import numpy as np
+
+from pose_utils import KEYPOINT_CONF, MODEL_PERSONS, NUM_JOINTS, PoseResult
+from skeleton_tracker import SkeletonTracker
+
+# Defaults
+DEFAULT_MIN_K = 1
+DEFAULT_MAX_K = 4
+DEFAULT_MOTION_LOW = 0.01    # Per-frame displacement / box height => max_k
+DEFAULT_MOTION_HIGH = 0.05   # Per-frame displacement / box height => min_k
+
+
+@dataclass
+class CameraKeyframes:
+    """Keyframe state for one camera"""
+    tracker: SkeletonTracker = field(default_factory=SkeletonTracker)
+    k: int = DEFAULT_MIN_K
+    pending: int = 0                    # Frames since the last keyframe
+    prev_tracks: Dict[int, np.ndarray] = field(default_factory=dict)  # track -> (17, 3)
+    has_keyframe: bool = False
+    motion: float = 0.0
+    frames: int = 0
+    keyframes: int = 0
+    interpolated: int = 0
+
+
+def interpolate_skeleton(prev: np.ndarray, new: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Interpolate one (17, 3) skeleton between two keyframes.
+
+    Joints visible in both keyframes are interpolated linearly; otherwise the
+    joint from the nearer keyframe is used.
+    """
+    both = (prev[:, 2] > KEYPOINT_CONF) & (new[:, 2] > KEYPOINT_CONF)
+    nearer = prev if alpha < 0.5 else new
+    out = nearer.copy()
+    out[both] = prev[both] + alpha * (new[both] - prev[both])
+    return out
+
+
+def skeleton_motion(prev: np.ndarray, new: np.ndarray, box_height: float) -> float:
+    """Mean joint displacement between two skeletons, relative to box height"""
+    both = (prev[:, 2] > KEYPOINT_CONF) & (new[:, 2] > KEYPOINT_CONF)
+    if not both.any() or box_height <= 0:
+        return 0.0
+    disp = np.linalg.norm(new[both, :2] - prev[both, :2], axis=1)
+    return float(disp.mean() / box_height)
+
+
+class KeyframePoseEstimator:
+    """
+    Keyframe scheduling and keypoint interpolation for all cameras.
+
+    Supports:
+    - Per-camera adaptive keyframe interval
+    - Per-track interpolation for the model slots (top 2 people)
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        min_k: int = DEFAULT_MIN_K,
+        max_k: int = DEFAULT_MAX_K,
+        motion_low: float = DEFAULT_MOTION_LOW,
+        motion_high: float = DEFAULT_MOTION_HIGH,
+    ):
+        """
+        Initialize the estimator.
+
+        Args:
+            min_k: Keyframe interval under high motion (1 = every frame)
+            max_k: Keyframe interval for calm scenes
+            motion_low: Motion at or below which max_k is used
+            motion_high: Motion at or above which min_k is used
+        """
+        self.min_k = max(1, min_k)
+        self.max_k = max(self.min_k, max_k)
+        self.motion_low = motion_low
+        self.motion_high = motion_high
+        self._cameras: Dict[str, CameraKeyframes] = {}
+        self._lock = threading.Lock()
+
+    def on_frame(self, camera_id: str) -> bool:
+        """
+        Register an incoming frame.
+
+        Returns:
+            True if pose estimation should run on this frame (keyframe)
+        """
+        with self._lock:
+            state = self._get_or_create(camera_id)
+            state.frames += 1
+            state.pending += 1
+            return not state.has_keyframe or state.pending >= state.k
+
+    def add_keyframe(self, camera_id: str, pose: PoseResult) -> List[np.ndarray]:
+        """
+        Add a keyframe's pose and reconstruct the skipped frames.
+
+        Args:
+            camera_id: Camera identifier
+            pose: PoseResult for the keyframe
+
+        Returns:
+            (2, 17, 3) keypoint arrays to append to the window, oldest first
+            (interpolated frames followed by the keyframe itself)
+        """
+        with self._lock:
+            state = self._get_or_create(camera_id)
+            track_ids = state.tracker.update(pose.boxes)
+            gap = max(0, state.pending - 1) if state.has_keyframe else 0
+
+            slots = []
+            motions = []
+            for s in range(min(MODEL_PERSONS, len(track_ids))):
+                tid = track_ids[s]
+                new = pose.kpts[s]
+                prev = state.prev_tracks.get(tid)
+                slots.append((s, new, prev))
+                if prev is not None:
+                    height = float(pose.boxes[s][3] - pose.boxes[s][1])
+                    motions.append(skeleton_motion(prev, new, height) / (gap + 1))
+
+            frames = []
+            for j in range(1, gap + 1):
+                alpha = j / (gap + 1)
+                kpts = np.zeros((MODEL_PERSONS, NUM_JOINTS, 3), dtype=np.float32)
+                for s, new, prev in slots:
+                    kpts[s] = new if prev is None else interpolate_skeleton(prev, new, alpha)
+                frames.append(kpts)
+            frames.append(pose.kpts.copy())
+
+            state.prev_tracks = {
+                tid: pose.kpts_visual[i].copy() for i, tid in enumerate(track_ids)
+            }
+            state.has_keyframe = True
+            state.pending = 0
+            state.keyframes += 1
+            state.interpolated += gap
+            if motions:
+                state.motion = max(motions)
+            state.k = self._choose_k(state.motion)
+            return frames
+
+    def get_camera_stats(self, camera_id: str) -> Dict[str, Any]:
+        """Keyframe interval and savings for one camera"""
+        with self._lock:
+            state = self._cameras.get(camera_id)
+            if state is None:
+                return {'k': self.min_k, 'motion': 0.0, 'frames': 0, 'keyframes': 0, 'interpolated': 0}
+            return {
+                'k': state.k,
+                'motion': round(state.motion, 4),
+                'frames': state.frames,
+                'keyframes': state.keyframes,
+                'interpolated': state.interpolated,
+            }
+
+    def remove_camera(self, camera_id: str):
+        """Forget state for a disconnected camera"""
+        with self._lock:
+            self._cameras.pop(camera_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get overall keyframe statistics"""
+        with self._lock:
+            frames = sum(s.frames for s in self._cameras.values())
+            keyframes = sum(s.keyframes for s in self._cameras.values())
+            return {
+                'cameras': len(self._cameras),
+                'frames': frames,
+                'yolo_calls': keyframes,
+                'yolo_call_ratio': round(keyframes / frames, 3) if frames else 0.0,
+                'interpolated': sum(s.interpolated for s in self._cameras.values()),
+            }
+
+    def _choose_k(self, motion: float) -> int:
+        """Map motion magnitude to a keyframe interval"""
+        if motion >= self.motion_high:
+            return self.min_k
+        if motion <= self.motion_low:
+            return self.max_k
+        span = self.motion_high - self.motion_low
+        frac = (self.motion_high - motion) / span
+        return int(round(self.min_k + frac * (self.max_k - self.min_k)))
+
+    def _get_or_create(self, camera_id: str) -> CameraKeyframes:
+        """Get camera state (caller holds the lock)"""
+        state = self._cameras.get(camera_id)
+        if state is None:
+            state = CameraKeyframes(k=self.min_k)
+            self._cameras[camera_id] = state
+        return state
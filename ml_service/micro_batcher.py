@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Micro-Batcher
+================================================================================
+
+Dynamic micro-batching for inference calls shared across cameras.
+
+Requests are submitted under a key (for example a model name). A worker
+thread collects pending requests for the same key until either the batch is
+full or the oldest request has waited for the deadline, runs one batched call
+and scatters the results back to the callers' futures.
+
+Features:
+- Per-key queues (only requests for the same model are batched together)
+- Max batch size and max queueing delay
+- Futures-based API usable from threads and asyncio (asyncio.wrap_future)
+- Batch-size histogram, queueing delay and run time metrics
+
+Usage:
+    from micro_batcher import MicroBatcher
+
+    def run_batch(key, items):
+        return [model(x) for x in items]      # one result per item, in order
+
+    batcher = MicroBatcher(run_batch, max_batch_size=8, max_delay_ms=10)
+    batcher.start()
+
+    future = batcher.submit('STGCNPP_Kaggle_NTU', window)
+    result = future.result()
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import time
+import threading
+from collections import deque, Counter
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Sequence
+
+# Defaults
+DEFAULT_MAX_BATCH_SIZE = 8
+DEFAULT_MAX_DELAY_MS = 10.0
+STATS_HISTORY = 2048  # samples kept for latency percentiles
+
+
+@dataclass
+class PendingItem:
+    """A submitted request waiting to be batched"""
+    item: Any
+    future: Future
+    enqueued_at: float
+
+
+def _percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of a small sample"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class BatchStats:
+    """Thread-safe batch size / latency accounting"""
+
+    def __init__(self, history: int = STATS_HISTORY):
+        self._lock = threading.Lock()
+        self._sizes: Counter = Counter()
+        self._queue_delays: Deque[float] = deque(maxlen=history)
+        self._run_times: Deque[float] = deque(maxlen=history)
+        self._batches = 0
+        self._items = 0
+        self._errors = 0
+
+    def record(self, batch_size: int, queue_delays_ms: List[float], run_ms: float):
+        """Record one executed batch"""
+        with self._lock:
+            self._batches += 1
+            self._items += batch_size
+            self._sizes[batch_size] += 1
+            self._queue_delays.extend(queue_delays_ms)
+            self._run_times.append(run_ms)
+
+    def record_error(self):
+        """Record a failed batch"""
+        with self._lock:
+            self._errors += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics"""
+        with self._lock:
+            delays = list(self._queue_delays)
+            runs = list(self._run_times)
+            return {
+                'batches': self._batches,
+                'items': self._items,
+                'errors': self._errors,
+                'avg_batch_size': round(self._items / self._batches, 2) if self._batches else 0.0,
+                'batch_size_histogram': dict(sorted(self._sizes.items())),
+                'queue_delay_ms': {
+                    'p50': round(_percentile(delays, 50), 2),
+                    'p95': round(_percentile(delays, 95), 2),
+                    'max': round(max(delays), 2) if delays else 0.0,
+                },
+                'run_ms': {
+                    'p50': round(_percentile(runs, 50), 2),
+                    'p95': round(_percentile(runs, 95), 2),
+                },
+            }
+
+
+class MicroBatcher:
+    """
+    Collects requests per key and runs them as batches on a worker thread.
+
+    `run_batch(key, items)` must return one result per item, in order.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[Hashable, List[Any]], Sequence[Any]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay_ms: float = DEFAULT_MAX_DELAY_MS,
+        name: str = 'MicroBatcher',
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            run_batch: Callable executing one batch for a key
+            max_batch_size: Maximum requests per batch
+            max_delay_ms: Maximum time the oldest request waits before its
+                batch is dispatched (even if not full)
+            name: Name used for the worker thread and log lines
+        """
+        self.run_batch = run_batch
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_delay = max_delay_ms / 1000.0
+        self.name = name
+
+        self._queues: Dict[Hashable, Deque[PendingItem]] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self.stats = BatchStats()
+        self.key_stats: Dict[Hashable, BatchStats] = {}
+
+    def start(self):
+        """Start the worker thread"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._worker, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the worker; pending requests are cancelled"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._cond:
+            for queue in self._queues.values():
+                while queue:
+                    queue.popleft().future.cancel()
+
+    def submit(self, key: Hashable, item: Any) -> Future:
+        """
+        Queue an item for batched execution.
+
+        Args:
+            key: Batching key; only items with the same key share a batch
+            item: Request payload passed to run_batch
+
+        Returns:
+            Future resolved with this item's result
+        """
+        future: Future = Future()
+        with self._cond:
+            if not self._running:
+                raise RuntimeError(f"{self.name} is not running")
+            queue = self._queues.setdefault(key, deque())
+            queue.append(PendingItem(item, future, time.perf_counter()))
+            self._cond.notify()
+        return future
+
+    def pending(self) -> int:
+        """Number of requests waiting to be batched"""
+        with self._cond:
+            return sum(len(q) for q in self._queues.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics"""
+        stats = self.stats.get_stats()
+        stats['pending'] = self.pending()
+        stats['max_batch_size'] = self.max_batch_size
+        stats['max_delay_ms'] = round(self.max_delay * 1000, 2)
+        return stats
+
+    def get_key_stats(self) -> Dict[Hashable, Dict[str, Any]]:
+        """Get batching statistics per key"""
+        return {key: s.get_stats() for key, s in list(self.key_stats.items())}
+
+    def _stats_for(self, key: Hashable) -> BatchStats:
+        """Per-key stats (worker thread only)"""
+        stats = self.key_stats.get(key)
+        if stats is None:
+            stats = self.key_stats[key] = BatchStats()
+        return stats
+
+    def _next_batch(self):
+        """
+        Wait for a dispatchable batch (caller holds the condition).
+
+        Returns:
+            (key, [PendingItem]) or None when stopping
+        """
+        while self._running:
+            now = time.perf_counter()
+            ready_key = None
+            oldest_key = None
+            oldest_ts = None
+
+            for key, queue in self._queues.items():
+                if not queue:
+                    continue
+                if len(queue) >= self.max_batch_size:
+                    ready_key = key
+                    break
+                if oldest_ts is None or queue[0].enqueued_at < oldest_ts:
+                    oldest_key, oldest_ts = key, queue[0].enqueued_at
+
+            if ready_key is None and oldest_key is not None:
+                if now - oldest_ts >= self.max_delay:
+                    ready_key = oldest_key
+
+            if ready_key is not None:
+                queue = self._queues[ready_key]
+                count = min(len(queue), self.max_batch_size)
+                return ready_key, [queue.popleft() for _ in range(count)]
+
+            timeout = None if oldest_ts is None else max(0.0, oldest_ts + self.max_delay - now)
+            self._cond.wait(timeout)
+        return None
+
+    def _worker(self):
+        """Worker loop: dispatch batches until stopped"""
+        while True:
+            with self._cond:
+                batch = self._next_batch()
+            if batch is None:
+                return
+
+            key, pending = batch
+            # Callers may have cancelled while queued
+            pending = [p for p in pending if p.future.set_running_or_notify_cancel()]
+            if not pending:
+                continue
+
+            start = time.perf_counter()
+            queue_delays = [(start - p.enqueued_at) * 1000 for p in pending]
+
+            try:
+                results = self.run_batch(key, [p.item for p in pending])
+                if len(results) != len(pending):
+                    raise RuntimeError(
+                        f"run_batch returned {len(results)} results for {len(pending)} items"
+                    )
+            except Exception as e:
+                print(f"[{self.name}] Batch error for {key}: {e}")
+                self.stats.record_error()
+                self._stats_for(key).record_error()
+                for p in pending:
+                    p.future.set_exception(e)
+                continue
+
+            run_ms = (time.perf_counter() - start) * 1000
+            self.stats.record(len(pending), queue_delays, run_ms)
+            self._stats_for(key).record(len(pending), queue_delays, run_ms)
+            for p, result in zip(pending, results):
+                p.future.set_result(result)
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Load-Aware Model Downgrade
+================================================================================
+
+Switches cameras to cheaper model pairs while the node is overloaded.
+
+MODEL_PATHS already ships light-finetuned PRIMARY checkpoints
+(STGCNPP_*_lightft). When queues grow or latency climbs, the controller
+steps the node down one mode at a time:
+
+    full           User's PRIMARY + VETO (as configured)
+    light_primary  PRIMARY replaced by its _lightft variant, VETO unchanged
+    single_model   _lightft PRIMARY only (smart_veto_enabled = False)
+
+and steps back up once load subsides. Hysteresis avoids flapping: load must
+be above the high marks for escalate_after seconds to step down, below the
+low marks (a fraction of the high ones) for recover_after seconds to step up,
+and every change holds for at least min_dwell seconds.
+
+The node mode applies to every camera. Two exceptions adjust it:
+- A tenant can be pinned to a mode (force_tenant), e.g. a premium tenant
+  kept on full or a noisy one sent to single_model.
+- Cameras whose priority (risk_scheduler) is at least protect_priority get
+  one level less downgrade, so likely incidents keep the VETO pass longer.
+
+Note that single_model drops the VETO filter: VIOLENCE then only needs
+PRIMARY >= threshold, with the false-positive rate of PRIMARY alone. It is
+the last resort before admission control sheds cameras.
+
+Cameras report the mode they actually run in: a PRIMARY without a _lightft
+variant (e.g. any MSG3D) is unchanged by light_primary, so such a camera
+stays on full (not downgraded) until the node reaches single_model. Cameras
+are keyed by (userId, cameraId) (camera_hub.camera_key).
+
+The lightft checkpoints must be loaded in the GCNBatcher alongside the
+full models for the switch to be instant.
+
+Usage:
+    from model_downgrade import LoadAwareDowngrader
+
+    downgrader = LoadAwareDowngrader(high_queue_depth=8, high_p95_ms=250)
+
+    # Periodically, from pipeline / batcher stats
+    downgrader.observe(queue_depth, p95_ms)
+
+    # Per window
+    config = downgrader.apply(camera_id, user_id, user_config, priority=risk.priority(camera_id, user_id))
+    result = cascade.evaluate(window, config)
+    response.update(downgrader.response_fields(camera_id, user_id))
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from camera_hub import CameraKey, camera_key
+from user_config_manager import DEFAULT_CONFIG, MODEL_ARCHITECTURES, MODEL_PATHS
+
+# Modes, cheapest last
+MODE_FULL = 'full'
+MODE_LIGHT_PRIMARY = 'light_primary'
+MODE_SINGLE_MODEL = 'single_model'
+MODES = (MODE_FULL, MODE_LIGHT_PRIMARY, MODE_SINGLE_MODEL)
+
+# Defaults
+DEFAULT_HIGH_QUEUE_DEPTH = 8        # Pending windows per node
+DEFAULT_HIGH_P95_MS = 250.0         # End-to-end window latency
+DEFAULT_LOW_RATIO = 0.5             # Low marks = high marks * ratio
+DEFAULT_ESCALATE_AFTER = 3.0        # Seconds above high marks before stepping down
+DEFAULT_RECOVER_AFTER = 30.0        # Seconds below low marks before stepping up
+DEFAULT_MIN_DWELL = 10.0            # Minimum seconds between mode changes
+DEFAULT_PROTECT_PRIORITY = 0.5      # Camera priority that earns one level less
+LIGHTFT_SUFFIX = '_lightft'
+
+
+def light_variant(model_name: str) -> str:
+    """Light-finetuned checkpoint for a model (the model itself if none)"""
+    if model_name.endswith(LIGHTFT_SUFFIX):
+        return model_name
+    candidate = model_name + LIGHTFT_SUFFIX
+    return candidate if candidate in MODEL_PATHS else model_name
+
+
+@dataclass
+class CameraMode:
+    """Mode last applied to a camera"""
+    mode: str = MODE_FULL
+    primary_model: str = ''
+    veto_model: Optional[str] = None
+    windows: int = 0
+    downgraded_windows: int = 0
+
+
+class LoadAwareDowngrader:
+    """
+    Node-level model downgrade with hysteresis.
+
+    Supports:
+    - Queue depth and p95 latency triggers
+    - Per-tenant pinned modes and per-camera protection
+    - Per-camera reporting in responses and metrics
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        high_queue_depth: float = DEFAULT_HIGH_QUEUE_DEPTH,
+        high_p95_ms: float = DEFAULT_HIGH_P95_MS,
+        low_ratio: float = DEFAULT_LOW_RATIO,
+        escalate_after: float = DEFAULT_ESCALATE_AFTER,
+        recover_after: float = DEFAULT_RECOVER_AFTER,
+        min_dwell: float = DEFAULT_MIN_DWELL,
+        protect_priority: float = DEFAULT_PROTECT_PRIORITY,
+    ):
+        """
+        Initialize the downgrader.
+
+        Args:
+            high_queue_depth: Queue depth counted as overload
+            high_p95_ms: p95 latency (ms) counted as overload
+            low_ratio: Fraction of the high marks below which load has subsided
+            escalate_after: Seconds of overload before stepping down a mode
+            recover_after: Seconds of low load before stepping up a mode
+            min_dwell: Minimum seconds between mode changes
+            protect_priority: Camera priority at which one level is spared
+        """
+        self.high_queue_depth = high_queue_depth
+        self.high_p95_ms = high_p95_ms
+        self.low_ratio = low_ratio
+        self.escalate_after = escalate_after
+        self.recover_after = recover_after
+        self.min_dwell = min_dwell
+        self.protect_priority = protect_priority
+
+        self._level = 0
+        self._changed_at = float('-inf')
+        self._over_since: Optional[float] = None
+        self._under_since: Optional[float] = None
+        self._last_load: Dict[str, float] = {'queue_depth': 0.0, 'p95_ms': 0.0}
+        self._tenant_modes: Dict[str, str] = {}
+        self._cameras: Dict[CameraKey, CameraMode] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self.downgrades = 0
+        self.upgrades = 0
+
+    @property
+    def mode(self) -> str:
+        """Current node mode"""
+        return MODES[self._level]
+
+    def observe(self, queue_depth: float, p95_ms: float, now: Optional[float] = None) -> str:
+        """
+        Feed current load and step the node mode if warranted.
+
+        Args:
+            queue_depth: Windows waiting for inference
+            p95_ms: p95 window latency over the recent past
+            now: Current time (defaults to time.monotonic())
+
+        Returns:
+            Node mode after this observation
+        """
+        now = time.monotonic() if now is None else now
+
+        with self._lock:
+            self._last_load = {'queue_depth': queue_depth, 'p95_ms': p95_ms}
+            over = queue_depth >= self.high_queue_depth or p95_ms >= self.high_p95_ms
+            under = (queue_depth <= self.high_queue_depth * self.low_ratio
+                     and p95_ms <= self.high_p95_ms * self.low_ratio)
+
+            if not over:
+                self._over_since = None
+            elif self._over_since is None:
+                self._over_since = now
+            if not under:
+                self._under_since = None
+            elif self._under_since is None:
+                self._under_since = now
+            if now - self._changed_at < self.min_dwell:
+                return self.mode
+
+            if over and self._level < len(MODES) - 1 and now - self._over_since >= self.escalate_after:
+                self._set_level(self._level + 1, now, queue_depth, p95_ms)
+                self.downgrades += 1
+            elif under and self._level > 0 and now - self._under_since >= self.recover_after:
+                self._set_level(self._level - 1, now, queue_depth, p95_ms)
+                self.upgrades += 1
+            return self.mode
+
+    def force_tenant(self, user_id: str, mode: Optional[str]):
+        """
+        Pin a tenant to a mode (None = follow the node mode).
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode is not None and mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {MODES}")
+        with self._lock:
+            if mode is None:
+                self._tenant_modes.pop(user_id, None)
+            else:
+                self._tenant_modes[user_id] = mode
+
+    def apply(
+        self,
+        camera_id: str,
+        user_id: Optional[str],
+        config: Optional[Dict[str, Any]] = None,
+        priority: float = 0.0,
+    ) -> Dict[str, Any]:
+        """
+        Effective configuration for a camera's next window.
+
+        Args:
+            camera_id: Camera identifier
+            user_id: Tenant (userId)
+            config: User configuration (defaults to DEFAULT_CONFIG)
+            priority: Camera priority (e.g. RiskAdaptiveController.priority)
+
+        Returns:
+            Copy of config with models / smart_veto_enabled adjusted
+        """
+        config = config or DEFAULT_CONFIG
+        with self._lock:
+            pinned = self._tenant_modes.get(user_id) if user_id else None
+            if pinned is not None:
+                level = MODES.index(pinned)
+            else:
+                level = self._level
+                if level > 0 and priority >= self.protect_priority:
+                    level -= 1
+
+            configured = config.get('primary_model', DEFAULT_CONFIG['primary_model'])
+            veto_enabled = config.get('smart_veto_enabled', True)
+            effective = dict(config)
+            if level >= 1:
+                primary = light_variant(configured)
+                effective['primary_model'] = primary
+                effective['primary_architecture'] = MODEL_ARCHITECTURES.get(primary, 'STGCNPP')
+                if primary in MODEL_PATHS:
+                    effective['primary_model_path'] = MODEL_PATHS[primary]
+            if level >= 2:
+                effective['smart_veto_enabled'] = False
+
+            # Mode actually in effect: a level that changes no model is not a downgrade
+            primary = effective.get('primary_model', DEFAULT_CONFIG['primary_model'])
+            if veto_enabled and not effective.get('smart_veto_enabled', True):
+                mode = MODE_SINGLE_MODEL
+            elif primary != configured:
+                mode = MODE_LIGHT_PRIMARY
+            else:
+                mode = MODE_FULL
+
+            state = self._cameras.setdefault(camera_key(user_id, camera_id), CameraMode())
+            if state.mode != mode and state.windows:
+                print(f"[Downgrade] {user_id}/{camera_id}: {state.mode} -> {mode}")
+            state.mode = mode
+            state.primary_model = primary
+            state.veto_model = (effective.get('veto_model', DEFAULT_CONFIG['veto_model'])
+                                if effective.get('smart_veto_enabled', True) else None)
+            state.windows += 1
+            if mode != MODE_FULL:
+                state.downgraded_windows += 1
+            return effective
+
+    def response_fields(self, camera_id: str, user_id: Optional[str]) -> Dict[str, Any]:
+        """Fields to merge into the per-frame WebSocket response"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            if state is None:
+                return {}
+            return {
+                'model_mode': {
+                    'mode': state.mode,
+                    'downgraded': state.mode != MODE_FULL,
+                    'primary_model': state.primary_model,
+                    'veto_model': state.veto_model,
+                }
+            }
+
+    def get_camera_stats(self, camera_id: str, user_id: Optional[str]) -> Dict[str, Any]:
+        """Mode and downgraded window count for one camera"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            if state is None:
+                return {}
+            return {
+                'mode': state.mode,
+                'primary_model': state.primary_model,
+                'veto_model': state.veto_model,
+                'windows': state.windows,
+                'downgraded_windows': state.downgraded_windows,
+            }
+
+    def remove_camera(self, camera_id: str, user_id: Optional[str]):
+        """Forget a disconnected camera"""
+        with self._lock:
+            self._cameras.pop(camera_key(user_id, camera_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Node mode, load and cameras per mode"""
+        with self._lock:
+            per_mode = {mode: 0 for mode in MODES}
+            for state in self._cameras.values():
+                per_mode[state.mode] += 1
+            return {
+                'mode': self.mode,
+                'load': dict(self._last_load),
+                'cameras_per_mode': per_mode,
+                'pinned_tenants': dict(self._tenant_modes),
+                'downgrades': self.downgrades,
+                'upgrades': self.upgrades,
+            }
+
+    def _set_level(self, level: int, now: float, queue_depth: float, p95_ms: float):
+        """Change the node mode (caller holds the lock)"""
+        print(f"[Downgrade] Node mode {MODES[self._level]} -> {MODES[level]} "
+              f"(queue {queue_depth:.0f}, p95 {p95_ms:.0f} ms)")
+        self._level = level
+        self._changed_at = now
+        self._over_since = None
+        self._under_since = None
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Motion Gate
+================================================================================
+
+Server-side motion gate in front of the YOLO pose call.
+
+Cameras send frames continuously, but most consecutive frames are nearly
+identical. The gate compares a heavily downsampled grayscale version of each
+decoded frame against the frame pose was last run on. While the changed-pixel
+fraction stays below the threshold, the previous frame's keypoints are reused
+instead of running YOLO again. A forced refresh interval bounds how stale the
+reused keypoints can get.
+
+State is keyed by (userId, cameraId) (camera_hub.camera_key), so cached
+keypoints are never returned for another tenant's same-named camera.
+
+Features:
+- Frame differencing on a ~64 px wide grayscale thumbnail (strided, no resize)
+- Configurable sensitivity (per-pixel delta and changed-pixel fraction)
+- Forced refresh after N skipped frames
+- Skip ratio and estimated pose latency saved, per camera and overall
+
+Usage:
+    from motion_gate import MotionGate
+
+    gate = MotionGate(motion_threshold=0.01, max_skip_frames=15)
+
+    if gate.should_run_pose(camera_id, user_id, frame):
+        start = time.perf_counter()
+        pose = select_skeletons_from_result(yolo_model(frame, verbose=False)[0])
+        gate.update_pose(camera_id, user_id, pose, (time.perf_counter() - start) * 1000)
+    else:
+        pose = gate.cached_pose(camera_id, user_id)
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from camera_hub import CameraKey, camera_key
+
+# Defaults
+DEFAULT_THUMB_WIDTH = 64         # Thumbnail width used for differencing
+DEFAULT_PIXEL_THRESHOLD = 15     # Grayscale delta (0-255) counted as change
+DEFAULT_MOTION_THRESHOLD = 0.01  # Fraction of changed pixels that means motion
+DEFAULT_MAX_SKIP_FRAMES = 15     # Forced pose refresh after this many skips
+EMA_ALPHA = 0.1                  # Smoothing for pose latency estimate
+
+
+@dataclass
+class CameraGate:
+    """Gate state for one camera"""
+    reference: Optional[np.ndarray] = None   # Thumbnail pose last ran on
+    pose: Any = None                         # Last PoseResult
+    skipped_in_row: int = 0
+    last_motion: float = 0.0
+    frames: int = 0
+    skipped: int = 0
+    pose_ms_ema: float = 0.0
+    saved_ms: float = 0.0
+
+
+def thumbnail(frame: np.ndarray, width: int = DEFAULT_THUMB_WIDTH) -> np.ndarray:
+    """
+    Cheap grayscale thumbnail via strided sampling.
+
+    Args:
+        frame: Decoded frame (H, W, 3) or (H, W)
+        width: Approximate output width
+
+    Returns:
+        int16 array suitable for differencing
+    """
+    step = max(1, frame.shape[1] // width)
+    small = frame[::step, ::step]
+    if small.ndim == 3:
+        # Integer luma approximation: (B + 2G + R) / 4 for BGR frames
+        small = (small[..., 0].astype(np.int16) + 2 * small[..., 1].astype(np.int16)
+                 + small[..., 2].astype(np.int16)) >> 2
+    return small.astype(np.int16, copy=False)
+
+
+class MotionGate:
+    """
+    Decides per frame whether pose estimation must run.
+
+    Supports:
+    - Per-camera reference thumbnails and cached keypoints
+    - Forced refresh interval
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        motion_threshold: float = DEFAULT_MOTION_THRESHOLD,
+        pixel_threshold: int = DEFAULT_PIXEL_THRESHOLD,
+        max_skip_frames: int = DEFAULT_MAX_SKIP_FRAMES,
+        thumb_width: int = DEFAULT_THUMB_WIDTH,
+    ):
+        """
+        Initialize the gate.
+
+        Args:
+            motion_threshold: Changed-pixel fraction at or above which pose runs
+                (lower = more sensitive)
+            pixel_threshold: Grayscale delta counted as a changed pixel
+            max_skip_frames: Consecutive skips before a forced refresh
+            thumb_width: Thumbnail width used for differencing
+        """
+        self.motion_threshold = motion_threshold
+        self.pixel_threshold = pixel_threshold
+        self.max_skip_frames = max_skip_frames
+        self.thumb_width = thumb_width
+        self._cameras: Dict[CameraKey, CameraGate] = {}
+        self._lock = threading.Lock()
+
+    def motion_score(self, camera_id: str, user_id: Optional[str]) -> float:
+        """Changed-pixel fraction of the camera's latest frame"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            return state.last_motion if state else 0.0
+
+    def should_run_pose(self, camera_id: str, user_id: Optional[str], frame: np.ndarray) -> bool:
+        """
+        Decide whether YOLO must run on this frame.
+
+        Args:
+            camera_id: Camera identifier
+            user_id: Tenant (userId)
+            frame: Decoded frame
+
+        Returns:
+            True to run pose estimation, False to reuse cached keypoints
+        """
+        thumb = thumbnail(frame, self.thumb_width)
+
+        with self._lock:
+            state = self._cameras.setdefault(camera_key(user_id, camera_id), CameraGate())
+            state.frames += 1
+
+            if state.reference is None or state.pose is None or state.reference.shape != thumb.shape:
+                state.reference = thumb
+                state.last_motion = 1.0
+                return True
+
+            changed = np.count_nonzero(np.abs(thumb - state.reference) > self.pixel_threshold)
+            state.last_motion = float(changed) / thumb.size
+
+            if state.last_motion >= self.motion_threshold or state.skipped_in_row >= self.max_skip_frames:
+                state.reference = thumb
+                return True
+
+            state.skipped_in_row += 1
+            state.skipped += 1
+            state.saved_ms += state.pose_ms_ema
+            return False
+
+    def update_pose(self, camera_id: str, user_id: Optional[str], pose: Any, pose_ms: float):
+        """
+        Store fresh keypoints after pose estimation ran.
+
+        Args:
+            camera_id: Camera identifier
+            user_id: Tenant (userId)
+            pose: PoseResult for the frame
+            pose_ms: YOLO + post-processing latency in ms
+        """
+        with self._lock:
+            state = self._cameras.setdefault(camera_key(user_id, camera_id), CameraGate())
+            state.pose = pose
+            state.skipped_in_row = 0
+            if state.pose_ms_ema == 0.0:
+                state.pose_ms_ema = pose_ms
+            else:
+                state.pose_ms_ema += EMA_ALPHA * (pose_ms - state.pose_ms_ema)
+
+    def cached_pose(self, camera_id: str, user_id: Optional[str]) -> Any:
+        """Keypoints from the last frame pose estimation ran on"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            return state.pose if state else None
+
+    def remove_camera(self, camera_id: str, user_id: Optional[str]):
+        """Forget state for a disconnected camera"""
+        with self._lock:
+            self._cameras.pop(camera_key(user_id, camera_id), None)
+
+    def get_camera_stats(self, camera_id: str, user_id: Optional[str]) -> Dict[str, Any]:
+        """Skip ratio and latency saved for one camera"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            if state is None:
+                return {'frames': 0, 'skipped': 0, 'skip_ratio': 0.0, 'saved_ms': 0.0, 'motion': 0.0}
+            return {
+                'frames': state.frames,
+                'skipped': state.skipped,
+                'skip_ratio': round(state.skipped / state.frames, 3) if state.frames else 0.0,
+                'saved_ms': round(state.saved_ms, 1),
+                'motion': round(state.last_motion, 4),
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get overall gate statistics"""
+        with self._lock:
+            frames = sum(s.frames for s in self._cameras.values())
+            skipped = sum(s.skipped for s in self._cameras.values())
+            return {
+                'cameras': len(self._cameras),
+                'frames': frames,
+                'skipped': skipped,
+                'skip_ratio': round(skipped / frames, 3) if frames else 0.0,
+                'saved_ms': round(sum(s.saved_ms for s in self._cameras.values()), 1),
+            }
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Occupancy Tracker
+================================================================================
+
+Empty-scene fast path for the Smart Veto models.
+
+When YOLO finds no valid people the model input `kpts` is all zeros, yet the
+32-frame window could still be scored by both graph networks. The occupancy
+tracker counts, per camera, how many frames of the current window contain a
+valid skeleton. Windows at or below the occupancy threshold are answered
+with a cached SAFE result and no model execution.
+
+Features:
+- Per-camera count of occupied frames in the current window (O(1) per frame)
+- Configurable minimum occupied frames before the models run
+- Cached SAFE response flagged with `empty_scene: true`
+- Skipped / executed window counters
+- Cameras keyed by (userId, cameraId) (camera_hub.camera_key)
+
+Usage:
+    from occupancy import OccupancyTracker
+
+    occupancy = OccupancyTracker(min_occupied_frames=2)
+
+    occupancy.update(camera_id, user_id, pose.num_valid)
+    if occupancy.is_empty(camera_id, user_id):
+        response.update(occupancy.empty_result(camera_id, user_id))
+    else:
+        result = cascade.evaluate(buffer.window(), config)
+        occupancy.mark_scored(camera_id, user_id)
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional
+
+from camera_hub import CameraKey, camera_key
+from skeleton_buffer import WINDOW_SIZE
+
+# Defaults
+DEFAULT_MIN_OCCUPIED_FRAMES = 2   # <= 1 frame with people in 32 = empty scene
+
+# Cached response for empty windows (percent scores, like the live response)
+EMPTY_SCENE_RESULT = {
+    'primary': 0.0,
+    'veto': None,
+    'result': 'SAFE',
+    'veto_skipped': True,
+    'empty_scene': True,
+}
+
+
+@dataclass
+class CameraOccupancy:
+    """Occupancy state for one camera"""
+    history: Deque[bool] = field(default_factory=lambda: deque(maxlen=WINDOW_SIZE))
+    occupied: int = 0           # Occupied frames within history
+    skipped_windows: int = 0
+    scored_windows: int = 0
+
+
+class OccupancyTracker:
+    """
+    Tracks whether each camera's current window contains people.
+
+    Supports:
+    - Per-camera rolling occupancy over the model window
+    - Empty-scene fast path with a cached SAFE result
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        min_occupied_frames: int = DEFAULT_MIN_OCCUPIED_FRAMES,
+        window_size: int = WINDOW_SIZE,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            min_occupied_frames: Frames with at least one valid skeleton
+                required before the models run on a window
+            window_size: Frames per model window
+        """
+        self.min_occupied_frames = min_occupied_frames
+        self.window_size = window_size
+        self._cameras: Dict[CameraKey, CameraOccupancy] = {}
+        self._lock = threading.Lock()
+
+    def update(self, camera_id: str, user_id: Optional[str], num_valid: int):
+        """
+        Record the number of valid skeletons in a new frame.
+
+        Args:
+            camera_id: Camera identifier
+            user_id: Tenant (userId)
+            num_valid: Valid (deduplicated) people found in the frame
+        """
+        occupied = num_valid > 0
+        with self._lock:
+            state = self._get_or_create(camera_key(user_id, camera_id))
+            if len(state.history) == state.history.maxlen and state.history[0]:
+                state.occupied -= 1
+            state.history.append(occupied)
+            if occupied:
+                state.occupied += 1
+
+    def occupied_frames(self, camera_id: str, user_id: Optional[str]) -> int:
+        """Frames with people in the camera's current window"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            return state.occupied if state else 0
+
+    def is_empty(self, camera_id: str, user_id: Optional[str]) -> bool:
+        """True if the current window can skip model execution"""
+        return self.occupied_frames(camera_id, user_id) < self.min_occupied_frames
+
+    def empty_result(self, camera_id: str, user_id: Optional[str]) -> Dict[str, Any]:
+        """
+        Cached SAFE result for an empty window (counts as a skipped window).
+
+        Returns:
+            Response fields to merge into the live response
+        """
+        with self._lock:
+            state = self._get_or_create(camera_key(user_id, camera_id))
+            state.skipped_windows += 1
+            occupied = state.occupied
+        return {**EMPTY_SCENE_RESULT, 'occupied_frames': occupied}
+
+    def mark_scored(self, camera_id: str, user_id: Optional[str]):
+        """Record that a window went through the models"""
+        with self._lock:
+            self._get_or_create(camera_key(user_id, camera_id)).scored_windows += 1
+
+    def remove_camera(self, camera_id: str, user_id: Optional[str]):
+        """Forget state for a disconnected camera"""
+        with self._lock:
+            self._cameras.pop(camera_key(user_id, camera_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fast-path statistics"""
+        with self._lock:
+            skipped = sum(s.skipped_windows for s in self._cameras.values())
+            scored = sum(s.scored_windows for s in self._cameras.values())
+            empty = sum(1 for s in self._cameras.values() if s.occupied < self.min_occupied_frames)
+            total = skipped + scored
+            return {
+                'cameras': len(self._cameras),
+                'empty_cameras': empty,
+                'skipped_windows': skipped,
+                'scored_windows': scored,
+                'skip_ratio': round(skipped / total, 3) if total else 0.0,
+            }
+
+    def _get_or_create(self, key: CameraKey) -> CameraOccupancy:
+        """Get camera state (caller holds the lock)"""
+        state = self._cameras.get(key)
+        if state is None:
+            state = CameraOccupancy(history=deque(maxlen=self.window_size))
+            self._cameras[key] = state
+        return state
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision ONNX CPU Backend
+================================================================================
+
+ONNX export, dynamic int8 quantization and ONNX Runtime inference for the
+Smart Veto graph networks (STGCNPP / MSG3D).
+
+Edge boxes have no GPU, and eager PyTorch leaves a lot of CPU performance
+unused. Each registered checkpoint can be exported to an ONNX graph (dynamic
+batch axis) and optionally quantized with dynamic int8 weights
+(onnxruntime.quantization.quantize_dynamic). At runtime the backend is
+chosen per model:
+
+    torch      Eager PyTorch (default)
+    onnx       fp32 ONNX Runtime graph, all graph optimizations enabled
+    onnx-int8  Dynamically quantized int8 graph
+
+from MODEL_BACKENDS / DEFAULT_MODEL_BACKEND in user_config_manager, or the
+NEXARA_MODEL_BACKENDS environment variable, e.g.
+
+    NEXARA_MODEL_BACKENDS="default=onnx,MSG3D_Kaggle_NTU=onnx-int8"
+
+OnnxModel is called like the torch module it replaces (torch tensor in,
+logits tensor out), so GCNBatcher and the benchmarks use it unchanged. If
+onnxruntime or the exported graph is missing, the model falls back to torch.
+
+Quantization changes scores slightly; check with
+benchmarks/eval_onnx_parity.py on recorded windows before enabling
+onnx-int8 for a model, since PRIMARY (94%) and VETO (85%) thresholds sit
+close to the decision boundary.
+
+Export:
+    python3 onnx_backend.py --loader smart_veto_final:load_model --int8
+    python3 onnx_backend.py --loader smart_veto_final:load_model \\
+        --models STGCNPP_Kaggle_NTU MSG3D_Kaggle_NTU --out-dir /tmp/onnx
+
+Usage:
+    from onnx_backend import load_gcn_model
+
+    primary_model = load_gcn_model('STGCNPP_Kaggle_NTU', load_model)
+    batcher = GCNBatcher({'STGCNPP_Kaggle_NTU': primary_model, ...})
+
+Benchmark: benchmarks/bench_onnx_backend.py
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from user_config_manager import (DEFAULT_MODEL_BACKEND, MODEL_ARCHITECTURES, MODEL_BACKENDS,
+                                 MODEL_PATHS, ONNX_MODEL_DIR)
+
+try:
+    import onnxruntime as ort
+except ImportError:  # Optional: only needed for the onnx backends
+    ort = None
+
+BACKEND_TORCH = 'torch'
+BACKEND_ONNX = 'onnx'
+BACKEND_ONNX_INT8 = 'onnx-int8'
+BACKENDS = (BACKEND_TORCH, BACKEND_ONNX, BACKEND_ONNX_INT8)
+
+# Defaults
+DEFAULT_OPSET = 17
+INPUT_SHAPE = (1, 2, 32, 17, 3)     # (N, M, T, V, C), see gcn_batcher.stack_windows
+INPUT_NAME = 'skeletons'
+OUTPUT_NAME = 'logits'
+BACKENDS_ENV = 'NEXARA_MODEL_BACKENDS'
+
+
+def onnx_path(model_name: str, int8: bool = False, out_dir: str = ONNX_MODEL_DIR) -> str:
+    """Location of a model's exported graph"""
+    return os.path.join(out_dir, f"{model_name}{'.int8' if int8 else ''}.onnx")
+
+
+def parse_backend_overrides(value: Optional[str]) -> Dict[str, str]:
+    """
+    Parse "name=backend,..." (use 'default' as the name for all models).
+
+    Raises:
+        ValueError: If an entry is malformed or names an unknown backend
+    """
+    overrides = {}
+    for entry in filter(None, (part.strip() for part in (value or '').split(','))):
+        name, sep, backend = entry.partition('=')
+        if not sep or backend.strip() not in BACKENDS:
+            raise ValueError(f"Invalid backend override {entry!r}, expected name=<{'|'.join(BACKENDS)}>")
+        overrides[name.strip()] = backend.strip()
+    return overrides
+
+
+def backend_for(model_name: str) -> str:
+    """Configured backend of a model (environment overrides config)"""
+    overrides = parse_backend_overrides(os.environ.get(BACKENDS_ENV))
+    return (overrides.get(model_name) or MODEL_BACKENDS.get(model_name)
+            or overrides.get('default') or DEFAULT_MODEL_BACKEND)
+
+
+class OnnxModel:
+    """
+    ONNX Runtime session with the call signature of the torch model.
+
+    Accepts a torch tensor or a NumPy array of shape (N, M, T, V, C) and
+    returns logits of the same type.
+    """
+
+    def __init__(self, path: str, intra_op_threads: Optional[int] = None):
+        """
+        Load an exported graph.
+
+        Args:
+            path: .onnx file
+            intra_op_threads: ONNX Runtime intra-op threads (None = all cores)
+        """
+        if ort is None:
+            raise RuntimeError("onnxruntime is not installed")
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self.path = path
+        self.session = ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def __call__(self, batch: Any) -> Any:
+        if isinstance(batch, np.ndarray):
+            return self.run(batch)
+        import torch
+        return torch.from_numpy(self.run(batch.detach().cpu().numpy()))
+
+    def run(self, batch: np.ndarray) -> np.ndarray:
+        """Logits for an (N, M, T, V, C) float32 batch"""
+        return self.session.run(None, {self.input_name: np.ascontiguousarray(batch, dtype=np.float32)})[0]
+
+    def eval(self) -> 'OnnxModel':
+        return self
+
+
+def load_gcn_model(
+    model_name: str,
+    torch_loader: Callable[[str], Any],
+    backend: Optional[str] = None,
+    onnx_dir: str = ONNX_MODEL_DIR,
+) -> Any:
+    """
+    Load a Smart Veto model on its configured backend.
+
+    Args:
+        model_name: Key of MODEL_PATHS
+        torch_loader: Returns the eager torch model for a model name
+        backend: Force a backend (None = backend_for(model_name))
+        onnx_dir: Directory of exported graphs
+
+    Returns:
+        torch.nn.Module or OnnxModel
+    """
+    backend = backend or backend_for(model_name)
+    if backend == BACKEND_TORCH:
+        return torch_loader(model_name)
+
+    path = onnx_path(model_name, int8=backend == BACKEND_ONNX_INT8, out_dir=onnx_dir)
+    if ort is None or not os.path.exists(path):
+        reason = 'onnxruntime not installed' if ort is None else f'{path} not found'
+        print(f"[ONNX] {model_name}: {backend} unavailable ({reason}), using torch")
+        return torch_loader(model_name)
+
+    print(f"[ONNX] {model_name}: {backend} ({path})")
+    return OnnxModel(path)
+
+
+def export_model(model: Any, path: str, opset: int = DEFAULT_OPSET) -> str:
+    """
+    Export an eager model to ONNX with a dynamic batch axis.
+
+    Args:
+        model: torch.nn.Module in eval mode
+        path: Output .onnx file
+        opset: ONNX opset version
+
+    Returns:
+        path
+    """
+    import torch
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    dummy = torch.zeros(INPUT_SHAPE, dtype=torch.float32)
+    with torch.no_grad():
+        torch.onnx.export(
+            model.eval(), dummy, path,
+            input_names=[INPUT_NAME],
+            output_names=[OUTPUT_NAME],
+            dynamic_axes={INPUT_NAME: {0: 'batch'}, OUTPUT_NAME: {0: 'batch'}},
+            opset_version=opset,
+        )
+    return path
+
+
+def quantize_model(fp32_path: str, int8_path: str) -> str:
+    """
+    Dynamic int8 quantization of an exported graph.
+
+    Weights are stored as int8 and activations are quantized on the fly,
+    so no calibration data is needed.
+
+    Returns:
+        int8_path
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    return int8_path
+
+
+def verify_export(model: Any, path: str, batch_size: int = 4) -> float:
+    """Max absolute logit difference between eager and ONNX on random input"""
+    import torch
+
+    rng = np.random.default_rng(0)
+    batch = rng.standard_normal((batch_size,) + INPUT_SHAPE[1:], dtype=np.float32)
+    with torch.inference_mode():
+        expected = model(torch.from_numpy(batch)).float().numpy()
+    return float(np.abs(OnnxModel(path).run(batch) - expected).max())
+
+
+def gcn_model_names() -> List[str]:
+    """Registered STGCNPP / MSG3D checkpoints"""
+    return [name for name in MODEL_PATHS if MODEL_ARCHITECTURES.get(name) in ('STGCNPP', 'MSG3D')]
+
+
+def main() -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Export Smart Veto models to ONNX (optionally int8)')
+    parser.add_argument('--loader', required=True,
+                        help='module:function returning a loaded torch model for a model name')
+    parser.add_argument('--models', nargs='+', default=None, help='Model names (default: all registered)')
+    parser.add_argument('--out-dir', default=ONNX_MODEL_DIR)
+    parser.add_argument('--opset', type=int, default=DEFAULT_OPSET)
+    parser.add_argument('--int8', action='store_true', help='Also write dynamically quantized graphs')
+    args = parser.parse_args()
+
+    from inference_workers import resolve_factory
+
+    load_model = resolve_factory(args.loader)
+    failures: List[Tuple[str, str]] = []
+    for name in args.models or gcn_model_names():
+        try:
+            model = load_model(name)
+            fp32 = export_model(model, onnx_path(name, out_dir=args.out_dir), args.opset)
+            message = f"[ONNX] {name}: {fp32}"
+            if ort is not None:
+                message += f" (max |logit delta| {verify_export(model, fp32):.2e})"
+            if args.int8:
+                message += f", int8: {quantize_model(fp32, onnx_path(name, True, args.out_dir))}"
+            print(message)
+        except Exception as e:
+            failures.append((name, str(e)))
+            print(f"[ONNX] {name}: export failed: {e}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Staged Pipeline Executor
+================================================================================
+
+Runs the per-frame work as a pipeline of stages connected by bounded queues.
+
+Decode, YOLO pose, post-processing and both GCNs used to run serially per
+frame, so while one stage was busy the others sat idle. Each stage now has
+its own worker threads, so one frame's pose estimation overlaps another
+frame's GCN inference. The heavy work (OpenCV decode, torch, ultralytics)
+releases the GIL, so threads overlap well in practice.
+
+    decode -> pose -> post-process/buffer -> GCN -> publish
+
+Items carry a key (camera ID). Within a stage, each key is pinned to one
+worker (the least-loaded one when the key is first seen), so each camera's
+frames are processed in order by every stage while different cameras run
+in parallel. Queues are bounded: when a downstream
+stage falls behind, upstream workers block, and `submit` eventually times
+out (pair it with the drop-oldest ingress queues).
+
+A stage function returns the payload for the next stage, or None to stop
+the item there (e.g. no inference due for this frame). The last stage
+(typically a publish/sink) may return anything, None included; every
+normal return there counts as a completed item.
+
+Features:
+- Configurable workers and queue size per stage
+- Per-key ordering through every stage
+- Per-stage occupancy, queue wait, service time and blocked-put time
+- End-to-end latency percentiles
+
+Usage:
+    from pipeline_executor import Stage, StagedPipeline
+
+    pipeline = StagedPipeline([
+        Stage('decode', decode_frame, workers=2),
+        Stage('pose', run_pose, workers=2),
+        Stage('postprocess', update_buffers),
+        Stage('gcn', run_cascade, workers=2),
+        Stage('publish', send_result),
+    ])
+    pipeline.start()
+    pipeline.submit(camera_id, frame_bytes)
+    pipeline.get_stats()
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Sequence
+
+from micro_batcher import _percentile
+
+# Defaults
+DEFAULT_WORKERS = 1
+DEFAULT_QUEUE_SIZE = 8
+STATS_HISTORY = 2048   # samples kept for latency percentiles
+
+_STOP = object()
+
+
+@dataclass
+class Stage:
+    """One pipeline stage"""
+    name: str
+    fn: Callable[[Any], Any]           # payload -> payload for next stage, or None
+    workers: int = DEFAULT_WORKERS
+    queue_size: int = DEFAULT_QUEUE_SIZE
+
+
+@dataclass
+class _Envelope:
+    """Item moving through the pipeline"""
+    key: Hashable
+    payload: Any
+    submitted_at: float
+    enqueued_at: float
+
+
+class StageStats:
+    """Thread-safe accounting for one stage"""
+
+    def __init__(self, workers: int, history: int = STATS_HISTORY):
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=history)
+        self._service: Deque[float] = deque(maxlen=history)
+        self._busy_s = 0.0
+        self._blocked_s = 0.0
+        self._processed = 0
+        self._filtered = 0
+        self._errors = 0
+        self._started_at = time.perf_counter()
+
+    def record(self, wait_ms: float, service_ms: float, passed: bool):
+        """Record one processed item"""
+        with self._lock:
+            self._waits.append(wait_ms)
+            self._service.append(service_ms)
+            self._busy_s += service_ms / 1000.0
+            self._processed += 1
+            if not passed:
+                self._filtered += 1
+
+    def record_error(self):
+        with self._lock:
+            self._errors += 1
+
+    def record_blocked(self, seconds: float):
+        """Time a worker spent waiting to hand off to the next (full) stage"""
+        with self._lock:
+            self._blocked_s += seconds
+
+    def reset(self):
+        with self._lock:
+            self._waits.clear()
+            self._service.clear()
+            self._busy_s = self._blocked_s = 0.0
+            self._processed = self._filtered = self._errors = 0
+            self._started_at = time.perf_counter()
+
+    def get_stats(self, depth: int) -> Dict[str, Any]:
+        with self._lock:
+            capacity_s = max(time.perf_counter() - self._started_at, 1e-6) * self.workers
+            waits = list(self._waits)
+            service = list(self._service)
+            return {
+                'workers': self.workers,
+                'queue_depth': depth,
+                'processed': self._processed,
+                'filtered': self._filtered,
+                'errors': self._errors,
+                'occupancy': round(min(self._busy_s / capacity_s, 1.0), 3),
+                'blocked_ratio': round(min(self._blocked_s / capacity_s, 1.0), 3),
+                'wait_ms': {
+                    'p50': round(_percentile(waits, 50), 2),
+                    'p95': round(_percentile(waits, 95), 2),
+                },
+                'service_ms': {
+                    'p50': round(_percentile(service, 50), 2),
+                    'p95': round(_percentile(service, 95), 2),
+                },
+            }
+
+
+class StagedPipeline:
+    """
+    Bounded multi-stage executor with per-stage worker threads.
+
+    Supports:
+    - Per-key (camera) ordering through all stages
+    - Backpressure through bounded queues
+    - Per-stage occupancy / wait / service time statistics
+    - Thread-safe submission
+    """
+
+    def __init__(self, stages: Sequence[Stage], name: str = 'Pipeline'):
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages: Stages in execution order
+            name: Name used for worker threads and log lines
+        """
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = list(stages)
+        self.name = name
+        # One bounded queue per worker; items are routed to a worker by key
+        self._queues: List[List[queue.Queue]] = [
+            [queue.Queue(maxsize=stage.queue_size) for _ in range(max(1, stage.workers))]
+            for stage in self.stages
+        ]
+        self._stats = [StageStats(len(qs)) for qs in self._queues]
+        self._assignments: List[Dict[Hashable, int]] = [{} for _ in self.stages]
+        self._load: List[List[int]] = [[0] * len(qs) for qs in self._queues]
+        self._latency: Deque[float] = deque(maxlen=STATS_HISTORY)
+        self._threads: List[List[threading.Thread]] = [[] for _ in self.stages]
+        self._counter_lock = threading.Lock()
+        self._submitted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._running = False
+
+    def start(self):
+        """Start all stage workers"""
+        if self._running:
+            return
+        self._running = True
+        for index, stage in enumerate(self.stages):
+            for worker, worker_queue in enumerate(self._queues[index]):
+                thread = threading.Thread(
+                    target=self._worker, args=(index, worker_queue),
+                    name=f"{self.name}-{stage.name}-{worker}", daemon=True,
+                )
+                thread.start()
+                self._threads[index].append(thread)
+        for stats in self._stats:
+            stats.reset()
+        print(f"[{self.name}] Started: " + " -> ".join(f"{s.name}x{len(q)}" for s, q in zip(self.stages, self._queues)))
+
+    def stop(self, timeout: float = 5.0):
+        """Drain and stop the workers, stage by stage"""
+        if not self._running:
+            return
+        self._running = False
+        # Stop one stage at a time so in-flight items reach the later stages
+        for worker_queues, threads in zip(self._queues, self._threads):
+            for worker_queue in worker_queues:
+                worker_queue.put(_STOP)
+            for thread in threads:
+                thread.join(timeout)
+            threads.clear()
+
+    def submit(self, key: Hashable, payload: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Submit an item to the first stage.
+
+        Args:
+            key: Ordering key (camera ID)
+            payload: Input for the first stage
+            timeout: Seconds to wait if the first queue is full (None = block)
+
+        Returns:
+            False if the pipeline is full or not running (item not accepted)
+        """
+        if not self._running:
+            with self._counter_lock:
+                self._rejected += 1
+            return False
+        now = time.perf_counter()
+        try:
+            self._route(0, key).put(_Envelope(key, payload, now, now), timeout=timeout)
+        except queue.Full:
+            with self._counter_lock:
+                self._rejected += 1
+            return False
+        with self._counter_lock:
+            self._submitted += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-stage statistics and end-to-end latency"""
+        with self._counter_lock:
+            latency = list(self._latency)
+            counters = {
+                'submitted': self._submitted,
+                'rejected': self._rejected,
+                'completed': self._completed,
+            }
+        return {
+            **counters,
+            'latency_ms': {
+                'p50': round(_percentile(latency, 50), 2),
+                'p95': round(_percentile(latency, 95), 2),
+            },
+            'stages': {
+                stage.name: stats.get_stats(sum(q.qsize() for q in queues))
+                for stage, stats, queues in zip(self.stages, self._stats, self._queues)
+            },
+        }
+
+    def remove_key(self, key: Hashable):
+        """Forget the worker assignment of a disconnected camera"""
+        with self._counter_lock:
+            for assignment, load in zip(self._assignments, self._load):
+                worker = assignment.pop(key, None)
+                if worker is not None:
+                    load[worker] -= 1
+
+    def _route(self, index: int, key: Hashable) -> queue.Queue:
+        """Worker queue for a key at a stage (sticky, least-loaded on first use)"""
+        worker_queues = self._queues[index]
+        if len(worker_queues) == 1:
+            return worker_queues[0]
+        with self._counter_lock:
+            worker = self._assignments[index].get(key)
+            if worker is None:
+                load = self._load[index]
+                worker = load.index(min(load))
+                load[worker] += 1
+                self._assignments[index][key] = worker
+        return worker_queues[worker]
+
+    def _worker(self, index: int, worker_queue: queue.Queue):
+        """Worker loop for one stage"""
+        stage = self.stages[index]
+        stats = self._stats[index]
+        is_last = index == len(self.stages) - 1
+
+        while True:
+            envelope = worker_queue.get()
+            if envelope is _STOP:
+                return
+
+            started = time.perf_counter()
+            wait_ms = (started - envelope.enqueued_at) * 1000
+            try:
+                result = stage.fn(envelope.payload)
+            except Exception as e:
+                stats.record_error()
+                print(f"[{self.name}] Stage '{stage.name}' failed for {envelope.key}: {e}")
+                continue
+            finished = time.perf_counter()
+            stats.record(wait_ms, (finished - started) * 1000, is_last or result is not None)
+
+            if is_last:
+                with self._counter_lock:
+                    self._completed += 1
+                    self._latency.append((finished - envelope.submitted_at) * 1000)
+                continue
+            if result is None:
+                continue
+
+            envelope.payload = result
+            envelope.enqueued_at = time.perf_counter()
+            next_queue = self._route(index + 1, envelope.key)
+            try:
+                next_queue.put_nowait(envelope)
+            except queue.Full:
+                # Downstream is behind: block (wait time includes this)
+                next_queue.put(envelope)
+                stats.record_blocked(time.perf_counter() - finished)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Pose Batcher
+================================================================================
+
+Cross-stream batched YOLO pose extraction.
+
+YOLO pose is the most expensive step of the live pipeline and was called as
+`yolo_model(frame)` once per frame per camera. The pose batcher collects
+decoded frames from all active cameras and runs them through a single
+`yolo_model([frame, ...])` call, then demultiplexes the results back to each
+camera as post-processed skeletons (see pose_utils.select_skeletons).
+
+Features:
+- Configurable max batch size and queue-time budget
+- Batches keyed by input size, so per-camera imgsz settings still batch
+- Same skeleton selection as the per-frame path
+- Batch-size / queueing delay metrics
+
+Usage:
+    from pose_batcher import PoseBatcher
+
+    pose_batcher = PoseBatcher(yolo_model, max_batch_size=8, max_delay_ms=15)
+    pose_batcher.start()
+
+    # In each camera's frame loop (thread)
+    pose = pose_batcher.extract(camera_id, frame)
+    buffer.append(pose.kpts)
+
+    # Or from asyncio
+    pose = await asyncio.wrap_future(pose_batcher.submit(camera_id, frame))
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from micro_batcher import MicroBatcher
+from pose_utils import PoseResult, select_skeletons_from_result
+
+# Defaults
+DEFAULT_MAX_BATCH_SIZE = 8
+DEFAULT_MAX_DELAY_MS = 15.0
+DEFAULT_IMGSZ = 640
+
+
+@dataclass
+class PoseRequest:
+    """One frame waiting for pose estimation"""
+    camera_id: str
+    frame: np.ndarray
+
+
+class PoseBatcher:
+    """
+    Batches YOLO pose calls across cameras.
+
+    Supports:
+    - One YOLO call per batch of frames
+    - Per-imgsz batching keys
+    - Thread-safe submission
+    """
+
+    def __init__(
+        self,
+        yolo_model: Any,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay_ms: float = DEFAULT_MAX_DELAY_MS,
+        default_imgsz: int = DEFAULT_IMGSZ,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            yolo_model: Loaded Ultralytics YOLO pose model (yolo26m-pose.pt)
+            max_batch_size: Maximum frames per YOLO call
+            max_delay_ms: Queue-time budget for the oldest frame in a batch
+            default_imgsz: YOLO input size when the caller does not set one
+        """
+        self.yolo_model = yolo_model
+        self.default_imgsz = default_imgsz
+        self._batcher = MicroBatcher(
+            self._run_batch,
+            max_batch_size=max_batch_size,
+            max_delay_ms=max_delay_ms,
+            name='PoseBatcher',
+        )
+
+    def start(self):
+        """Start the batching worker"""
+        self._batcher.start()
+
+    def stop(self):
+        """Stop the batching worker"""
+        self._batcher.stop()
+
+    def submit(self, camera_id: str, frame: np.ndarray, imgsz: Optional[int] = None) -> Future:
+        """
+        Queue a decoded frame for pose estimation.
+
+        Args:
+            camera_id: Camera the frame belongs to
+            frame: Decoded BGR frame (H, W, 3)
+            imgsz: YOLO input size (frames with the same size share a batch)
+
+        Returns:
+            Future resolved with a PoseResult
+        """
+        key = imgsz or self.default_imgsz
+        return self._batcher.submit(key, PoseRequest(camera_id, frame))
+
+    def extract(
+        self,
+        camera_id: str,
+        frame: np.ndarray,
+        imgsz: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> PoseResult:
+        """Blocking convenience wrapper around submit()"""
+        return self.submit(camera_id, frame, imgsz).result(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics"""
+        stats = self._batcher.get_stats()
+        stats['by_imgsz'] = self._batcher.get_key_stats()
+        return stats
+
+    def _run_batch(self, imgsz: int, requests: List[PoseRequest]) -> List[PoseResult]:
+        """Run one batched YOLO call and demultiplex (worker thread)"""
+        frames = [r.frame for r in requests]
+        results = self.yolo_model(frames, imgsz=imgsz, verbose=False)
+        return [select_skeletons_from_result(result) for result in results]
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Pose Post-Processing
+================================================================================
+
+Shared YOLO pose post-processing for the live server.
+
+This is the per-frame logic from smart_veto_final.py (including the IoU-based
+NMS fix from server_fix_iou_nms.py) as plain functions, so that the batched,
+gated and ROI pose paths all select skeletons exactly the same way.
+
+Selection rules (unchanged from production):
+- Reject detections with fewer than 5 visible keypoints (conf > 0.3) or
+  without a visible head or shoulder
+- Remove duplicates with IoU > 0.5, keeping the larger box
+- Up to 10 skeletons for visualization, top 2 (largest boxes) for the model
+
+Usage:
+    from pose_utils import select_skeletons_from_result
+
+    results = yolo_model(frame, verbose=False)
+    pose = select_skeletons_from_result(results[0])
+    buffer.append(pose.kpts)
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+import numpy as np
+
+# Selection parameters (production tested)
+KEYPOINT_CONF = 0.3     # Keypoint visible above this confidence
+MIN_VISIBLE = 5         # Minimum visible keypoints per person
+IOU_THRESHOLD = 0.5     # 50% overlap = same person
+MAX_VISUAL = 10         # Skeletons sent for visualization
+MODEL_PERSONS = 2       # BatchNorm trained with M=2
+NUM_JOINTS = 17
+
+
+@dataclass
+class PoseResult:
+    """Selected skeletons for one frame"""
+    kpts: np.ndarray                                    # (2, 17, 3) model input
+    kpts_visual: List[np.ndarray] = field(default_factory=list)  # up to 10 x (17, 3)
+    boxes: List[np.ndarray] = field(default_factory=list)        # xyxy per visual skeleton
+    num_detected: int = 0                               # raw YOLO detections
+
+    @property
+    def num_valid(self) -> int:
+        """Number of valid (deduplicated) people"""
+        return len(self.kpts_visual)
+
+
+def empty_pose() -> PoseResult:
+    """Pose result for a frame with nobody in it"""
+    return PoseResult(kpts=np.zeros((MODEL_PERSONS, NUM_JOINTS, 3), dtype=np.float32))
+
+
+def calc_iou(box1, box2) -> float:
+    """Calculate Intersection over Union between two boxes [x1,y1,x2,y2]"""
+    x1 = max(box1[0], box2[0])
+    y1 = max(box1[1], box2[1])
+    x2 = min(box1[2], box2[2])
+    y2 = min(box1[3], box2[3])
+    inter = max(0, x2 - x1) * max(0, y2 - y1)
+    area1 = (box1[2] - box1[0]) * (box1[3] - box1[1])
+    area2 = (box2[2] - box2[0]) * (box2[3] - box2[1])
+    union = area1 + area2 - inter
+    return inter / union if union > 0 else 0
+
+
+def select_skeletons(kp: np.ndarray, boxes: np.ndarray, num_detected: Optional[int] = None) -> PoseResult:
+    """
+    Filter, deduplicate and rank YOLO pose detections.
+
+    Args:
+        kp: Keypoints array (N, >=17, 3) in frame coordinates
+        boxes: Bounding boxes (N, 4) as xyxy
+        num_detected: Raw detection count to report (defaults to N)
+
+    Returns:
+        PoseResult with model and visualization skeletons
+    """
+    pose = empty_pose()
+    pose.num_detected = len(kp) if num_detected is None else num_detected
+
+    # Filter: Reject obvious false detections (fists, random objects)
+    valid_indices = []
+    for i in range(len(kp)):
+        skeleton = kp[i][:NUM_JOINTS, :3]
+        visible = int((skeleton[:, 2] > KEYPOINT_CONF).sum())
+        has_head = skeleton[0][2] > KEYPOINT_CONF
+        has_any_shoulder = skeleton[5][2] > KEYPOINT_CONF or skeleton[6][2] > KEYPOINT_CONF
+        if visible >= MIN_VISIBLE and (has_head or has_any_shoulder):
+            valid_indices.append(i)
+
+    if not valid_indices:
+        return pose
+
+    # Sort by bbox area (larger = closer/more reliable)
+    areas = [(boxes[i][2] - boxes[i][0]) * (boxes[i][3] - boxes[i][1]) for i in valid_indices]
+    sorted_pairs = sorted(zip(valid_indices, areas), key=lambda x: x[1], reverse=True)
+
+    # NMS: Keep only boxes with IoU < 0.5 with all previously kept boxes
+    kept_indices = []
+    for idx, _ in sorted_pairs:
+        if all(calc_iou(boxes[idx], boxes[k]) <= IOU_THRESHOLD for k in kept_indices):
+            kept_indices.append(idx)
+
+    for vis_idx, idx in enumerate(kept_indices[:MAX_VISUAL]):
+        skeleton = kp[idx][:NUM_JOINTS, :3]
+        pose.kpts_visual.append(skeleton)
+        pose.boxes.append(np.asarray(boxes[idx][:4], dtype=np.float32))
+        if vis_idx < MODEL_PERSONS:
+            pose.kpts[vis_idx] = skeleton
+
+    return pose
+
+
+def select_skeletons_from_result(result: Any) -> PoseResult:
+    """
+    Post-process one Ultralytics result object.
+
+    Args:
+        result: Element of the list returned by yolo_model(...)
+
+    Returns:
+        PoseResult (empty if nothing was detected)
+    """
+    if result is None or result.keypoints is None or result.boxes is None:
+        return empty_pose()
+    kp = result.keypoints.data.cpu().numpy()
+    boxes = result.boxes.xyxy.cpu().numpy()
+    return select_skeletons(kp, boxes)
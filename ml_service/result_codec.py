@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Compact Result Encoding
+================================================================================
+
+Opt-in binary encoding for detection responses.
+
+Each inference sends a JSON response with the scores, the stats and up to
+10 visualized skeletons as nested float lists. Converting keypoint arrays
+with tolist() and serializing every float as text dominates response cost
+at 10 FPS per socket. The compact encoding packs the scores into a fixed
+binary header and the keypoints into int16 arrays; the remaining small
+fields (type, stats, inference_rate, ...) go into a short JSON tail.
+
+Layout (little-endian), version 1:
+
+    offset  size  field
+    0       4     magic 'NXVR'
+    4       1     version (1)
+    5       1     flags (bit0 violence, bit1 veto_skipped, bit2 empty_scene)
+    6       1     result code (0 none, 1 SAFE, 2 VETOED, 3 VIOLENCE)
+    7       1     skeleton block count K
+    8       4     primary (float32, NaN if absent)
+    12      4     veto (float32, NaN if null)
+    16      4     violence_score (float32, NaN if absent)
+    20      4     inference_ms (float32, NaN if absent)
+    24      2     num_detected (uint16, 0xFFFF if absent)
+    26      2     reserved
+    28      4     JSON tail length
+    32      ...   K skeleton blocks: key id (uint8), reserved (uint8),
+                  person count P (uint16), int16[P][17][3]
+    ...           JSON tail (UTF-8)
+
+Keypoints are quantized as x, y in 1/4 pixel and confidence in 1/32767.
+All int16 arrays start at even offsets so clients can view them in place.
+
+Negotiation: the client sends {"type": "hello", "encodings": ["compact", ...]}
+after connecting (or adds ?encoding=compact to the URL); the server answers
+{"type": "hello", "encoding": "compact", "skeletons": "full"|"delta"} and
+then sends binary results. Clients only switch to what the reply accepts.
+The TypeScript decoder lives in src/lib/result-codec.ts.
+
+Usage:
+    from result_codec import ResultEncoder, negotiate_encoding
+
+    encoder = ResultEncoder(negotiate_encoding(hello_message))
+    payload = encoder.encode(response)      # str (json) or bytes (compact)
+    await websocket.send(payload)
+
+Benchmark: benchmarks/bench_result_encoding.py
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import json
+import math
+import struct
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Union
+
+import numpy as np
+
+ENCODING_JSON = 'json'
+ENCODING_COMPACT = 'compact'
+SUPPORTED_ENCODINGS = (ENCODING_COMPACT, ENCODING_JSON)
+
+MAGIC = b'NXVR'
+VERSION = 1
+HEADER = struct.Struct('<4sBBBBffffHHI')
+HEADER_SIZE = HEADER.size  # 32 bytes
+BLOCK_HEADER = struct.Struct('<BBH')
+
+# Quantization
+XY_SCALE = 4.0        # 1/4 pixel
+CONF_SCALE = 32767.0
+NUM_JOINTS = 17
+
+FLAG_VIOLENCE = 1
+FLAG_VETO_SKIPPED = 2
+FLAG_EMPTY_SCENE = 4
+
+RESULT_CODES = {'SAFE': 1, 'VETOED': 2, 'VIOLENCE': 3}
+RESULT_NAMES = {code: name for name, code in RESULT_CODES.items()}
+
+# Response fields carrying (P, 17, 3) keypoint arrays, by block key id
+SKELETON_KEYS = ('all_skeletons', 'skeletons', 'kpts_visual')
+SKELETON_KEY_IDS = {key: i for i, key in enumerate(SKELETON_KEYS)}
+
+# Fields packed into the header (everything else goes to the JSON tail)
+_HEADER_FIELDS = frozenset((
+    'primary', 'veto', 'violence_score', 'inference_ms', 'num_detected',
+    'result', 'violence', 'veto_skipped', 'empty_scene',
+))
+
+_NAN = float('nan')
+
+
+def negotiate_encoding(request: Union[Dict[str, Any], Iterable[str], str, None]) -> str:
+    """
+    Pick the result encoding for a connection.
+
+    Args:
+        request: Client hello message ({"type": "hello", "encodings": [...]}),
+            a list of encodings, or a single encoding name (e.g. from the
+            `encoding` query parameter)
+
+    Returns:
+        'compact' if the client offered it, otherwise 'json'
+    """
+    if request is None:
+        return ENCODING_JSON
+    if isinstance(request, dict):
+        offered = request.get('encodings') or request.get('encoding') or []
+    else:
+        offered = request
+    if isinstance(offered, str):
+        offered = [offered]
+    for encoding in offered:
+        if encoding in SUPPORTED_ENCODINGS:
+            return encoding
+    return ENCODING_JSON
+
+
+def quantize_skeletons(skeletons: Any) -> np.ndarray:
+    """(P, 17, 3) float keypoints -> (P, 17, 3) int16"""
+    kpts = np.asarray(skeletons, dtype=np.float32).reshape(-1, NUM_JOINTS, 3)
+    out = np.empty(kpts.shape, dtype=np.int16)
+    out[..., :2] = np.clip(np.rint(kpts[..., :2] * XY_SCALE), -32768, 32767)
+    out[..., 2] = np.clip(np.rint(kpts[..., 2] * CONF_SCALE), 0, 32767)
+    return out
+
+
+def dequantize_skeletons(quantized: np.ndarray) -> np.ndarray:
+    """(P, 17, 3) int16 -> (P, 17, 3) float32 keypoints"""
+    kpts = quantized.astype(np.float32)
+    kpts[..., :2] /= XY_SCALE
+    kpts[..., 2] /= CONF_SCALE
+    return kpts
+
+
+def _float_or_nan(value: Any) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def encode_compact(response: Dict[str, Any]) -> bytes:
+    """
+    Encode a detection response in the compact binary format.
+
+    Args:
+        response: Response dict as it would be sent as JSON; keypoint fields
+            may be numpy arrays or nested lists
+
+    Returns:
+        Binary message
+    """
+    flags = 0
+    if response.get('violence'):
+        flags |= FLAG_VIOLENCE
+    if response.get('veto_skipped'):
+        flags |= FLAG_VETO_SKIPPED
+    if response.get('empty_scene'):
+        flags |= FLAG_EMPTY_SCENE
+
+    blocks = []
+    tail = {}
+    for key, value in response.items():
+        if key in SKELETON_KEY_IDS and value is not None:
+            quantized = quantize_skeletons(value)
+            blocks.append(BLOCK_HEADER.pack(SKELETON_KEY_IDS[key], 0, len(quantized)))
+            blocks.append(quantized.tobytes())
+        elif key not in _HEADER_FIELDS:
+            tail[key] = value
+
+    tail_bytes = json.dumps(tail, separators=(',', ':')).encode('utf-8') if tail else b''
+    num_detected = response.get('num_detected')
+
+    header = HEADER.pack(
+        MAGIC, VERSION, flags,
+        RESULT_CODES.get(response.get('result'), 0),
+        len(blocks) // 2,
+        _float_or_nan(response.get('primary')),
+        _float_or_nan(response.get('veto')),
+        _float_or_nan(response.get('violence_score')),
+        _float_or_nan(response.get('inference_ms')),
+        0xFFFF if num_detected is None else min(int(num_detected), 0xFFFE),
+        0,
+        len(tail_bytes),
+    )
+    return b''.join([header, *blocks, tail_bytes])
+
+
+def decode_compact(data: Union[bytes, bytearray, memoryview]) -> Dict[str, Any]:
+    """
+    Decode a compact message back into a response dict (tools and tests).
+
+    Mirrors decodeResultMessage() in src/lib/result-codec.ts. Keypoints are
+    returned as float32 arrays; scores are float32-rounded.
+
+    Raises:
+        ValueError: On bad magic, unsupported version or truncated data
+    """
+    view = memoryview(data)
+    if len(view) < HEADER_SIZE:
+        raise ValueError(f"Message too short: {len(view)} bytes")
+    (magic, version, flags, result_code, block_count, primary, veto, score,
+     inference_ms, num_detected, _reserved, tail_len) = HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("Bad magic")
+    if version != VERSION:
+        raise ValueError(f"Unsupported result encoding version {version}")
+
+    response: Dict[str, Any] = {}
+    offset = HEADER_SIZE
+    for _ in range(block_count):
+        key_id, _pad, count = BLOCK_HEADER.unpack_from(view, offset)
+        offset += BLOCK_HEADER.size
+        size = count * NUM_JOINTS * 3 * 2
+        if offset + size > len(view):
+            raise ValueError("Truncated skeleton block")
+        quantized = np.frombuffer(view, dtype=np.int16, count=count * NUM_JOINTS * 3, offset=offset)
+        response[SKELETON_KEYS[key_id]] = dequantize_skeletons(quantized.reshape(count, NUM_JOINTS, 3))
+        offset += size
+
+    if tail_len:
+        response.update(json.loads(bytes(view[offset:offset + tail_len])))
+
+    for key, value in (('primary', primary), ('violence_score', score), ('inference_ms', inference_ms)):
+        if not math.isnan(value):
+            response[key] = value
+    if 'primary' in response:
+        response['veto'] = _nan_to_none(veto)
+    if result_code:
+        response['result'] = RESULT_NAMES[result_code]
+    if num_detected != 0xFFFF:
+        response['num_detected'] = num_detected
+    response['violence'] = bool(flags & FLAG_VIOLENCE)
+    if flags & FLAG_VETO_SKIPPED:
+        response['veto_skipped'] = True
+    if flags & FLAG_EMPTY_SCENE:
+        response['empty_scene'] = True
+    return response
+
+
+def encode_json(response: Dict[str, Any]) -> str:
+    """Encode a response as JSON (numpy keypoint arrays converted to lists)"""
+    converted = {
+        key: value.tolist() if isinstance(value, np.ndarray) else value
+        for key, value in response.items()
+    }
+    return json.dumps(converted)
+
+
+class ResultEncoder:
+    """
+    Per-connection response encoder.
+
+    Supports:
+    - 'json' (default) and 'compact' encodings
+    - Bytes and serialize time accounting per encoding
+    - Thread-safe statistics
+    """
+
+    def __init__(self, encoding: str = ENCODING_JSON):
+        """
+        Initialize the encoder.
+
+        Args:
+            encoding: 'json' or 'compact' (see negotiate_encoding)
+        """
+        if encoding not in SUPPORTED_ENCODINGS:
+            raise ValueError(f"Unsupported result encoding: {encoding}")
+        self.encoding = encoding
+        self._messages = 0
+        self._bytes = 0
+        self._encode_s = 0.0
+        self._lock = threading.Lock()
+
+    def hello(self, skeletons: str = 'full') -> str:
+        """
+        Server reply to the client hello (always JSON).
+
+        Args:
+            skeletons: 'delta' if the skeleton delta stream was accepted
+                (skeleton_stream.wants_delta_skeletons), else 'full'
+        """
+        return json.dumps({'type': 'hello', 'encoding': self.encoding, 'skeletons': skeletons})
+
+    def encode(self, response: Dict[str, Any]) -> Union[str, bytes]:
+        """
+        Encode a response for sending.
+
+        Returns:
+            str for 'json' (send as a text message), bytes for 'compact'
+        """
+        start = time.perf_counter()
+        if self.encoding == ENCODING_COMPACT:
+            payload: Union[str, bytes] = encode_compact(response)
+        else:
+            payload = encode_json(response)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._messages += 1
+            self._bytes += len(payload)
+            self._encode_s += elapsed
+        return payload
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Message count, mean bytes and mean encode time"""
+        with self._lock:
+            messages = max(self._messages, 1)
+            return {
+                'encoding': self.encoding,
+                'messages': self._messages,
+                'avg_bytes': round(self._bytes / messages, 1),
+                'avg_encode_us': round(self._encode_s * 1e6 / messages, 1),
+            }
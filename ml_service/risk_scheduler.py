@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Risk-Adaptive Scheduling
+================================================================================
+
+Gives cameras near the PRIMARY threshold more compute than calm ones.
+
+Most cameras sit at 0-5% PRIMARY almost all the time, yet every camera got
+the same inference rate. After each scored window the controller updates a
+per-camera risk in [0, 1] from the smoothed PRIMARY score and how fast it is
+rising, then:
+
+- Sets the camera's InferenceScheduler target rate between min_wps (calm)
+  and max_wps (at or rising towards the threshold), geometrically.
+- Exposes the risk as a queue priority; FairScheduler.set_camera_priority
+  uses it to pick a tenant's riskiest camera first.
+
+Risk goes up immediately and decays slowly (decay_seconds), so one calm
+window after a spike does not drop the rate back to the minimum.
+
+Features:
+- Level term: smoothed PRIMARY between calm_score and the user's threshold
+- Trend term: PRIMARY rising faster than rise_full %/s counts as full risk
+- Fast attack, slow release
+- Only reconfigures the scheduler when the target rate changes noticeably
+- Cameras keyed by (userId, cameraId) (camera_hub.camera_key)
+
+Usage:
+    from inference_scheduler import InferenceScheduler
+    from risk_scheduler import RiskAdaptiveController
+
+    scheduler = InferenceScheduler()
+    risk = RiskAdaptiveController(scheduler, min_wps=0.5, max_wps=8.0)
+
+    # After each Smart Veto evaluation
+    risk.update(camera_id, user_id, result.primary, config['primary_threshold'])
+    fair_scheduler.set_camera_priority(user_id, camera_id, risk.priority(camera_id, user_id))
+
+    response.update(risk.response_fields(camera_id, user_id))
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from camera_hub import CameraKey, camera_key
+from inference_scheduler import InferenceScheduler
+from user_config_manager import DEFAULT_CONFIG
+
+# Defaults
+DEFAULT_MIN_WPS = 0.5          # Windows/s for calm cameras
+DEFAULT_MAX_WPS = 8.0          # Windows/s at or rising towards the threshold
+DEFAULT_CALM_SCORE = 10.0      # PRIMARY (%) at or below which level risk is 0
+DEFAULT_RISE_FULL = 20.0       # PRIMARY rise (%/s) counted as full risk
+DEFAULT_DECAY_SECONDS = 10.0   # Time constant of risk release
+SCORE_EMA = 0.5                # Smoothing of PRIMARY scores
+RECONFIGURE_RATIO = 0.1        # Relative rate change before reconfiguring
+
+
+@dataclass
+class CameraRisk:
+    """Risk state for one camera"""
+    score_ema: Optional[float] = None
+    slope: float = 0.0                 # Smoothed PRIMARY change (%/s)
+    risk: float = 0.0
+    target_wps: float = DEFAULT_MIN_WPS
+    updated_at: float = 0.0
+    updates: int = 0
+    escalations: int = 0
+
+
+class RiskAdaptiveController:
+    """
+    Per-camera inference rate and priority from PRIMARY risk.
+
+    Supports:
+    - Score level and trend based risk
+    - Rate control through InferenceScheduler.configure_camera
+    - Queue priority for FairScheduler
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        scheduler: Optional[InferenceScheduler] = None,
+        min_wps: float = DEFAULT_MIN_WPS,
+        max_wps: float = DEFAULT_MAX_WPS,
+        calm_score: float = DEFAULT_CALM_SCORE,
+        rise_full: float = DEFAULT_RISE_FULL,
+        decay_seconds: float = DEFAULT_DECAY_SECONDS,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            scheduler: InferenceScheduler whose per-camera rate is adjusted
+                (None = only compute risk / priority)
+            min_wps: Inference rate for calm cameras
+            max_wps: Inference rate for cameras at maximum risk
+            calm_score: PRIMARY (%) treated as no risk
+            rise_full: PRIMARY rise rate (%/s) treated as full risk
+            decay_seconds: Time constant of the risk release
+        """
+        self.scheduler = scheduler
+        self.min_wps = min_wps
+        self.max_wps = max(max_wps, min_wps)
+        self.calm_score = calm_score
+        self.rise_full = rise_full
+        self.decay_seconds = decay_seconds
+        self._cameras: Dict[CameraKey, CameraRisk] = {}
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        camera_id: str,
+        user_id: Optional[str],
+        primary: float,
+        threshold: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> float:
+        """
+        Feed a PRIMARY score and adjust the camera's rate.
+
+        Args:
+            camera_id: Camera identifier
+            user_id: Tenant (userId)
+            primary: PRIMARY score (%)
+            threshold: User's PRIMARY threshold (%)
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Updated risk in [0, 1]
+        """
+        now = time.time() if now is None else now
+        threshold = DEFAULT_CONFIG['primary_threshold'] if threshold is None else threshold
+
+        with self._lock:
+            key = camera_key(user_id, camera_id)
+            state = self._cameras.setdefault(key, CameraRisk(target_wps=self.min_wps))
+            if state.score_ema is None:
+                state.score_ema = primary
+            else:
+                dt = max(now - state.updated_at, 1e-3)
+                previous = state.score_ema
+                state.score_ema += SCORE_EMA * (primary - state.score_ema)
+                state.slope += SCORE_EMA * ((state.score_ema - previous) / dt - state.slope)
+
+            span = max(threshold - self.calm_score, 1e-6)
+            level = min(max((state.score_ema - self.calm_score) / span, 0.0), 1.0)
+            trend = min(max(state.slope / self.rise_full, 0.0), 1.0) if self.rise_full > 0 else 0.0
+            target = max(level, trend)
+
+            if target >= state.risk:
+                if target > state.risk + 0.25:
+                    state.escalations += 1
+                state.risk = target
+            else:
+                decay = (math.exp(-(now - state.updated_at) / self.decay_seconds)
+                         if self.decay_seconds > 0 else 0.0)
+                state.risk = max(target, state.risk * decay)
+
+            state.updated_at = now
+            state.updates += 1
+            if self.min_wps > 0:
+                wps = self.min_wps * (self.max_wps / self.min_wps) ** state.risk
+            else:
+                wps = self.max_wps * state.risk
+            reconfigure = (state.updates == 1
+                           or abs(wps - state.target_wps) > RECONFIGURE_RATIO * state.target_wps)
+            if reconfigure:
+                state.target_wps = wps
+            risk = state.risk
+
+        if reconfigure and self.scheduler is not None:
+            self.scheduler.configure_camera(camera_id, user_id, target_wps=wps)
+        return risk
+
+    def priority(self, camera_id: str, user_id: Optional[str]) -> float:
+        """Queue priority of a camera (its current risk, 0 if unknown)"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            return state.risk if state else 0.0
+
+    def response_fields(self, camera_id: str, user_id: Optional[str]) -> Dict[str, Any]:
+        """Fields to merge into the per-frame WebSocket response"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            if state is None:
+                return {}
+            return {'risk': {'level': round(state.risk, 3), 'target_wps': round(state.target_wps, 2)}}
+
+    def get_camera_stats(self, camera_id: str, user_id: Optional[str]) -> Dict[str, Any]:
+        """Risk state of one camera"""
+        with self._lock:
+            state = self._cameras.get(camera_key(user_id, camera_id))
+            if state is None:
+                return {}
+            return {
+                'risk': round(state.risk, 3),
+                'score_ema': round(state.score_ema or 0.0, 1),
+                'slope': round(state.slope, 2),
+                'target_wps': round(state.target_wps, 2),
+                'updates': state.updates,
+                'escalations': state.escalations,
+            }
+
+    def remove_camera(self, camera_id: str, user_id: Optional[str]):
+        """Forget a disconnected camera"""
+        with self._lock:
+            self._cameras.pop(camera_key(user_id, camera_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Risk distribution and compute allocated by risk"""
+        with self._lock:
+            states = list(self._cameras.values())
+        elevated = [s for s in states if s.risk >= 0.5]
+        return {
+            'cameras': len(states),
+            'elevated_cameras': len(elevated),
+            'total_target_wps': round(sum(s.target_wps for s in states), 2),
+            'uniform_max_wps': round(self.max_wps * len(states), 2),
+            'escalations': sum(s.escalations for s in states),
+        }
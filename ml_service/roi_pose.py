@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision ROI Pose Runner
+================================================================================
+
+ROI-cropped pose inference around tracked people.
+
+Once people are located, full-frame YOLO at full resolution spends most of
+its compute on background. The ROI runner runs full-frame pose periodically
+and, in between, runs pose only on padded crops around the last known person
+boxes (all crops of a frame in one batched YOLO call at a small input size).
+Crop keypoints and boxes are shifted back into frame coordinates and go
+through the usual selection / NMS, which also removes people seen in two
+overlapping crops.
+
+It falls back to full frame when:
+- the periodic refresh is due (new people entering the scene)
+- no people were tracked on the previous frame
+- fewer people are found in the crops than were tracked (track lost)
+- the crops would cover most of the frame anyway
+
+Usage:
+    from roi_pose import RoiPoseRunner
+
+    roi_runner = RoiPoseRunner(yolo_model, full_frame_interval=10)
+    pose = roi_runner.extract(camera_id, frame)
+    buffer.append(pose.kpts)
+
+Benchmark: benchmarks/bench_roi_pose.py
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from pose_utils import PoseResult, select_skeletons, select_skeletons_from_result
+
+# Defaults
+DEFAULT_FULL_FRAME_INTERVAL = 10   # Full-frame refresh every N frames
+DEFAULT_PADDING = 0.25             # Crop padding as a fraction of box size
+DEFAULT_MIN_CROP = 96              # Minimum crop side in pixels
+DEFAULT_CROP_IMGSZ = 320           # YOLO input size for crops
+MAX_CROP_COVERAGE = 0.6            # Crops covering more than this -> full frame
+
+
+@dataclass
+class CameraRoi:
+    """ROI state for one camera"""
+    boxes: List[np.ndarray] = field(default_factory=list)
+    frames_since_full: int = 0
+    full_frames: int = 0
+    roi_frames: int = 0
+    fallbacks: int = 0
+    crop_coverage_sum: float = 0.0
+
+
+def padded_crop_box(box: np.ndarray, width: int, height: int, padding: float,
+                    min_crop: int) -> Tuple[int, int, int, int]:
+    """Padded, clamped integer crop box around an xyxy person box"""
+    x1, y1, x2, y2 = [float(v) for v in box[:4]]
+    pad_w = max((x2 - x1) * padding, (min_crop - (x2 - x1)) / 2, 0)
+    pad_h = max((y2 - y1) * padding, (min_crop - (y2 - y1)) / 2, 0)
+    return (
+        max(0, int(x1 - pad_w)),
+        max(0, int(y1 - pad_h)),
+        min(width, int(np.ceil(x2 + pad_w))),
+        min(height, int(np.ceil(y2 + pad_h))),
+    )
+
+
+class RoiPoseRunner:
+    """
+    Periodic full-frame pose with ROI crops in between.
+
+    Supports:
+    - Batched crop inference (one YOLO call per frame)
+    - Automatic fallback to full frame
+    - Per-camera full / ROI / fallback counters
+    """
+
+    def __init__(
+        self,
+        yolo_model: Any,
+        full_frame_interval: int = DEFAULT_FULL_FRAME_INTERVAL,
+        padding: float = DEFAULT_PADDING,
+        min_crop: int = DEFAULT_MIN_CROP,
+        crop_imgsz: int = DEFAULT_CROP_IMGSZ,
+        full_imgsz: int = 640,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            yolo_model: Loaded Ultralytics YOLO pose model
+            full_frame_interval: Frames between full-frame refreshes
+            padding: Crop padding as a fraction of the person box
+            min_crop: Minimum crop side in pixels
+            crop_imgsz: YOLO input size for crops
+            full_imgsz: YOLO input size for full frames
+        """
+        self.yolo_model = yolo_model
+        self.full_frame_interval = max(1, full_frame_interval)
+        self.padding = padding
+        self.min_crop = min_crop
+        self.crop_imgsz = crop_imgsz
+        self.full_imgsz = full_imgsz
+        self._cameras: Dict[str, CameraRoi] = {}
+        self._lock = threading.Lock()
+
+    def extract(self, camera_id: str, frame: np.ndarray) -> PoseResult:
+        """
+        Pose for one frame, using crops when possible.
+
+        Args:
+            camera_id: Camera identifier
+            frame: Decoded BGR frame (H, W, 3)
+
+        Returns:
+            PoseResult in frame coordinates
+        """
+        with self._lock:
+            state = self._cameras.setdefault(camera_id, CameraRoi())
+            boxes = list(state.boxes)
+            due = state.frames_since_full + 1 >= self.full_frame_interval
+
+        if boxes and not due:
+            pose, coverage = self._extract_roi(frame, boxes)
+            if pose is not None and pose.num_valid >= len(boxes):
+                with self._lock:
+                    state.roi_frames += 1
+                    state.frames_since_full += 1
+                    state.crop_coverage_sum += coverage
+                    state.boxes = list(pose.boxes)
+                return pose
+            with self._lock:
+                state.fallbacks += 1
+
+        results = self.yolo_model(frame, imgsz=self.full_imgsz, verbose=False)
+        pose = select_skeletons_from_result(results[0] if results else None)
+        with self._lock:
+            state.full_frames += 1
+            state.frames_since_full = 0
+            state.boxes = list(pose.boxes)
+        return pose
+
+    def remove_camera(self, camera_id: str):
+        """Forget state for a disconnected camera"""
+        with self._lock:
+            self._cameras.pop(camera_id, None)
+
+    def get_camera_stats(self, camera_id: str) -> Dict[str, Any]:
+        """Full / ROI frame counts for one camera"""
+        with self._lock:
+            state = self._cameras.get(camera_id)
+            if state is None:
+                return {'full_frames': 0, 'roi_frames': 0, 'fallbacks': 0, 'avg_crop_coverage': 0.0}
+            return {
+                'full_frames': state.full_frames,
+                'roi_frames': state.roi_frames,
+                'fallbacks': state.fallbacks,
+                'avg_crop_coverage': round(state.crop_coverage_sum / state.roi_frames, 3)
+                if state.roi_frames else 0.0,
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get overall ROI statistics"""
+        with self._lock:
+            full = sum(s.full_frames for s in self._cameras.values())
+            roi = sum(s.roi_frames for s in self._cameras.values())
+            return {
+                'cameras': len(self._cameras),
+                'full_frames': full,
+                'roi_frames': roi,
+                'fallbacks': sum(s.fallbacks for s in self._cameras.values()),
+                'roi_ratio': round(roi / (full + roi), 3) if full + roi else 0.0,
+            }
+
+    def _extract_roi(self, frame: np.ndarray, boxes: List[np.ndarray]):
+        """
+        Run pose on padded crops around known boxes.
+
+        Returns:
+            (PoseResult or None, crop coverage fraction). None means the
+            crops are not worth it and full frame should be used.
+        """
+        height, width = frame.shape[:2]
+        crop_boxes = [padded_crop_box(b, width, height, self.padding, self.min_crop) for b in boxes]
+        coverage = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in crop_boxes) / float(width * height)
+        if coverage > MAX_CROP_COVERAGE:
+            return None, coverage
+
+        crops = [frame[y1:y2, x1:x2] for x1, y1, x2, y2 in crop_boxes]
+        results = self.yolo_model(crops, imgsz=self.crop_imgsz, verbose=False)
+
+        all_kp = []
+        all_boxes = []
+        for (x1, y1, _, _), result in zip(crop_boxes, results):
+            if result.keypoints is None or result.boxes is None:
+                continue
+            kp = result.keypoints.data.cpu().numpy().copy()
+            bx = result.boxes.xyxy.cpu().numpy().copy()
+            if len(kp) == 0:
+                continue
+            kp[..., 0] += x1
+            kp[..., 1] += y1
+            bx[:, [0, 2]] += x1
+            bx[:, [1, 3]] += y1
+            all_kp.append(kp)
+            all_boxes.append(bx)
+
+        if not all_kp:
+            return select_skeletons(np.zeros((0, 17, 3), np.float32), np.zeros((0, 4), np.float32)), coverage
+        return select_skeletons(np.concatenate(all_kp), np.concatenate(all_boxes)), coverage
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Session Snapshots
+================================================================================
+
+Periodic binary checkpoints of per-camera session state.
+
+After a restart every camera needed 32 fresh frames (several seconds) before
+it could produce a score, leaving a detection blind spot after each deploy.
+The checkpointer periodically writes every camera's session (skeleton ring
+buffer, tracker state, confirmation counters and last scores) to a compact
+binary file; on restart or failover the sessions are restored and detection
+resumes on the next frame.
+
+Staleness is decided per camera: a camera whose last frame (or, if frames
+were not recorded through CameraSession.append, last score) is older than
+`max_buffer_age` gets no buffer or tracks back (the scene has moved on), even
+if the snapshot itself is fresh; counters and last scores always are.
+
+File layout (little-endian), version 2:
+
+    header   magic 'NXVC', version u8, flags u8, camera count u16,
+             created_at f64 (epoch seconds)
+    camera   id length u8, id (UTF-8), record length u32, record:
+               buffer   frames_seen u64, count u16, M u8, V u8, C u8, pad u8,
+                        float32[count][M][V][C] (chronological)
+               tracker  next_id u32, track count u16,
+                        per track: id u32, box f32[4], age u16, hits u32
+               counters count u8, per counter: name length u8, name, value i64
+               scores   primary f32, veto f32 (NaN = none), result u8,
+                        updated_at f64, appended_at f64 (epoch seconds)
+    trailer  CRC32 of everything above (u32)
+
+Writes go to a temporary file and are renamed into place, so a crash never
+leaves a torn snapshot.
+
+Usage:
+    from session_snapshot import CameraSession, SessionCheckpointer, load_snapshot
+
+    sessions = load_snapshot(SNAPSHOT_PATH)        # {} if missing or invalid
+    checkpointer = SessionCheckpointer(lambda: sessions, SNAPSHOT_PATH)
+    checkpointer.start()
+
+    session = sessions.setdefault(camera_id, CameraSession())
+    with session.lock:
+        session.append(kpts)
+        session.counters['consecutive_violence'] = session.counters.get('consecutive_violence', 0) + 1
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import math
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from cascade import RESULT_SAFE, RESULT_VETOED, RESULT_VIOLENCE
+from skeleton_buffer import SkeletonRingBuffer
+from skeleton_tracker import SkeletonTracker
+
+MAGIC = b'NXVC'
+VERSION = 2
+HEADER = struct.Struct('<4sBBHd')
+BUFFER_HEADER = struct.Struct('<QHBBBB')
+TRACKER_HEADER = struct.Struct('<IH')
+TRACK = struct.Struct('<I4fHI')
+SCORES = struct.Struct('<ffBdd')
+U8 = struct.Struct('<B')
+U32 = struct.Struct('<I')
+I64 = struct.Struct('<q')
+
+RESULT_CODES = {RESULT_SAFE: 1, RESULT_VETOED: 2, RESULT_VIOLENCE: 3}
+RESULT_NAMES = {code: name for name, code in RESULT_CODES.items()}
+
+# Defaults
+DEFAULT_INTERVAL = 5.0          # Seconds between checkpoints
+DEFAULT_MAX_BUFFER_AGE = 10.0   # Older buffers / tracks are not restored
+
+
+class SnapshotError(ValueError):
+    """Raised for corrupt or unsupported snapshot files"""
+
+
+@dataclass
+class CameraSession:
+    """Per-camera state kept across restarts"""
+    buffer: SkeletonRingBuffer = field(default_factory=SkeletonRingBuffer)
+    tracker: SkeletonTracker = field(default_factory=SkeletonTracker)
+    counters: Dict[str, int] = field(default_factory=dict)
+    primary: Optional[float] = None
+    veto: Optional[float] = None
+    result: Optional[str] = None
+    updated_at: float = 0.0
+    appended_at: float = 0.0           # Time of the last buffered frame
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_scores(self, primary: Optional[float], veto: Optional[float], result: str):
+        """Remember the latest scores (caller holds `lock`)"""
+        self.primary = primary
+        self.veto = veto
+        self.result = result
+        self.updated_at = time.time()
+
+    def append(self, kpts: np.ndarray):
+        """Buffer a frame's keypoints and note when (caller holds `lock`)"""
+        self.buffer.append(kpts)
+        self.appended_at = time.time()
+
+    def last_activity(self) -> float:
+        """Epoch time of the newest frame or score"""
+        return max(self.appended_at, self.updated_at)
+
+
+def _encode_name(name: str) -> bytes:
+    """UTF-8 name cut to 255 bytes on a character boundary"""
+    return name.encode('utf-8')[:255].decode('utf-8', 'ignore').encode('utf-8')
+
+
+def _encode_session(session: CameraSession) -> bytes:
+    """Binary record for one camera"""
+    with session.lock:
+        frames = session.buffer.frames().astype(np.float32, copy=False)
+        frames_seen = session.buffer.frames_seen
+        tracker = session.tracker.get_state()
+        counters = dict(session.counters)
+        scores = (session.primary, session.veto, session.result, session.updated_at, session.appended_at)
+
+    m, v, c = frames.shape[1:] if frames.ndim == 4 else session.buffer.frame_shape
+    parts = [BUFFER_HEADER.pack(frames_seen, len(frames), m, v, c, 0), frames.tobytes()]
+
+    parts.append(TRACKER_HEADER.pack(int(tracker['next_id']), len(tracker['tracks'])))
+    for track in tracker['tracks']:
+        parts.append(TRACK.pack(int(track['id']), *[float(x) for x in track['box']],
+                                min(int(track['age']), 0xFFFF), int(track['hits'])))
+
+    parts.append(U8.pack(len(counters)))
+    for name, value in counters.items():
+        encoded = _encode_name(name)
+        parts.append(U8.pack(len(encoded)) + encoded + I64.pack(int(value)))
+
+    primary, veto, result, updated_at, appended_at = scores
+    parts.append(SCORES.pack(
+        math.nan if primary is None else primary,
+        math.nan if veto is None else veto,
+        RESULT_CODES.get(result, 0),
+        updated_at,
+        appended_at,
+    ))
+    return b''.join(parts)
+
+
+def _decode_session(view: memoryview, now: float, max_buffer_age: float) -> CameraSession:
+    """Rebuild a session from its record (buffer / tracks only if recent)"""
+    session = CameraSession()
+    offset = 0
+
+    frames_seen, count, m, v, c, _ = BUFFER_HEADER.unpack_from(view, offset)
+    offset += BUFFER_HEADER.size
+    frames = np.frombuffer(view, dtype=np.float32, count=count * m * v * c, offset=offset).reshape(count, m, v, c)
+    offset += frames.nbytes
+
+    next_id, track_count = TRACKER_HEADER.unpack_from(view, offset)
+    offset += TRACKER_HEADER.size
+    tracks = []
+    for _ in range(track_count):
+        track_id, x1, y1, x2, y2, age, hits = TRACK.unpack_from(view, offset)
+        offset += TRACK.size
+        tracks.append({'id': track_id, 'box': [x1, y1, x2, y2], 'age': age, 'hits': hits})
+
+    (counter_count,) = U8.unpack_from(view, offset)
+    offset += 1
+    for _ in range(counter_count):
+        (name_len,) = U8.unpack_from(view, offset)
+        name = bytes(view[offset + 1:offset + 1 + name_len]).decode('utf-8')
+        offset += 1 + name_len
+        (session.counters[name],) = I64.unpack_from(view, offset)
+        offset += I64.size
+
+    primary, veto, result_code, session.updated_at, session.appended_at = SCORES.unpack_from(view, offset)
+    session.primary = None if math.isnan(primary) else primary
+    session.veto = None if math.isnan(veto) else veto
+    session.result = RESULT_NAMES.get(result_code)
+
+    if now - session.last_activity() <= max_buffer_age:
+        session.buffer.set_state({'frames': frames, 'frames_seen': frames_seen})
+        # Next ID is kept even without tracks so IDs are not reused
+        session.tracker.set_state({'next_id': next_id, 'tracks': tracks})
+    else:
+        session.tracker.set_state({'next_id': next_id, 'tracks': []})
+    return session
+
+
+def encode_snapshot(sessions: Dict[str, CameraSession], created_at: Optional[float] = None) -> bytes:
+    """Serialize all sessions into one snapshot"""
+    parts = [HEADER.pack(MAGIC, VERSION, 0, len(sessions), time.time() if created_at is None else created_at)]
+    for camera_id, session in list(sessions.items()):
+        encoded_id = _encode_name(camera_id)
+        record = _encode_session(session)
+        parts.append(U8.pack(len(encoded_id)) + encoded_id + U32.pack(len(record)))
+        parts.append(record)
+    body = b''.join(parts)
+    return body + U32.pack(zlib.crc32(body))
+
+
+def decode_snapshot(
+    data: bytes,
+    max_buffer_age: float = DEFAULT_MAX_BUFFER_AGE,
+    now: Optional[float] = None,
+) -> Dict[str, CameraSession]:
+    """
+    Rebuild sessions from a snapshot.
+
+    Args:
+        data: Snapshot bytes
+        max_buffer_age: Buffers and tracks of cameras idle for longer than
+            this (seconds) are dropped; counters and last scores are kept
+        now: Current epoch time (for testing)
+
+    Raises:
+        SnapshotError: On bad magic, version or checksum
+    """
+    if len(data) < HEADER.size + U32.size:
+        raise SnapshotError("Snapshot too short")
+    body, (crc,) = data[:-U32.size], U32.unpack_from(data, len(data) - U32.size)
+    if zlib.crc32(body) != crc:
+        raise SnapshotError("Snapshot checksum mismatch")
+
+    magic, version, _flags, count, _created_at = HEADER.unpack_from(body, 0)
+    if magic != MAGIC:
+        raise SnapshotError("Bad magic")
+    if version != VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+
+    now = time.time() if now is None else now
+    view = memoryview(body)
+    offset = HEADER.size
+    sessions = {}
+    for _ in range(count):
+        (id_len,) = U8.unpack_from(view, offset)
+        camera_id = bytes(view[offset + 1:offset + 1 + id_len]).decode('utf-8')
+        offset += 1 + id_len
+        (record_len,) = U32.unpack_from(view, offset)
+        offset += U32.size
+        sessions[camera_id] = _decode_session(view[offset:offset + record_len], now, max_buffer_age)
+        offset += record_len
+    return sessions
+
+
+def load_snapshot(path: str, max_buffer_age: float = DEFAULT_MAX_BUFFER_AGE) -> Dict[str, CameraSession]:
+    """
+    Load sessions from a snapshot file.
+
+    Returns:
+        Sessions by camera ID ({} if the file is missing or invalid)
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        sessions = decode_snapshot(data, max_buffer_age)
+    except FileNotFoundError:
+        return {}
+    except (SnapshotError, struct.error, ValueError) as e:
+        print(f"[Snapshot] Ignoring invalid snapshot {path}: {e}")
+        return {}
+
+    ready = sum(1 for s in sessions.values() if s.buffer.is_full())
+    print(f"[Snapshot] Restored {len(sessions)} cameras from {path} ({ready} with a full window)")
+    return sessions
+
+
+def write_snapshot(path: str, sessions: Dict[str, CameraSession]) -> int:
+    """
+    Atomically write a snapshot file.
+
+    Returns:
+        Bytes written
+    """
+    data = encode_snapshot(sessions)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+class SessionCheckpointer:
+    """
+    Background thread writing periodic snapshots.
+
+    Supports:
+    - Fixed checkpoint interval
+    - Final checkpoint on stop (graceful shutdown)
+    - Write size / duration statistics
+    """
+
+    def __init__(
+        self,
+        get_sessions: Callable[[], Dict[str, CameraSession]],
+        path: str,
+        interval: float = DEFAULT_INTERVAL,
+    ):
+        """
+        Initialize the checkpointer.
+
+        Args:
+            get_sessions: Returns the live sessions by camera ID
+            path: Snapshot file path (on shared storage for failover)
+            interval: Seconds between checkpoints
+        """
+        self.get_sessions = get_sessions
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.checkpoints = 0
+        self.failures = 0
+        self.last_bytes = 0
+        self.last_ms = 0.0
+
+    def start(self):
+        """Start periodic checkpoints"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='SessionCheckpointer', daemon=True)
+        self._thread.start()
+
+    def stop(self, final_checkpoint: bool = True):
+        """Stop the thread, writing one last checkpoint by default"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if final_checkpoint:
+            self.checkpoint()
+
+    def checkpoint(self) -> bool:
+        """
+        Write a snapshot now.
+
+        Failures (I/O errors, or struct.error for values outside the packed
+        ranges, e.g. more than 255 counters) are counted and logged, never
+        raised, so the checkpoint thread keeps running.
+        """
+        start = time.perf_counter()
+        try:
+            self.last_bytes = write_snapshot(self.path, self.get_sessions())
+        except (OSError, ValueError, struct.error) as e:
+            self.failures += 1
+            print(f"[Snapshot] Checkpoint to {self.path} failed: {e}")
+            return False
+        self.last_ms = (time.perf_counter() - start) * 1000
+        self.checkpoints += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'interval_s': self.interval,
+            'checkpoints': self.checkpoints,
+            'failures': self.failures,
+            'last_bytes': self.last_bytes,
+            'last_ms': round(self.last_ms, 2),
+        }
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.checkpoint()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Shared-Memory Ring Buffer
+================================================================================
+
+Fixed-slot ring buffer in shared memory for handing decoded frames and
+skeleton windows to worker processes without pickling.
+
+The producer copies an array into the next free slot (one memcpy) and sends
+only a tiny descriptor (slot, shape, dtype, metadata) over a queue. The
+consumer wraps the slot as a NumPy array in place, uses it, and releases the
+slot. A semaphore counts free slots, so a full ring is reported to the
+producer instead of overwriting frames still in use.
+
+One producer and one consumer per ring; slots are consumed in FIFO order.
+
+Usage:
+    from shm_ring import SharedRing
+
+    ring = SharedRing.create(slots=8, slot_bytes=1280 * 720 * 3, ctx=ctx)
+    # Producer (supervisor)
+    descriptor = ring.put(frame, meta={'camera_id': cam})   # None if full
+    control_queue.put(descriptor)
+    # Consumer (worker process, after unpickling `ring`)
+    array, meta = ring.get(descriptor)
+    ...
+    ring.release(descriptor)
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import multiprocessing
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Defaults
+DEFAULT_SLOTS = 8
+SLOT_ALIGN = 64   # Slot starts aligned for any dtype
+
+
+@dataclass
+class SlotDescriptor:
+    """Small, picklable handle for a filled slot"""
+    slot: int
+    shape: Tuple[int, ...]
+    dtype: str
+    meta: Dict[str, Any]
+
+
+class SharedRing:
+    """
+    Fixed-size slots in one shared memory block.
+
+    Picklable: pass it to the worker process as a Process argument; the
+    child attaches to the same block by name.
+    """
+
+    def __init__(self, name: str, slots: int, slot_bytes: int, free_slots: Any, owner: bool = False):
+        self.name = name
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self._free = free_slots           # multiprocessing.Semaphore(slots)
+        self._owner = owner
+        self._next = 0
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._buffer: Optional[np.ndarray] = None
+
+    @classmethod
+    def create(cls, slots: int = DEFAULT_SLOTS, slot_bytes: int = 1280 * 720 * 3, ctx: Any = None) -> 'SharedRing':
+        """
+        Allocate a new ring.
+
+        Args:
+            slots: Number of frames that can be in flight
+            slot_bytes: Size of each slot (largest array to be sent)
+            ctx: multiprocessing context (for the semaphore)
+        """
+        ctx = ctx or multiprocessing.get_context()
+        slot_bytes = -(-slot_bytes // SLOT_ALIGN) * SLOT_ALIGN
+        shm = shared_memory.SharedMemory(create=True, size=slots * slot_bytes)
+        ring = cls(shm.name, slots, slot_bytes, ctx.Semaphore(slots), owner=True)
+        ring._attach(shm)
+        return ring
+
+    def __getstate__(self):
+        return {'name': self.name, 'slots': self.slots, 'slot_bytes': self.slot_bytes, 'free': self._free}
+
+    def __setstate__(self, state):
+        self.__init__(state['name'], state['slots'], state['slot_bytes'], state['free'])
+
+    def put(self, array: np.ndarray, meta: Optional[Dict[str, Any]] = None) -> Optional[SlotDescriptor]:
+        """
+        Copy an array into the next free slot (producer side).
+
+        Returns:
+            Descriptor to send to the consumer, or None if the ring is full
+
+        Raises:
+            ValueError: If the array does not fit in a slot
+        """
+        if array.nbytes > self.slot_bytes:
+            raise ValueError(f"Array of {array.nbytes} bytes exceeds slot size {self.slot_bytes}")
+        if not self._free.acquire(block=False):
+            return None
+
+        slot = self._next
+        self._next = (self._next + 1) % self.slots
+        target = self._slot_view(slot, array.shape, array.dtype)
+        np.copyto(target, array)
+        return SlotDescriptor(slot, tuple(array.shape), array.dtype.str, meta or {})
+
+    def get(self, descriptor: SlotDescriptor) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Array view over a filled slot (consumer side, no copy).
+
+        The view is valid until release(); copy it if it must outlive that.
+        """
+        return self._slot_view(descriptor.slot, descriptor.shape, np.dtype(descriptor.dtype)), descriptor.meta
+
+    def release(self, descriptor: SlotDescriptor):
+        """Return a slot to the producer"""
+        self._free.release()
+
+    def close(self):
+        """Detach; the creating process also unlinks the block"""
+        self._buffer = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                pass  # Views still referenced; the mapping goes away with them
+            if self._owner:
+                self._shm.unlink()
+            self._shm = None
+
+    def _slot_view(self, slot: int, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        if self._buffer is None:
+            # Workers share the creator's resource tracker (spawn), which
+            # unlinks the block only if the creator never does
+            self._attach(shared_memory.SharedMemory(name=self.name))
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        start = slot * self.slot_bytes
+        return self._buffer[start:start + nbytes].view(dtype).reshape(shape)
+
+    def _attach(self, shm: shared_memory.SharedMemory):
+        self._shm = shm
+        self._buffer = np.ndarray((self.slots * self.slot_bytes,), dtype=np.uint8, buffer=shm.buf)
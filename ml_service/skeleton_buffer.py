@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Skeleton Ring Buffer
+================================================================================
+
+Incremental 32-frame skeleton window for the Smart Veto models.
+
+The live server used to rebuild the whole (C, T, V, M) window from a list of
+per-frame keypoints every time a frame arrived. This buffer keeps the last T
+frames in a preallocated ring so that appending a frame is O(1) and the
+ordered window is only materialized when the scheduler decides to run the
+graph networks.
+
+Features:
+- Preallocated float32 storage, no per-frame allocation
+- Chronologically ordered (C, T, V, M) window on demand
+- Optional output array reuse for the window copy
+- Frame counter for stride / keyframe bookkeeping
+
+Usage:
+    from skeleton_buffer import SkeletonRingBuffer
+
+    buffer = SkeletonRingBuffer()
+    buffer.append(kpts)          # kpts: (M=2, V=17, C=3)
+
+    if buffer.is_full():
+        window = buffer.window()  # (C=3, T=32, V=17, M=2)
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+# Window geometry (must match the trained STGCNPP / MSG3D checkpoints)
+WINDOW_SIZE = 32      # T: frames per analysis window
+NUM_PERSONS = 2       # M: BatchNorm trained with 2 people
+NUM_JOINTS = 17       # V: COCO keypoints
+NUM_CHANNELS = 3      # C: x, y, confidence
+
+
+class SkeletonRingBuffer:
+    """
+    Fixed-size ring of per-frame skeletons for one camera.
+
+    Frames are stored as (T, M, V, C) so that a whole frame is written with a
+    single contiguous copy. `window()` returns the model layout (C, T, V, M).
+    """
+
+    def __init__(
+        self,
+        window_size: int = WINDOW_SIZE,
+        num_persons: int = NUM_PERSONS,
+        num_joints: int = NUM_JOINTS,
+        num_channels: int = NUM_CHANNELS,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            window_size: Number of frames per window (T)
+            num_persons: Skeletons per frame (M)
+            num_joints: Keypoints per skeleton (V)
+            num_channels: Values per keypoint (C)
+        """
+        self.window_size = window_size
+        self._data = np.zeros(
+            (window_size, num_persons, num_joints, num_channels), dtype=np.float32
+        )
+        self._head = 0          # Next write position
+        self._count = 0         # Valid frames (<= window_size)
+        self.frames_seen = 0    # Total frames appended since last clear
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def frame_shape(self):
+        """Shape of a single frame entry (M, V, C)"""
+        return self._data.shape[1:]
+
+    def append(self, kpts: np.ndarray):
+        """
+        Append one frame of keypoints.
+
+        Args:
+            kpts: Array of shape (M, V, C)
+        """
+        self._data[self._head] = kpts
+        self._head = (self._head + 1) % self.window_size
+        if self._count < self.window_size:
+            self._count += 1
+        self.frames_seen += 1
+
+    def is_full(self) -> bool:
+        """True once a complete window is available"""
+        return self._count == self.window_size
+
+    def latest(self) -> Optional[np.ndarray]:
+        """Most recently appended frame (M, V, C), or None if empty"""
+        if self._count == 0:
+            return None
+        return self._data[(self._head - 1) % self.window_size]
+
+    def frames(self) -> np.ndarray:
+        """
+        Buffered frames in chronological order.
+
+        Returns:
+            Array of shape (count, M, V, C) (a copy)
+        """
+        if self._count < self.window_size:
+            return self._data[:self._count].copy()
+        return np.concatenate((self._data[self._head:], self._data[:self._head]))
+
+    def window(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Materialize the ordered window in model layout.
+
+        Args:
+            out: Optional preallocated (C, T, V, M) float32 array to fill
+
+        Returns:
+            Array of shape (C, T, V, M). Missing frames (buffer not yet full)
+            are left as zeros at the start of the window.
+        """
+        c = self._data.shape[3]
+        v = self._data.shape[2]
+        m = self._data.shape[1]
+        if out is None:
+            out = np.zeros((c, self.window_size, v, m), dtype=np.float32)
+        elif self._count < self.window_size:
+            out.fill(0)
+
+        # (T, M, V, C) -> (C, T, V, M) view of the storage
+        view = self._data.transpose(3, 0, 2, 1)
+        if self._count < self.window_size:
+            out[:, self.window_size - self._count:] = view[:, :self._count]
+        else:
+            tail = self.window_size - self._head
+            out[:, :tail] = view[:, self._head:]
+            out[:, tail:] = view[:, :self._head]
+        return out
+
+    def get_state(self) -> Dict[str, Any]:
+        """Buffered frames and counters (for handover / snapshots)"""
+        return {'frames': self.frames(), 'frames_seen': self.frames_seen}
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restore state produced by get_state()"""
+        self.clear()
+        for kpts in np.asarray(state['frames'], dtype=np.float32)[-self.window_size:]:
+            self.append(kpts)
+        self.frames_seen = int(state.get('frames_seen', self._count))
+
+    def clear(self):
+        """Drop all buffered frames"""
+        self._data.fill(0)
+        self._head = 0
+        self._count = 0
+        self.frames_seen = 0
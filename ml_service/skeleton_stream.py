@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Delta-Encoded Skeleton Stream
+================================================================================
+
+Per-connection delta encoding of visualized skeletons.
+
+Responses used to carry all 17x3 keypoints of every visualized person on
+every frame, although skeletons barely move between frames. The encoder
+keeps the last skeleton sent for each track ID (from SkeletonTracker) and
+sends only quantized per-joint changes; joints that moved less than a
+small dead-band (1 px by default, invisible in the overlay) are not sent
+at all. Full skeletons (keyframes) are sent for new tracks, every
+`keyframe_interval` messages and when the client asks for a resync.
+
+Layout (little-endian), version 1:
+
+    offset  size  field
+    0       4     magic 'NXVS'
+    4       1     version (1)
+    5       1     flags (bit0 keyframe)
+    6       2     sequence number (uint16, wraps)
+    8       2     person count P
+    10      2     reserved
+    12      ...   P person records:
+                  track id (uint16), kind (uint8), reserved (uint8), then
+                  kind 0 (full):  int16[17][3]                     (102 bytes)
+                  kind 1 (delta): changed-joint mask (uint32),
+                                  int8[3] per changed joint, padded to even
+
+Quantization matches result_codec (x, y in 1/4 px, confidence in 1/32767);
+delta units are 1/4 px for x, y and 1/256 for confidence. The encoder
+diffs against what the client reconstructed (not the raw floats), so
+errors do not accumulate. People not listed in a message are gone.
+
+The TypeScript decoder lives in src/lib/skeleton-stream.ts.
+
+Clients opt in with "skeletons": "delta" in their hello message; the
+server acknowledges with "skeletons": "delta" in its hello reply
+(ResultEncoder.hello), then omits `all_skeletons` from results and sends a
+stream message before each result.
+
+Usage:
+    from skeleton_stream import SkeletonDeltaEncoder, wants_delta_skeletons
+
+    stream = SkeletonDeltaEncoder() if wants_delta_skeletons(hello) else None
+    await websocket.send(encoder.hello('delta' if stream is not None else 'full'))
+    if stream is not None:
+        await websocket.send(stream.encode(pose.kpts_visual, pose.boxes))
+        response.pop('all_skeletons', None)
+    # On {"type": "resync"} from the client:
+    stream.request_keyframe()
+
+Benchmark: benchmarks/bench_skeleton_stream.py
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from result_codec import XY_SCALE, dequantize_skeletons, quantize_skeletons
+from skeleton_tracker import SkeletonTracker
+
+MAGIC = b'NXVS'
+VERSION = 1
+HEADER = struct.Struct('<4sBBHHH')
+HEADER_SIZE = HEADER.size  # 12 bytes
+PERSON_HEADER = struct.Struct('<HBB')
+MASK = struct.Struct('<I')
+
+NUM_JOINTS = 17
+KIND_FULL = 0
+KIND_DELTA = 1
+FLAG_KEYFRAME = 1
+
+# Confidence deltas are sent in 1/256 units (int16 conf >> 7)
+CONF_DELTA_SHIFT = 7
+
+# Defaults
+DEFAULT_KEYFRAME_INTERVAL = 30   # Messages between forced keyframes
+DEFAULT_DEADBAND_PX = 1.0        # Joint moves up to this are not sent
+CONF_DEADBAND = 2                # Confidence changes up to 2/256 are not sent
+
+
+def wants_delta_skeletons(hello: Optional[Dict[str, Any]]) -> bool:
+    """True if the client hello asked for the delta skeleton stream"""
+    return bool(hello) and hello.get('skeletons') == 'delta'
+
+
+def _boxes_from_keypoints(skeletons: np.ndarray) -> List[np.ndarray]:
+    """xyxy boxes around visible keypoints, for tracking without YOLO boxes"""
+    boxes = []
+    for kpts in skeletons:
+        visible = kpts[kpts[:, 2] > 0]
+        pts = visible if len(visible) else kpts
+        boxes.append(np.array([pts[:, 0].min(), pts[:, 1].min(), pts[:, 0].max(), pts[:, 1].max()]))
+    return boxes
+
+
+class SkeletonDeltaEncoder:
+    """
+    Delta encoder for one connection's skeleton stream.
+
+    Not thread-safe: each connection (and camera) owns its own encoder.
+    """
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+                 deadband_px: float = DEFAULT_DEADBAND_PX,
+                 tracker: Optional[SkeletonTracker] = None):
+        """
+        Initialize the encoder.
+
+        Args:
+            keyframe_interval: Messages between forced keyframes
+            deadband_px: Joint movement (pixels) below which nothing is sent;
+                0 for lossless deltas
+            tracker: Tracker assigning track IDs (a new one by default)
+        """
+        self.keyframe_interval = keyframe_interval
+        self._deadband = int(round(deadband_px * XY_SCALE))
+        self.tracker = tracker or SkeletonTracker()
+        self._last: Dict[int, np.ndarray] = {}   # track id -> int16 (17, 3) as reconstructed
+        self._seq = 0
+        self._since_keyframe = 0
+        self._force_keyframe = True
+
+        self.messages = 0
+        self.keyframes = 0
+        self.bytes_sent = 0
+        self.full_bytes = 0     # Bytes if every skeleton were sent in full
+
+    def request_keyframe(self):
+        """Send full skeletons in the next message (client resync)"""
+        self._force_keyframe = True
+
+    def encode(self, skeletons: Any, boxes: Optional[Sequence[np.ndarray]] = None) -> bytes:
+        """
+        Encode the skeletons visible in this frame.
+
+        Args:
+            skeletons: (P, 17, 3) keypoints (x, y, conf)
+            boxes: Matching xyxy boxes; derived from keypoints if omitted
+
+        Returns:
+            Binary skeleton stream message
+        """
+        quantized = quantize_skeletons(skeletons) if len(skeletons) else np.empty((0, NUM_JOINTS, 3), np.int16)
+        if boxes is None:
+            boxes = _boxes_from_keypoints(np.asarray(skeletons, dtype=np.float32).reshape(-1, NUM_JOINTS, 3))
+        track_ids = self.tracker.update(list(boxes))
+
+        keyframe = self._force_keyframe or self._since_keyframe >= self.keyframe_interval
+        if keyframe:
+            self._force_keyframe = False
+            self._since_keyframe = 0
+            self.keyframes += 1
+        else:
+            self._since_keyframe += 1
+
+        parts = [HEADER.pack(MAGIC, VERSION, FLAG_KEYFRAME if keyframe else 0,
+                             self._seq & 0xFFFF, len(quantized), 0)]
+        current: Dict[int, np.ndarray] = {}
+
+        for track_id, kpts in zip(track_ids, quantized):
+            wire_id = track_id & 0xFFFF
+            previous = None if keyframe else self._last.get(wire_id)
+            record = None if previous is None else self._encode_delta(previous, kpts)
+            if record is None:
+                parts.append(PERSON_HEADER.pack(wire_id, KIND_FULL, 0))
+                parts.append(kpts.tobytes())
+                current[wire_id] = kpts
+            else:
+                parts.append(PERSON_HEADER.pack(wire_id, KIND_DELTA, 0))
+                parts.append(record[0])
+                current[wire_id] = record[1]
+
+        self._last = current
+        self._seq += 1
+        message = b''.join(parts)
+
+        self.messages += 1
+        self.bytes_sent += len(message)
+        self.full_bytes += HEADER_SIZE + len(quantized) * (PERSON_HEADER.size + NUM_JOINTS * 3 * 2)
+        return message
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Messages, keyframes and bytes compared with full skeletons"""
+        return {
+            'messages': self.messages,
+            'keyframes': self.keyframes,
+            'tracks': len(self._last),
+            'bytes_sent': self.bytes_sent,
+            'avg_bytes': round(self.bytes_sent / max(self.messages, 1), 1),
+            'compression_vs_full': round(self.full_bytes / max(self.bytes_sent, 1), 2),
+        }
+
+    def _encode_delta(self, previous: np.ndarray, kpts: np.ndarray) -> Optional[Tuple[bytes, np.ndarray]]:
+        """
+        Delta record for one person.
+
+        Returns:
+            (record bytes, skeleton as the client will reconstruct it), or
+            None if a joint moved too far for int8 (sent in full instead)
+        """
+        delta = kpts.astype(np.int32) - previous
+        delta[:, 2] >>= CONF_DELTA_SHIFT
+        if np.abs(delta).max() > 127:
+            return None
+        moved = (np.abs(delta[:, :2]) > self._deadband).any(axis=1) | (np.abs(delta[:, 2]) > CONF_DEADBAND)
+        changed = np.flatnonzero(moved)
+
+        mask = 0
+        for joint in changed:
+            mask |= 1 << int(joint)
+        values = delta[changed].astype(np.int8).tobytes()
+        if len(values) % 2:
+            values += b'\x00'
+
+        reconstructed = previous.copy()
+        applied = delta[changed]
+        applied[:, 2] <<= CONF_DELTA_SHIFT
+        reconstructed[changed] = (previous[changed].astype(np.int32) + applied).astype(np.int16)
+        return MASK.pack(mask) + values, reconstructed
+
+
+class SkeletonDeltaDecoder:
+    """
+    Reference decoder (tools and benchmarks).
+
+    Mirrors SkeletonStreamDecoder in src/lib/skeleton-stream.ts.
+    """
+
+    def __init__(self):
+        self._tracks: Dict[int, np.ndarray] = {}
+        self._seq: Optional[int] = None
+        self.needs_resync = False
+
+    def decode(self, data: bytes) -> Dict[int, np.ndarray]:
+        """
+        Apply a message and return the visible skeletons.
+
+        Returns:
+            track id -> (17, 3) float32 keypoints. Sets `needs_resync` if a
+            delta referenced an unknown track or a message was missed.
+        """
+        magic, version, flags, seq, count, _ = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a skeleton stream message")
+        keyframe = bool(flags & FLAG_KEYFRAME)
+        if keyframe:
+            self.needs_resync = False
+        elif self._seq is not None and seq != (self._seq + 1) & 0xFFFF:
+            self.needs_resync = True
+        self._seq = seq
+
+        offset = HEADER_SIZE
+        tracks: Dict[int, np.ndarray] = {}
+        for _ in range(count):
+            track_id, kind, _ = PERSON_HEADER.unpack_from(data, offset)
+            offset += PERSON_HEADER.size
+            if kind == KIND_FULL:
+                kpts = np.frombuffer(data, dtype=np.int16, count=NUM_JOINTS * 3, offset=offset).reshape(NUM_JOINTS, 3)
+                offset += NUM_JOINTS * 3 * 2
+                tracks[track_id] = kpts.copy()
+                continue
+
+            (mask,) = MASK.unpack_from(data, offset)
+            offset += MASK.size
+            joints = [j for j in range(NUM_JOINTS) if mask & (1 << j)]
+            delta = np.frombuffer(data, dtype=np.int8, count=len(joints) * 3, offset=offset).reshape(-1, 3)
+            offset += len(joints) * 3 + (len(joints) * 3) % 2
+            previous = self._tracks.get(track_id)
+            if previous is None:
+                self.needs_resync = True
+                continue
+            kpts = previous.copy()
+            applied = delta.astype(np.int32)
+            applied[:, 2] <<= CONF_DELTA_SHIFT
+            kpts[joints] = (previous[joints].astype(np.int32) + applied).astype(np.int16)
+            tracks[track_id] = kpts
+
+        self._tracks = tracks
+        return {tid: dequantize_skeletons(k) for tid, k in tracks.items()}
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Skeleton Tracker
+================================================================================
+
+Lightweight IoU tracker that gives each detected person a stable track ID.
+
+YOLO pose returns people in arbitrary order per frame. Keypoint
+interpolation, ROI crops and delta-encoded skeleton streaming all need to know
+which skeleton in this frame is the same person as in the previous one. The
+tracker greedily matches boxes by IoU (largest overlap first) and keeps
+unmatched tracks alive for a few updates.
+
+Usage:
+    from skeleton_tracker import SkeletonTracker
+
+    tracker = SkeletonTracker()
+    track_ids = tracker.update(pose.boxes)   # one ID per box, same order
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from pose_utils import calc_iou
+
+# Defaults
+DEFAULT_MATCH_IOU = 0.3   # Minimum IoU to continue a track
+DEFAULT_MAX_AGE = 5       # Updates a track survives without a match
+
+
+@dataclass
+class Track:
+    """One tracked person"""
+    track_id: int
+    box: np.ndarray        # Last xyxy box
+    age: int = 0           # Updates since last match
+    hits: int = 1          # Total matches
+
+
+class SkeletonTracker:
+    """
+    Greedy IoU tracker for one camera.
+
+    Not thread-safe: each camera owns its own tracker.
+    """
+
+    def __init__(self, match_iou: float = DEFAULT_MATCH_IOU, max_age: int = DEFAULT_MAX_AGE):
+        """
+        Initialize the tracker.
+
+        Args:
+            match_iou: Minimum IoU for a detection to continue a track
+            max_age: Updates an unmatched track is kept before it is dropped
+        """
+        self.match_iou = match_iou
+        self.max_age = max_age
+        self.tracks: Dict[int, Track] = {}
+        self._next_id = 1
+
+    def update(self, boxes: Sequence[np.ndarray]) -> List[int]:
+        """
+        Assign track IDs to this frame's boxes.
+
+        Args:
+            boxes: xyxy boxes for the frame's people
+
+        Returns:
+            Track ID for each box, in the same order
+        """
+        pairs = []
+        for track_id, track in self.tracks.items():
+            for i, box in enumerate(boxes):
+                iou = calc_iou(track.box, box)
+                if iou >= self.match_iou:
+                    pairs.append((iou, track_id, i))
+        pairs.sort(reverse=True)
+
+        assigned: List[int] = [0] * len(boxes)
+        used_tracks = set()
+        for iou, track_id, i in pairs:
+            if track_id in used_tracks or assigned[i]:
+                continue
+            track = self.tracks[track_id]
+            track.box = np.asarray(boxes[i], dtype=np.float32)
+            track.age = 0
+            track.hits += 1
+            assigned[i] = track_id
+            used_tracks.add(track_id)
+
+        for track_id, track in list(self.tracks.items()):
+            if track_id not in used_tracks:
+                track.age += 1
+                if track.age > self.max_age:
+                    del self.tracks[track_id]
+
+        for i, box in enumerate(boxes):
+            if not assigned[i]:
+                track_id = self._next_id
+                self._next_id += 1
+                self.tracks[track_id] = Track(track_id, np.asarray(box, dtype=np.float32))
+                assigned[i] = track_id
+
+        return assigned
+
+    def active_boxes(self) -> Dict[int, np.ndarray]:
+        """Boxes of tracks matched in the latest update"""
+        return {tid: t.box for tid, t in self.tracks.items() if t.age == 0}
+
+    def reset(self):
+        """Drop all tracks"""
+        self.tracks.clear()
+
+    def get_state(self) -> Dict[str, Any]:
+        """Serializable tracker state (for handover / snapshots)"""
+        return {
+            'next_id': self._next_id,
+            'tracks': [
+                {'id': t.track_id, 'box': t.box.tolist(), 'age': t.age, 'hits': t.hits}
+                for t in self.tracks.values()
+            ],
+        }
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restore state produced by get_state()"""
+        self._next_id = int(state.get('next_id', 1))
+        self.tracks = {
+            int(t['id']): Track(int(t['id']), np.asarray(t['box'], dtype=np.float32),
+                                int(t.get('age', 0)), int(t.get('hits', 1)))
+            for t in state.get('tracks', [])
+        }
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+NexaraVision Tenant Fair Scheduler
+================================================================================
+
+Weighted fair queuing of pose (frame) and GCN (window) jobs across tenants.
+
+One tenant with a 16-cell MultiCameraGrid could saturate a node and starve
+smaller tenants, because jobs were served first come, first served. The
+scheduler keeps a queue per tenant (userId) and, inside it, per camera:
+
+- Tenants are served by weighted fair queuing: each job gets a virtual
+  finish time (start + estimated cost / tenant weight) and the smallest one
+  runs next, so compute is shared in proportion to the weights.
+- Each tenant may have a compute budget (ms of pose + GCN per second).
+  Tenants over budget are only served when no one else has work.
+- Within a tenant, cameras take turns (round robin), unless camera
+  priorities are set (set_camera_priority, e.g. from RiskAdaptiveController):
+  then the tenant's highest-priority camera goes first.
+- Every camera is guaranteed a minimum throughput: a camera that has waited
+  longer than 1 / min_camera_fps jumps the queue.
+- Per-camera queues are bounded (oldest job dropped).
+
+Per-tenant accounting of pose and GCN milliseconds is exposed via
+get_stats() for metrics.
+
+Usage:
+    from tenant_scheduler import FairScheduler
+
+    scheduler = FairScheduler(min_camera_fps=1.0)
+    scheduler.set_tenant(user_id, weight=1.0, budget_ms_per_s=400)
+
+    scheduler.put(user_id, camera_id, 'pose', frame_job)   # ingest side
+
+    job = scheduler.get(timeout=0.1)                        # worker side
+    start = time.perf_counter()
+    run(job.item)
+    scheduler.complete(job, (time.perf_counter() - start) * 1000)
+
+Author: NexaraVision AI Team
+Date: October 19, 2026
+================================================================================
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Tuple
+
+# Defaults
+DEFAULT_WEIGHT = 1.0
+DEFAULT_MIN_CAMERA_FPS = 1.0       # Guaranteed jobs/s per camera
+DEFAULT_MAX_PENDING = 4            # Jobs queued per camera before dropping
+DEFAULT_COST_MS = {'pose': 15.0, 'gcn': 10.0}
+COST_EMA = 0.1                     # Smoothing of measured job cost
+USAGE_WINDOW = 5.0                 # Seconds for ms/s usage rates
+ANONYMOUS_TENANT = 'anonymous'
+
+JOB_KINDS = ('pose', 'gcn')
+
+
+@dataclass
+class Job:
+    """A scheduled unit of work"""
+    tenant_id: str
+    camera_id: str
+    kind: str                      # 'pose' or 'gcn'
+    item: Any
+    enqueued_at: float
+    finish_tag: float = 0.0
+
+
+@dataclass
+class TenantState:
+    """Queues, weight, budget and accounting for one tenant"""
+    weight: float = DEFAULT_WEIGHT
+    budget_ms_per_s: Optional[float] = None
+    cameras: 'OrderedDict[str, Deque[Job]]' = field(default_factory=OrderedDict)
+    priorities: Dict[str, float] = field(default_factory=dict)
+    last_finish: float = 0.0
+    tokens_ms: float = 0.0
+    tokens_ts: float = 0.0
+    ms: Dict[str, float] = field(default_factory=lambda: {kind: 0.0 for kind in JOB_KINDS})
+    jobs: Dict[str, int] = field(default_factory=lambda: {kind: 0 for kind in JOB_KINDS})
+    dropped: int = 0
+    guaranteed: int = 0
+    usage: Deque = field(default_factory=deque)    # (ts, ms)
+
+    def pending(self) -> int:
+        return sum(len(q) for q in self.cameras.values())
+
+    def within_budget(self) -> bool:
+        return self.budget_ms_per_s is None or self.tokens_ms > 0
+
+
+class FairScheduler:
+    """
+    Weighted fair queue over tenants and cameras.
+
+    Supports:
+    - Per-tenant weights and compute budgets
+    - Round robin or priority order across a tenant's cameras
+    - Minimum throughput per camera
+    - Per-tenant pose / GCN ms accounting
+    - Thread-safe, blocking get()
+    """
+
+    def __init__(
+        self,
+        min_camera_fps: float = DEFAULT_MIN_CAMERA_FPS,
+        max_pending_per_camera: int = DEFAULT_MAX_PENDING,
+        default_weight: float = DEFAULT_WEIGHT,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            min_camera_fps: Jobs per second guaranteed to every camera with
+                pending work (0 disables the guarantee)
+            max_pending_per_camera: Queue bound per camera (oldest dropped)
+            default_weight: Weight of tenants not configured explicitly
+        """
+        self.min_camera_fps = min_camera_fps
+        self.max_pending = max(1, max_pending_per_camera)
+        self.default_weight = default_weight
+        self._tenants: Dict[str, TenantState] = {}
+        self._last_served: Dict[Tuple[str, str], float] = {}   # (tenant, camera) -> last dispatch time
+        self._cost_ms = dict(DEFAULT_COST_MS)
+        self._virtual_time = 0.0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def set_tenant(self, tenant_id: Optional[str], weight: float = DEFAULT_WEIGHT,
+                   budget_ms_per_s: Optional[float] = None):
+        """
+        Configure a tenant.
+
+        Args:
+            tenant_id: userId (None = anonymous)
+            weight: Relative share of compute
+            budget_ms_per_s: Pose + GCN milliseconds per second the tenant
+                may use while others are waiting (None = unlimited)
+        """
+        with self._lock:
+            state = self._get_or_create(tenant_id or ANONYMOUS_TENANT)
+            state.weight = max(weight, 1e-3)
+            state.budget_ms_per_s = budget_ms_per_s
+            state.tokens_ms = budget_ms_per_s or 0.0
+            state.tokens_ts = time.monotonic()
+
+    def set_camera_priority(self, tenant_id: Optional[str], camera_id: str, priority: float):
+        """
+        Set a camera's priority within its tenant.
+
+        Higher priority cameras of a tenant are served first; the tenant's
+        share and every camera's minimum throughput are unaffected.
+        """
+        with self._lock:
+            state = self._get_or_create(tenant_id or ANONYMOUS_TENANT)
+            state.priorities[camera_id] = priority
+
+    def put(self, tenant_id: Optional[str], camera_id: str, kind: str, item: Any) -> bool:
+        """
+        Queue a job.
+
+        Returns:
+            False if an older job of the same camera was dropped
+        """
+        now = time.monotonic()
+        with self._lock:
+            tenant_id = tenant_id or ANONYMOUS_TENANT
+            state = self._get_or_create(tenant_id)
+            queue = state.cameras.get(camera_id)
+            if queue is None:
+                queue = state.cameras[camera_id] = deque()
+                self._last_served.setdefault((tenant_id, camera_id), now)
+
+            dropped = False
+            if len(queue) >= self.max_pending:
+                queue.popleft()
+                state.dropped += 1
+                dropped = True
+
+            job = Job(tenant_id or ANONYMOUS_TENANT, camera_id, kind, item, now)
+            queue.append(job)
+            self._not_empty.notify()
+            return not dropped
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Job]:
+        """
+        Next job to run, waiting up to `timeout` seconds.
+
+        Returns:
+            Job, or None on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._not_empty:
+            while True:
+                job = self._select(time.monotonic())
+                if job is not None:
+                    return job
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._not_empty.wait(remaining)
+
+    def complete(self, job: Job, elapsed_ms: float):
+        """Account the measured cost of a finished job"""
+        now = time.monotonic()
+        with self._lock:
+            state = self._get_or_create(job.tenant_id)
+            state.ms[job.kind] = state.ms.get(job.kind, 0.0) + elapsed_ms
+            state.jobs[job.kind] = state.jobs.get(job.kind, 0) + 1
+            state.usage.append((now, elapsed_ms))
+            if state.budget_ms_per_s is not None:
+                state.tokens_ms -= elapsed_ms
+            cost = self._cost_ms.get(job.kind, elapsed_ms)
+            self._cost_ms[job.kind] = cost + COST_EMA * (elapsed_ms - cost)
+
+    def remove_camera(self, tenant_id: Optional[str], camera_id: str):
+        """Drop a disconnected camera's queue"""
+        tenant_id = tenant_id or ANONYMOUS_TENANT
+        with self._lock:
+            state = self._tenants.get(tenant_id)
+            if state is not None:
+                state.cameras.pop(camera_id, None)
+                state.priorities.pop(camera_id, None)
+            self._last_served.pop((tenant_id, camera_id), None)
+
+    def get_tenant_stats(self, tenant_id: Optional[str]) -> Dict[str, Any]:
+        """Accounting for one tenant"""
+        now = time.monotonic()
+        with self._lock:
+            state = self._tenants.get(tenant_id or ANONYMOUS_TENANT)
+            if state is None:
+                return {}
+            return self._tenant_stats(state, now)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-tenant accounting and scheduler totals"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'tenants': {tid: self._tenant_stats(s, now) for tid, s in self._tenants.items()},
+                'pending': sum(s.pending() for s in self._tenants.values()),
+                'cost_ms': {k: round(v, 2) for k, v in self._cost_ms.items()},
+                'min_camera_fps': self.min_camera_fps,
+            }
+
+    def _select(self, now: float) -> Optional[Job]:
+        """Pick and dequeue the next job (caller holds the lock)"""
+        backlogged = [(tid, s) for tid, s in self._tenants.items() if s.pending()]
+        if not backlogged:
+            return None
+
+        # 1. Minimum throughput guarantee: most overdue camera first
+        if self.min_camera_fps > 0:
+            max_gap = 1.0 / self.min_camera_fps
+            overdue = None
+            for tenant_id, state in backlogged:
+                for camera_id, queue in state.cameras.items():
+                    if queue:
+                        gap = now - self._last_served.get((tenant_id, camera_id), now)
+                        if gap > max_gap and (overdue is None or gap > overdue[0]):
+                            overdue = (gap, state, camera_id)
+            if overdue is not None:
+                _, state, camera_id = overdue
+                state.guaranteed += 1
+                return self._dequeue(state, camera_id, now)
+
+        # 2. Weighted fair queuing among tenants within budget (work-conserving)
+        for state in (s for _, s in backlogged):
+            self._refill(state, now)
+        eligible = [s for _, s in backlogged if s.within_budget()]
+        candidates = eligible or [s for _, s in backlogged]
+
+        best = None
+        for state in candidates:
+            # max() keeps the first of equal priorities, i.e. round-robin order
+            camera_id = max((cid for cid, q in state.cameras.items() if q),
+                            key=lambda cid: state.priorities.get(cid, 0.0))
+            kind = state.cameras[camera_id][0].kind
+            start = max(self._virtual_time, state.last_finish)
+            finish = start + self._cost_ms.get(kind, DEFAULT_COST_MS['gcn']) / state.weight
+            if best is None or finish < best[0]:
+                best = (finish, start, state, camera_id)
+
+        finish, start, state, camera_id = best
+        state.last_finish = finish
+        self._virtual_time = start
+        job = self._dequeue(state, camera_id, now)
+        job.finish_tag = finish
+        return job
+
+    def _dequeue(self, state: TenantState, camera_id: str, now: float) -> Job:
+        """Pop a camera's oldest job and rotate it to the back (round robin)"""
+        job = state.cameras[camera_id].popleft()
+        state.cameras.move_to_end(camera_id)
+        self._last_served[(job.tenant_id, camera_id)] = now
+        return job
+
+    def _refill(self, state: TenantState, now: float):
+        """Token bucket refill for the tenant budget (one second of burst)"""
+        if state.budget_ms_per_s is None:
+            return
+        elapsed = now - state.tokens_ts
+        state.tokens_ts = now
+        state.tokens_ms = min(state.budget_ms_per_s, state.tokens_ms + elapsed * state.budget_ms_per_s)
+
+    def _tenant_stats(self, state: TenantState, now: float) -> Dict[str, Any]:
+        while state.usage and state.usage[0][0] < now - USAGE_WINDOW:
+            state.usage.popleft()
+        used = sum(ms for _, ms in state.usage) / USAGE_WINDOW
+        return {
+            'weight': state.weight,
+            'budget_ms_per_s': state.budget_ms_per_s,
+            'usage_ms_per_s': round(used, 1),
+            'cameras': len(state.cameras),
+            'pending': state.pending(),
+            'pose_ms': round(state.ms.get('pose', 0.0), 1),
+            'gcn_ms': round(state.ms.get('gcn', 0.0), 1),
+            'pose_jobs': state.jobs.get('pose', 0),
+            'gcn_jobs': state.jobs.get('gcn', 0),
+            'dropped': state.dropped,
+            'guaranteed_dispatches': state.guaranteed,
+        }
+
+    def _get_or_create(self, tenant_id: str) -> TenantState:
+        """Get tenant state (caller holds the lock)"""
+        state = self._tenants.get(tenant_id)
+        if state is None:
+            state = TenantState(weight=self.default_weight, tokens_ts=time.monotonic())
+            self._tenants[tenant_id] = state
+        return state
+
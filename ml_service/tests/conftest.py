@@ -0,0 +1,8 @@
+"""Make the flat ml_service modules importable from the tests"""
+
+import os
+import sys
+
+ML_SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ML_SERVICE_DIR not in sys.path:
+    sys.path.insert(0, ML_SERVICE_DIR)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Round-trip tests pinning the binary wire formats shared with the TypeScript
+client: frame messages (frame_protocol, src/lib/frame-protocol.ts), compact
+results (result_codec, src/lib/result-codec.ts) and the skeleton delta
+stream (skeleton_stream, src/lib/skeleton-stream.ts).
+
+Run from ml_service/:
+    python3 -m pytest -q tests
+"""
+
+import json
+import struct
+
+import numpy as np
+import pytest
+
+import frame_protocol
+import result_codec
+import skeleton_stream
+from frame_protocol import ProtocolError
+
+
+def make_skeletons(count: int, seed: int = 0) -> np.ndarray:
+    """(P, 17, 3) keypoints exactly representable after quantization"""
+    rng = np.random.default_rng(seed)
+    kpts = np.empty((count, 17, 3), dtype=np.float32)
+    kpts[..., :2] = rng.integers(0, 640 * 4, size=(count, 17, 2)) / 4.0
+    kpts[..., 2] = rng.integers(0, 32768, size=(count, 17)) / 32767.0
+    return kpts
+
+
+# ---------------------------------------------------------------------------
+# Frame messages (NXVF)
+# ---------------------------------------------------------------------------
+
+def test_frame_header_layout():
+    assert frame_protocol.HEADER_SIZE == 18
+
+    data = frame_protocol.encode_binary_message(
+        [b'\xff\xd8abc', b'\xff\xd8de'], camera_id='cam-1', user_id='u', timestamp=1234.5)
+
+    assert data[:4] == b'NXVF'
+    assert data[4] == 1 and data[5] == 0
+    assert struct.unpack_from('<H', data, 6)[0] == 2
+    assert struct.unpack_from('<d', data, 8)[0] == 1234.5
+    assert data[16] == 5 and data[17] == 1
+    assert data[18:23] == b'cam-1' and data[23:24] == b'u'
+    assert struct.unpack_from('<2I', data, 24) == (5, 4)
+    assert data[32:] == b'\xff\xd8abc\xff\xd8de'
+
+
+def test_frame_message_round_trip():
+    frames = [b'\xff\xd8' + bytes(range(200)), b'\xff\xd8\x00']
+    data = frame_protocol.encode_binary_message(frames, 'kamera-٣', 'user-1', 42.0)
+
+    message = frame_protocol.parse_message(data)
+
+    assert message.binary
+    assert message.type == frame_protocol.FRAME_MESSAGE_TYPE
+    assert (message.camera_id, message.user_id, message.timestamp) == ('kamera-٣', 'user-1', 42.0)
+    assert [bytes(f) for f in message.frames] == frames
+    assert all(isinstance(f, memoryview) for f in message.frames)
+
+
+def test_frame_message_without_ids():
+    message = frame_protocol.parse_binary_message(frame_protocol.encode_binary_message([b'x']))
+    assert message.camera_id is None and message.user_id is None
+
+
+@pytest.mark.parametrize('mutate, error', [
+    (lambda d: d[:17], 'too short'),
+    (lambda d: b'NXVX' + d[4:], 'Bad magic'),
+    (lambda d: d[:4] + b'\x02' + d[5:], 'version'),
+    (lambda d: d[:-1], 'Truncated frame'),
+    (lambda d: d[:20], 'Truncated header'),
+])
+def test_frame_message_rejects_malformed(mutate, error):
+    data = frame_protocol.encode_binary_message([b'\xff\xd8abc'], 'cam-1', 'u')
+    with pytest.raises(ProtocolError, match=error):
+        frame_protocol.parse_binary_message(mutate(data))
+
+
+def test_json_frames_message():
+    text = json.dumps({
+        'type': 'analyze_frames',
+        'cameraId': 'cam-1',
+        'frames': ['data:image/jpeg;base64,/9hhYmM=', '/9hkZQ=='],
+        'metadata': {'timestamp': 7},
+    })
+
+    message = frame_protocol.parse_message(text)
+
+    assert not message.binary
+    assert message.camera_id == 'cam-1' and message.timestamp == 7.0
+    assert message.frames == [b'\xff\xd8abc', b'\xff\xd8de']
+
+
+@pytest.mark.parametrize('frames', ['/9hhYmM=', {'0': '/9hhYmM='}, [123], [None]])
+def test_json_frames_must_be_list_of_strings(frames):
+    with pytest.raises(ProtocolError):
+        frame_protocol.parse_json_message(json.dumps({'type': 'analyze_frames', 'frames': frames}))
+
+
+def test_json_control_message_has_no_frames():
+    message = frame_protocol.parse_message('{"type": "subscribe", "cameraId": "cam-1", "frames": "x"}')
+    assert message.type == 'subscribe'
+    assert message.frames == []
+    assert message.payload['cameraId'] == 'cam-1'
+
+
+# ---------------------------------------------------------------------------
+# Compact results (NXVR)
+# ---------------------------------------------------------------------------
+
+def test_result_header_layout():
+    assert result_codec.HEADER_SIZE == 32
+
+    data = result_codec.encode_compact({
+        'result': 'VETOED', 'violence': False, 'veto_skipped': True,
+        'primary': 95.5, 'veto': 40.25, 'violence_score': 95.5,
+        'inference_ms': 12.5, 'num_detected': 3,
+    })
+
+    assert len(data) == 32
+    assert data[:4] == b'NXVR'
+    assert data[4] == 1
+    assert data[5] == result_codec.FLAG_VETO_SKIPPED
+    assert data[6] == 2 and data[7] == 0
+    assert struct.unpack_from('<4f', data, 8) == (95.5, 40.25, 95.5, 12.5)
+    assert struct.unpack_from('<HHI', data, 24) == (3, 0, 0)
+
+
+def test_result_round_trip_with_skeletons_and_tail():
+    skeletons = make_skeletons(3)
+    response = {
+        'type': 'result',
+        'result': 'VIOLENCE', 'violence': True,
+        'primary': 97.0, 'veto': 88.5, 'violence_score': 97.0,
+        'inference_ms': 8.25, 'num_detected': 3,
+        'all_skeletons': skeletons,
+        'inference_rate': {'input_fps': 10.0},
+    }
+
+    data = result_codec.encode_compact(response)
+    decoded = result_codec.decode_compact(data)
+
+    assert data[7] == 1
+    assert struct.unpack_from('<BBH', data, 32) == (result_codec.SKELETON_KEY_IDS['all_skeletons'], 0, 3)
+    assert len(data) == 32 + 4 + 3 * 17 * 3 * 2 + struct.unpack_from('<I', data, 28)[0]
+    np.testing.assert_allclose(decoded.pop('all_skeletons'), skeletons, atol=1e-6)
+    assert decoded == {key: value for key, value in response.items() if key != 'all_skeletons'}
+
+
+def test_result_skeleton_blocks_start_at_even_offsets():
+    data = result_codec.encode_compact({'skeletons': make_skeletons(1), 'all_skeletons': make_skeletons(2, 1)})
+    first = 32 + 4
+    second = first + 1 * 17 * 3 * 2 + 4
+    assert first % 2 == 0 and second % 2 == 0
+    assert struct.unpack_from('<BBH', data, second - 4)[2] == 2
+
+
+def test_result_absent_fields():
+    decoded = result_codec.decode_compact(result_codec.encode_compact({'primary': 50.0, 'veto': None}))
+    assert decoded == {'primary': 50.0, 'veto': None, 'violence': False}
+
+
+def test_result_rejects_malformed():
+    data = result_codec.encode_compact({'primary': 50.0})
+    with pytest.raises(ValueError, match='too short'):
+        result_codec.decode_compact(data[:31])
+    with pytest.raises(ValueError, match='version'):
+        result_codec.decode_compact(data[:4] + b'\x09' + data[5:])
+
+
+# ---------------------------------------------------------------------------
+# Skeleton delta stream (NXVS)
+# ---------------------------------------------------------------------------
+
+def test_skeleton_keyframe_layout():
+    assert skeleton_stream.HEADER_SIZE == 12
+    skeletons = make_skeletons(2)
+
+    data = skeleton_stream.SkeletonDeltaEncoder().encode(skeletons)
+
+    magic, version, flags, seq, count, reserved = struct.unpack_from('<4sBBHHH', data, 0)
+    assert (magic, version, flags, seq, count, reserved) == (b'NXVS', 1, 1, 0, 2, 0)
+    assert len(data) == 12 + 2 * (4 + 17 * 3 * 2)
+    _track_id, kind, _ = struct.unpack_from('<HBB', data, 12)
+    assert kind == skeleton_stream.KIND_FULL
+    quantized = np.frombuffer(data, dtype=np.int16, count=51, offset=16).reshape(17, 3)
+    decoded = skeleton_stream.SkeletonDeltaDecoder().decode(data)
+    assert any(np.array_equal(result_codec.quantize_skeletons(k)[0], quantized) for k in decoded.values())
+
+
+def test_skeleton_delta_layout():
+    skeletons = make_skeletons(1)
+    encoder = skeleton_stream.SkeletonDeltaEncoder(deadband_px=0)
+    encoder.encode(skeletons)
+
+    moved = skeletons.copy()
+    moved[0, 3, 0] += 2.0     # +8 quarter pixels on joint 3
+    moved[0, 5, 1] -= 1.0     # -4 quarter pixels on joint 5
+    data = encoder.encode(moved)
+
+    _magic, _version, flags, seq, count, _ = struct.unpack_from('<4sBBHHH', data, 0)
+    assert (flags, seq, count) == (0, 1, 1)
+    _track_id, kind, _ = struct.unpack_from('<HBB', data, 12)
+    assert kind == skeleton_stream.KIND_DELTA
+    assert struct.unpack_from('<I', data, 16)[0] == (1 << 3) | (1 << 5)
+    assert struct.unpack_from('<6b', data, 20) == (8, 0, 0, 0, -4, 0)
+    assert len(data) == 12 + 4 + 4 + 6
+
+
+def test_skeleton_stream_round_trip():
+    rng = np.random.default_rng(1)
+    skeletons = make_skeletons(3)
+    encoder = skeleton_stream.SkeletonDeltaEncoder(keyframe_interval=5, deadband_px=0)
+    decoder = skeleton_stream.SkeletonDeltaDecoder()
+
+    for _ in range(12):
+        skeletons[..., :2] += rng.integers(-8, 9, size=skeletons[..., :2].shape) / 4.0
+        decoded = decoder.decode(encoder.encode(skeletons))
+        assert not decoder.needs_resync
+        assert len(decoded) == 3
+        for kpts in decoded.values():
+            assert np.abs(skeletons[:, :, :2] - kpts[:, :2]).max(axis=(1, 2)).min() == 0
+
+
+def test_skeleton_stream_missed_message_needs_resync():
+    skeletons = make_skeletons(1)
+    encoder = skeleton_stream.SkeletonDeltaEncoder()
+    decoder = skeleton_stream.SkeletonDeltaDecoder()
+    decoder.decode(encoder.encode(skeletons))
+    encoder.encode(skeletons)                       # lost in transit
+    decoder.decode(encoder.encode(skeletons))
+    assert decoder.needs_resync
+
+    encoder.request_keyframe()
+    data = encoder.encode(skeletons)
+    assert data[5] & skeleton_stream.FLAG_KEYFRAME
+    decoder.decode(data)
+    assert not decoder.needs_resync
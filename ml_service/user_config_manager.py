@@ -85,6 +85,13 @@ MODEL_ARCHITECTURES = {
     'STGCNPP_SCVD_Kaggle_lightft': 'STGCNPP',
 }
 
+# Inference backend per model: 'torch' (eager), 'onnx' (fp32) or 'onnx-int8'.
+# ONNX graphs are exported to ONNX_MODEL_DIR by onnx_backend.py; the
+# NEXARA_MODEL_BACKENDS environment variable overrides these on a given box.
+DEFAULT_MODEL_BACKEND = 'torch'
+MODEL_BACKENDS: Dict[str, str] = {}
+ONNX_MODEL_DIR = '/app/nexaravision/models/onnx'
+
 
 @dataclass
 class CachedConfig:
@@ -35,6 +35,8 @@ import {
 import { TextureButton } from '@/components/ui/texture-button';
 import { useSimpleFrameEncoder } from '@/hooks/useFrameEncoder';
 import { createLogger, alertLogger } from '@/lib/logger';
+import { createHelloMessage, decodeResultMessage } from '@/lib/result-codec';
+import { isSkeletonStreamMessage, SkeletonStreamDecoder } from '@/lib/skeleton-stream';
 
 const poseLog = createLogger('Pose');
 const vastaiLog = createLogger('Vast.ai');
@@ -135,6 +137,10 @@ export function LiveCamera() {
   const poseDetectorRef = useRef<PoseDetector | null>(null);
   const vastaiWsRef = useRef<WebSocket | null>(null);
   const vastaiFrameTimerRef = useRef<NodeJS.Timeout | null>(null);
+  const skeletonStreamRef = useRef<SkeletonStreamDecoder>(new SkeletonStreamDecoder());
+  const streamedSkeletonsRef = useRef<number[][][] | null>(null);
+  // Delta skeletons are only used once the server's hello reply accepted them
+  const deltaSkeletonsRef = useRef(false);
 
   const [detectionMode, setDetectionMode] = useState<DetectionMode>('vastai-realtime');
   const [wsConnected, setWsConnected] = useState(false);
@@ -175,6 +181,8 @@ export function LiveCamera() {
 
   const ML_SERVICE_URL = process.env.NEXT_PUBLIC_ML_SERVICE_URL || 'http://79.160.189.79:14082';
   const VASTAI_WS_URL = process.env.NEXT_PUBLIC_VASTAI_WS_URL || 'ws://79.160.189.79:14082/ws/live';
+  // Only servers that implement the hello negotiation (compact results, delta skeletons)
+  const VASTAI_NEGOTIATE = process.env.NEXT_PUBLIC_VASTAI_NEGOTIATE === 'true';
 
   const t = {
     liveCameraFeed: locale === 'ar' ? 'بث الكاميرا المباشر' : 'Live Camera Feed',
@@ -468,9 +476,17 @@ export function LiveCamera() {
 
       vastaiLog.debug('[Vast.ai] Connecting to WebSocket:', VASTAI_WS_URL);
       const ws = new WebSocket(VASTAI_WS_URL);
+      ws.binaryType = 'arraybuffer';
 
       ws.onopen = () => {
         vastaiLog.debug('[Vast.ai] WebSocket connected');
+        skeletonStreamRef.current.reset();
+        streamedSkeletonsRef.current = null;
+        deltaSkeletonsRef.current = false;
+        if (VASTAI_NEGOTIATE) {
+          // Offer compact results and delta skeletons; used only once the server acknowledges
+          ws.send(createHelloMessage({ skeletons: 'delta' }));
+        }
         setWsConnected(true);
         setBackend('Vast.ai GPU');
         vastaiWsRef.current = ws;
@@ -479,12 +495,26 @@ export function LiveCamera() {
 
       ws.onmessage = (event) => {
         try {
-          const data = JSON.parse(event.data);
-          handleVastaiResponse(data);
+          if (event.data instanceof ArrayBuffer && isSkeletonStreamMessage(event.data)) {
+            if (deltaSkeletonsRef.current) {
+              handleSkeletonStream(ws, event.data);
+            }
+            return;
+          }
+          const data = event.data instanceof ArrayBuffer
+            ? decodeResultMessage(event.data)
+            : JSON.parse(event.data);
+          if (data.type === 'hello') {
+            deltaSkeletonsRef.current = VASTAI_NEGOTIATE && data.skeletons === 'delta';
+            vastaiLog.debug('[Vast.ai] Server hello:', data);
+            return;
+          }
+          handleVastaiResponse(data as VastaiResponse);
         } catch (err) {
           // GAP-ERR-001 Fix: Log with details and notify user of malformed response
           const errorMessage = err instanceof Error ? err.message : 'Unknown parse error';
-          vastaiLog.error('[Vast.ai] Failed to parse response:', errorMessage, 'Raw:', event.data?.substring(0, 100));
+          const raw = typeof event.data === 'string' ? event.data.substring(0, 100) : `<${event.data?.byteLength} bytes>`;
+          vastaiLog.error('[Vast.ai] Failed to parse response:', errorMessage, 'Raw:', raw);
           // Don't set error state here to avoid disrupting detection, just log
         }
       };
@@ -511,6 +541,17 @@ export function LiveCamera() {
     });
   };
 
+  const handleSkeletonStream = (ws: WebSocket, buffer: ArrayBuffer) => {
+    const decoder = skeletonStreamRef.current;
+    const frame = decoder.decode(buffer);
+    streamedSkeletonsRef.current = frame.skeletons;
+    if (decoder.needsResync && ws.readyState === WebSocket.OPEN) {
+      // Missed a message or got a delta for an unknown track: ask for a keyframe
+      ws.send(JSON.stringify({ type: 'resync' }));
+      decoder.needsResync = false;
+    }
+  };
+
   const handleVastaiResponse = (data: VastaiResponse) => {
     if (data.error) {
       vastaiLog.error('[Vast.ai] Error:', data.error);
@@ -540,7 +581,7 @@ export function LiveCamera() {
     setIsAnalyzing(false);
 
     // Draw skeletons if provided (use all_skeletons for visualization in server mode)
-    const skeletonsToShow = data.all_skeletons || data.skeletons || [];
+    const skeletonsToShow = data.all_skeletons || streamedSkeletonsRef.current || data.skeletons || [];
     if (skeletonsToShow.length > 0) {
       drawVastaiSkeletons(skeletonsToShow);
     }
@@ -685,10 +685,10 @@ export default function LivePage() {
           if (data.result !== undefined && data.primary !== undefined) {
             if (data.result === 'VIOLENCE') {
               setVetoStatus('PRIMARY');
-              setVetoScore(data.veto / 100);
+              setVetoScore(data.veto != null ? data.veto / 100 : null);
             } else if (data.result === 'VETOED') {
               setVetoStatus('VETO_OVERRIDE');
-              setVetoScore(data.veto / 100);
+              setVetoScore(data.veto != null ? data.veto / 100 : null);
             } else {
               setVetoStatus('PRIMARY_FAST');
               setVetoScore(null);
@@ -823,10 +823,10 @@ export default function LivePage() {
               // Update VETO status based on result
               if (data.result === 'VIOLENCE') {
                 setVetoStatus('PRIMARY');
-                setVetoScore(data.veto / 100); // Convert percentage to 0-1
+                setVetoScore(data.veto != null ? data.veto / 100 : null); // Convert percentage to 0-1
               } else if (data.result === 'VETOED') {
                 setVetoStatus('VETO_OVERRIDE');
-                setVetoScore(data.veto / 100);
+                setVetoScore(data.veto != null ? data.veto / 100 : null);
               } else {
                 setVetoStatus('PRIMARY_FAST');
                 setVetoScore(null);
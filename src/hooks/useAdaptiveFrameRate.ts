@@ -2,11 +2,13 @@
  * React Hook for Adaptive Frame Rate
  *
  * Research: "Low activity: 1 FPS, Medium: 2-3 FPS, High: 5 FPS"
- * Automatically adjusts capture rate based on motion detection
+ * Automatically adjusts capture rate based on motion detection,
+ * capped by server backpressure hints when inference falls behind
  */
 
 import { useState, useCallback, useRef } from 'react';
 import { detectMotion, type MotionAnalysis } from '@/lib/preprocessing';
+import type { BackpressureHint } from '@/lib/websocket';
 
 export interface UseAdaptiveFrameRateOptions {
   minFPS?: number;
@@ -18,7 +20,9 @@ export interface UseAdaptiveFrameRateReturn {
   currentFPS: number;
   motionLevel: 'low' | 'medium' | 'high';
   motionScore: number;
+  serverCapFPS: number | null;
   updateMotion: (currentFrame: ImageData, previousFrame: ImageData | null) => void;
+  applyBackpressure: (hint: BackpressureHint) => void;
   getFrameInterval: () => number;
   reset: () => void;
 }
@@ -34,8 +38,10 @@ export function useAdaptiveFrameRate(
   const [currentFPS, setCurrentFPS] = useState(2); // Start at medium
   const [motionLevel, setMotionLevel] = useState<'low' | 'medium' | 'high'>('medium');
   const [motionScore, setMotionScore] = useState(0);
+  const [serverCapFPS, setServerCapFPS] = useState<number | null>(null);
 
   const motionHistoryRef = useRef<number[]>([]);
+  const serverCapRef = useRef<number | null>(null);
   const maxHistorySize = 10;
 
   /**
@@ -80,14 +86,38 @@ export function useAdaptiveFrameRate(
           targetFPS = 2;
       }
 
-      // Clamp to min/max
-      targetFPS = Math.max(minFPS, Math.min(maxFPS, targetFPS));
+      // Clamp to min/max and to what the server keeps up with
+      const cap = serverCapRef.current !== null ? Math.min(maxFPS, serverCapRef.current) : maxFPS;
+      targetFPS = Math.max(minFPS, Math.min(cap, targetFPS));
 
       setCurrentFPS(targetFPS);
     },
     [enabled, minFPS, maxFPS]
   );
 
+  /**
+   * Apply a server backpressure hint: cap FPS while frames are being dropped,
+   * lift the cap once the server reports it has caught up
+   */
+  const applyBackpressure = useCallback(
+    (hint: BackpressureHint) => {
+      if (!enabled) {
+        return;
+      }
+
+      if (hint.level === 'high' && hint.suggestedFps !== null) {
+        const cap = Math.max(minFPS, hint.suggestedFps);
+        serverCapRef.current = cap;
+        setServerCapFPS(cap);
+        setCurrentFPS((fps) => Math.min(fps, cap));
+      } else if (hint.level === 'ok') {
+        serverCapRef.current = null;
+        setServerCapFPS(null);
+      }
+    },
+    [enabled, minFPS]
+  );
+
   /**
    * Get frame capture interval in milliseconds
    */
@@ -102,14 +132,18 @@ export function useAdaptiveFrameRate(
     setCurrentFPS(2);
     setMotionLevel('medium');
     setMotionScore(0);
+    setServerCapFPS(null);
     motionHistoryRef.current = [];
+    serverCapRef.current = null;
   }, []);
 
   return {
     currentFPS,
     motionLevel,
     motionScore,
+    serverCapFPS,
     updateMotion,
+    applyBackpressure,
     getFrameInterval,
     reset,
   };
@@ -0,0 +1,96 @@
+/**
+ * Binary Frame Protocol
+ *
+ * Encodes frames for the detection WebSocket as a single binary message
+ * instead of base64 strings inside JSON (~33% smaller, no server-side
+ * JSON parse or base64 decode).
+ *
+ * Layout (little-endian), version 1 - must match ml_service/frame_protocol.py:
+ *   magic 'NXVF' (4) | version (1) | flags (1) | frame count (2)
+ *   | timestamp float64 ms (8) | cameraId length (1) | userId length (1)
+ *   | cameraId | userId | frame lengths (uint32 x N) | JPEG payloads
+ */
+
+export const FRAME_PROTOCOL_MAGIC = [0x4e, 0x58, 0x56, 0x46]; // 'NXVF'
+export const FRAME_PROTOCOL_VERSION = 1;
+export const FRAME_PROTOCOL_HEADER_SIZE = 18;
+export const FRAME_PROTOCOL_MAX_FRAMES = 64;
+
+export type FrameProtocol = 'json' | 'binary';
+
+export interface FrameMessageOptions {
+  cameraId?: string;
+  userId?: string;
+  timestamp?: number;
+}
+
+const textEncoder = new TextEncoder();
+
+/**
+ * Decode a base64 string or data URL into bytes
+ */
+export function base64ToBytes(data: string): Uint8Array {
+  const comma = data.indexOf(',');
+  const base64 = comma !== -1 && comma < 64 ? data.slice(comma + 1) : data;
+  const binary = atob(base64);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return bytes;
+}
+
+/**
+ * Convert a canvas JPEG Blob into bytes
+ */
+export async function blobToBytes(blob: Blob): Promise<Uint8Array> {
+  return new Uint8Array(await blob.arrayBuffer());
+}
+
+/**
+ * Build a binary frame message
+ */
+export function encodeFrameMessage(
+  frames: Uint8Array[],
+  options: FrameMessageOptions = {}
+): ArrayBuffer {
+  if (frames.length > FRAME_PROTOCOL_MAX_FRAMES) {
+    throw new Error(`Too many frames: ${frames.length}`);
+  }
+
+  const camera = textEncoder.encode(options.cameraId || '');
+  const user = textEncoder.encode(options.userId || '');
+  if (camera.length > 255 || user.length > 255) {
+    throw new Error('cameraId / userId longer than 255 bytes');
+  }
+
+  let payloadSize = 0;
+  for (const frame of frames) {
+    payloadSize += frame.length;
+  }
+
+  const lengthsOffset = FRAME_PROTOCOL_HEADER_SIZE + camera.length + user.length;
+  const payloadOffset = lengthsOffset + 4 * frames.length;
+  const buffer = new ArrayBuffer(payloadOffset + payloadSize);
+  const view = new DataView(buffer);
+  const bytes = new Uint8Array(buffer);
+
+  bytes.set(FRAME_PROTOCOL_MAGIC, 0);
+  view.setUint8(4, FRAME_PROTOCOL_VERSION);
+  view.setUint8(5, 0);
+  view.setUint16(6, frames.length, true);
+  view.setFloat64(8, options.timestamp ?? Date.now(), true);
+  view.setUint8(16, camera.length);
+  view.setUint8(17, user.length);
+  bytes.set(camera, FRAME_PROTOCOL_HEADER_SIZE);
+  bytes.set(user, FRAME_PROTOCOL_HEADER_SIZE + camera.length);
+
+  let offset = payloadOffset;
+  frames.forEach((frame, i) => {
+    view.setUint32(lengthsOffset + 4 * i, frame.length, true);
+    bytes.set(frame, offset);
+    offset += frame.length;
+  });
+
+  return buffer;
+}
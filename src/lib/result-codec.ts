@@ -0,0 +1,121 @@
+/**
+ * Compact Result Decoding
+ *
+ * Decodes binary detection responses sent by the server after the client
+ * negotiated the 'compact' encoding (scores in a fixed header, keypoints as
+ * quantized int16 arrays, remaining fields as a short JSON tail).
+ *
+ * Layout must match ml_service/result_codec.py (version 1). Decoded
+ * messages have the same shape as the JSON responses.
+ */
+
+export const RESULT_CODEC_MAGIC = 'NXVR';
+export const RESULT_CODEC_VERSION = 1;
+export const RESULT_CODEC_HEADER_SIZE = 32;
+
+export type ResultEncoding = 'json' | 'compact';
+
+const XY_SCALE = 4;
+const CONF_SCALE = 32767;
+const NUM_JOINTS = 17;
+
+const FLAG_VIOLENCE = 1;
+const FLAG_VETO_SKIPPED = 2;
+const FLAG_EMPTY_SCENE = 4;
+
+const RESULT_NAMES = ['', 'SAFE', 'VETOED', 'VIOLENCE'];
+const SKELETON_KEYS = ['all_skeletons', 'skeletons', 'kpts_visual'];
+
+const textDecoder = new TextDecoder();
+
+export interface HelloOptions {
+  encodings?: ResultEncoding[];
+  skeletons?: 'full' | 'delta'; // 'delta': skeletons via the delta stream
+}
+
+/**
+ * Hello message offering encodings to the server (send right after connect)
+ */
+export function createHelloMessage(options: HelloOptions = {}): string {
+  return JSON.stringify({
+    type: 'hello',
+    encodings: options.encodings || ['compact', 'json'],
+    skeletons: options.skeletons || 'full',
+  });
+}
+
+/**
+ * Check whether a binary message is a compact result
+ */
+export function isCompactResult(buffer: ArrayBuffer): boolean {
+  if (buffer.byteLength < RESULT_CODEC_HEADER_SIZE) return false;
+  const magic = new Uint8Array(buffer, 0, 4);
+  return String.fromCharCode(magic[0], magic[1], magic[2], magic[3]) === RESULT_CODEC_MAGIC;
+}
+
+/**
+ * Decode a compact result message into a response object
+ */
+export function decodeResultMessage(buffer: ArrayBuffer): Record<string, unknown> {
+  if (!isCompactResult(buffer)) {
+    throw new Error('Not a compact result message');
+  }
+
+  const view = new DataView(buffer);
+  const version = view.getUint8(4);
+  if (version !== RESULT_CODEC_VERSION) {
+    throw new Error(`Unsupported result encoding version ${version}`);
+  }
+
+  const flags = view.getUint8(5);
+  const resultCode = view.getUint8(6);
+  const blockCount = view.getUint8(7);
+  const primary = view.getFloat32(8, true);
+  const veto = view.getFloat32(12, true);
+  const violenceScore = view.getFloat32(16, true);
+  const inferenceMs = view.getFloat32(20, true);
+  const numDetected = view.getUint16(24, true);
+  const tailLength = view.getUint32(28, true);
+
+  const response: Record<string, unknown> = {};
+  let offset = RESULT_CODEC_HEADER_SIZE;
+
+  for (let b = 0; b < blockCount; b++) {
+    const keyId = view.getUint8(offset);
+    const count = view.getUint16(offset + 2, true);
+    offset += 4;
+
+    // Offsets are always even, so the keypoints can be viewed in place
+    const values = new Int16Array(buffer, offset, count * NUM_JOINTS * 3);
+    offset += values.byteLength;
+
+    const skeletons: number[][][] = [];
+    for (let p = 0; p < count; p++) {
+      const skeleton: number[][] = [];
+      for (let j = 0; j < NUM_JOINTS; j++) {
+        const i = (p * NUM_JOINTS + j) * 3;
+        skeleton.push([values[i] / XY_SCALE, values[i + 1] / XY_SCALE, values[i + 2] / CONF_SCALE]);
+      }
+      skeletons.push(skeleton);
+    }
+    response[SKELETON_KEYS[keyId]] = skeletons;
+  }
+
+  if (tailLength > 0) {
+    Object.assign(response, JSON.parse(textDecoder.decode(new Uint8Array(buffer, offset, tailLength))));
+  }
+
+  if (!Number.isNaN(primary)) {
+    response.primary = primary;
+    response.veto = Number.isNaN(veto) ? null : veto;
+  }
+  if (!Number.isNaN(violenceScore)) response.violence_score = violenceScore;
+  if (!Number.isNaN(inferenceMs)) response.inference_ms = inferenceMs;
+  if (resultCode) response.result = RESULT_NAMES[resultCode];
+  if (numDetected !== 0xffff) response.num_detected = numDetected;
+  response.violence = (flags & FLAG_VIOLENCE) !== 0;
+  if (flags & FLAG_VETO_SKIPPED) response.veto_skipped = true;
+  if (flags & FLAG_EMPTY_SCENE) response.empty_scene = true;
+
+  return response;
+}
@@ -0,0 +1,124 @@
+/**
+ * Delta-Encoded Skeleton Stream Decoder
+ *
+ * Reconstructs visualized skeletons from the server's per-track delta
+ * stream (keyframes with full int16 skeletons, then per-joint int8 deltas).
+ *
+ * Layout must match ml_service/skeleton_stream.py (version 1).
+ */
+
+export const SKELETON_STREAM_MAGIC = 'NXVS';
+export const SKELETON_STREAM_VERSION = 1;
+
+const HEADER_SIZE = 12;
+const NUM_JOINTS = 17;
+const KIND_FULL = 0;
+const FLAG_KEYFRAME = 1;
+const XY_SCALE = 4;
+const CONF_SCALE = 32767;
+const CONF_DELTA_SHIFT = 7;
+
+export interface SkeletonStreamFrame {
+  skeletons: number[][][]; // [person][joint][x, y, conf]
+  trackIds: number[];
+  keyframe: boolean;
+}
+
+/**
+ * Check whether a binary message belongs to the skeleton stream
+ */
+export function isSkeletonStreamMessage(buffer: ArrayBuffer): boolean {
+  if (buffer.byteLength < HEADER_SIZE) return false;
+  const magic = new Uint8Array(buffer, 0, 4);
+  return String.fromCharCode(magic[0], magic[1], magic[2], magic[3]) === SKELETON_STREAM_MAGIC;
+}
+
+/**
+ * Stateful decoder, one per connection
+ */
+export class SkeletonStreamDecoder {
+  private tracks = new Map<number, Int16Array>();
+  private lastSeq: number | null = null;
+
+  /** Set when a message was missed or a delta referenced an unknown track */
+  public needsResync = false;
+
+  public decode(buffer: ArrayBuffer): SkeletonStreamFrame {
+    const view = new DataView(buffer);
+    const version = view.getUint8(4);
+    if (version !== SKELETON_STREAM_VERSION) {
+      throw new Error(`Unsupported skeleton stream version ${version}`);
+    }
+
+    const keyframe = (view.getUint8(5) & FLAG_KEYFRAME) !== 0;
+    const seq = view.getUint16(6, true);
+    const count = view.getUint16(8, true);
+
+    if (keyframe) {
+      this.needsResync = false;
+    } else if (this.lastSeq !== null && seq !== ((this.lastSeq + 1) & 0xffff)) {
+      this.needsResync = true;
+    }
+    this.lastSeq = seq;
+
+    const tracks = new Map<number, Int16Array>();
+    let offset = HEADER_SIZE;
+
+    for (let p = 0; p < count; p++) {
+      const trackId = view.getUint16(offset, true);
+      const kind = view.getUint8(offset + 2);
+      offset += 4;
+
+      if (kind === KIND_FULL) {
+        tracks.set(trackId, new Int16Array(buffer.slice(offset, offset + NUM_JOINTS * 6)));
+        offset += NUM_JOINTS * 6;
+        continue;
+      }
+
+      const mask = view.getUint32(offset, true);
+      offset += 4;
+      const previous = this.tracks.get(trackId);
+      const kpts = previous ? previous.slice() : null;
+      let changed = 0;
+
+      for (let j = 0; j < NUM_JOINTS; j++) {
+        if (!(mask & (1 << j))) continue;
+        if (kpts) {
+          const at = offset + changed * 3;
+          kpts[j * 3] += view.getInt8(at);
+          kpts[j * 3 + 1] += view.getInt8(at + 1);
+          kpts[j * 3 + 2] += view.getInt8(at + 2) << CONF_DELTA_SHIFT;
+        }
+        changed++;
+      }
+      offset += changed * 3 + ((changed * 3) % 2);
+
+      if (kpts) {
+        tracks.set(trackId, kpts);
+      } else {
+        this.needsResync = true;
+      }
+    }
+
+    this.tracks = tracks;
+
+    const skeletons: number[][][] = [];
+    const trackIds: number[] = [];
+    tracks.forEach((kpts, trackId) => {
+      const skeleton: number[][] = [];
+      for (let j = 0; j < NUM_JOINTS; j++) {
+        skeleton.push([kpts[j * 3] / XY_SCALE, kpts[j * 3 + 1] / XY_SCALE, kpts[j * 3 + 2] / CONF_SCALE]);
+      }
+      skeletons.push(skeleton);
+      trackIds.push(trackId);
+    });
+
+    return { skeletons, trackIds, keyframe };
+  }
+
+  public reset(): void {
+    this.tracks.clear();
+    this.lastSeq = null;
+    this.needsResync = false;
+  }
+}
@@ -6,6 +6,7 @@
  */
 
 import { wsLogger as log } from '@/lib/logger';
+import { base64ToBytes, encodeFrameMessage, FrameProtocol } from '@/lib/frame-protocol';
 
 export interface WebSocketMessage {
   type: 'analyze_frames' | 'ping' | 'subscribe' | 'unsubscribe';
@@ -24,15 +25,26 @@ export interface DetectionResult {
   processingTime?: number;
 }
 
+export interface BackpressureHint {
+  cameraId?: string;
+  level: 'high' | 'ok';
+  suggestedFps: number | null;
+  queueDepth: number;
+  dropRatio: number;
+  processedFps: number;
+}
+
 export interface WebSocketConfig {
   url?: string;
   reconnectInterval?: number;
   maxReconnectAttempts?: number;
   heartbeatInterval?: number;
+  protocol?: FrameProtocol; // 'json' (default) or 'binary' frame messages
 }
 
 export type WebSocketEventHandler = (data: DetectionResult) => void;
 export type WebSocketErrorHandler = (error: Error) => void;
+export type WebSocketBackpressureHandler = (hint: BackpressureHint) => void;
 export type WebSocketStatusHandler = (status: 'connecting' | 'connected' | 'disconnected' | 'error') => void;
 
 /**
@@ -45,11 +57,14 @@ export class DetectionWebSocket {
   private heartbeatTimer: NodeJS.Timeout | null = null;
   private isManualClose = false;
   private userId: string | null = null;
+  private subscriptions = new Set<string>();
+  private retryAfterMs = 0;
 
   private config: Required<WebSocketConfig>;
   private eventHandlers: WebSocketEventHandler[] = [];
   private errorHandlers: WebSocketErrorHandler[] = [];
   private statusHandlers: WebSocketStatusHandler[] = [];
+  private backpressureHandlers: WebSocketBackpressureHandler[] = [];
 
   constructor(config: WebSocketConfig = {}) {
     this.config = {
@@ -57,6 +72,7 @@ export class DetectionWebSocket {
       reconnectInterval: config.reconnectInterval || 3000,
       maxReconnectAttempts: config.maxReconnectAttempts || 5,
       heartbeatInterval: config.heartbeatInterval || 30000,
+      protocol: config.protocol || 'json',
     };
   }
 
@@ -101,6 +117,10 @@ export class DetectionWebSocket {
           this.reconnectAttempts = 0;
           this.notifyStatus('connected');
           this.startHeartbeat();
+          // Re-join shared camera pipelines after a reconnect
+          this.subscriptions.forEach((cameraId) =>
+            this.send({ type: 'subscribe', cameraId, userId: this.userId || undefined })
+          );
           resolve();
         };
 
@@ -114,6 +134,32 @@ export class DetectionWebSocket {
               return;
             }
 
+            if (data.type === 'backpressure') {
+              // Server ingress queue is dropping frames (or has recovered)
+              this.notifyBackpressure({
+                cameraId: data.cameraId,
+                level: data.level,
+                suggestedFps: data.suggested_fps ?? null,
+                queueDepth: data.queue_depth || 0,
+                dropRatio: data.drop_ratio || 0,
+                processedFps: data.processed_fps || 0,
+              });
+              return;
+            }
+
+            if (data.type === 'admission') {
+              // Node is over capacity: it closes the socket after this message
+              if (data.status !== 'admitted') {
+                log.warn(`[WebSocket] Session ${data.status} (${data.reason}) for ${data.cameraId}`);
+                this.retryAfterMs = (data.retry_after || 0) * 1000;
+                if (data.redirect) {
+                  this.config.url = data.redirect;
+                }
+                this.notifyError(new Error(`Detection server at capacity (${data.status})`));
+              }
+              return;
+            }
+
             if (data.result) {
               // Detection result
               const result: DetectionResult = {
@@ -193,6 +239,11 @@ export class DetectionWebSocket {
       return;
     }
 
+    if (this.config.protocol === 'binary') {
+      this.analyzeFrameBytes(frames.map(base64ToBytes), cameraId);
+      return;
+    }
+
     const message: WebSocketMessage = {
       type: 'analyze_frames',
       frames,
@@ -207,6 +258,45 @@ export class DetectionWebSocket {
     this.send(message);
   }
 
+  /**
+   * Receive results, overlays and alerts of a camera streamed by another
+   * connection (the server runs one pipeline per camera)
+   */
+  public subscribe(cameraId: string): void {
+    this.subscriptions.add(cameraId);
+    this.send({ type: 'subscribe', cameraId, userId: this.userId || undefined });
+  }
+
+  /**
+   * Stop receiving a camera's results
+   */
+  public unsubscribe(cameraId: string): void {
+    this.subscriptions.delete(cameraId);
+    this.send({ type: 'unsubscribe', cameraId });
+  }
+
+  /**
+   * Send raw JPEG frames for analysis as a binary frame message
+   */
+  public analyzeFrameBytes(frames: Uint8Array[], cameraId?: string): void {
+    if (!this.isConnected()) {
+      log.warn('[WebSocket] Not connected, cannot send frames');
+      return;
+    }
+
+    try {
+      this.ws!.send(
+        encodeFrameMessage(frames, {
+          cameraId,
+          userId: this.userId || undefined,
+          timestamp: Date.now(),
+        })
+      );
+    } catch (err) {
+      log.error('[WebSocket] Failed to encode frames:', err);
+    }
+  }
+
   /**
    * Send WebSocket message
    */
@@ -236,11 +326,15 @@ export class DetectionWebSocket {
     this.reconnectAttempts++;
     log.debug(`[WebSocket] Reconnecting... (attempt ${this.reconnectAttempts}/${this.config.maxReconnectAttempts})`);
 
+    // Honour the server's retry-after hint when it refused the session
+    const delay = Math.max(this.config.reconnectInterval, this.retryAfterMs);
+    this.retryAfterMs = 0;
+
     this.reconnectTimer = setTimeout(() => {
       this.connect().catch((err) => {
         log.error('[WebSocket] Reconnect failed:', err);
       });
-    }, this.config.reconnectInterval);
+    }, delay);
   }
 
   /**
@@ -304,6 +398,16 @@ export class DetectionWebSocket {
     };
   }
 
+  /**
+   * Register backpressure hint handler (feed into useAdaptiveFrameRate)
+   */
+  public onBackpressure(handler: WebSocketBackpressureHandler): () => void {
+    this.backpressureHandlers.push(handler);
+    return () => {
+      this.backpressureHandlers = this.backpressureHandlers.filter((h) => h !== handler);
+    };
+  }
+
   /**
    * Notify event handlers
    */
@@ -330,6 +434,19 @@ export class DetectionWebSocket {
     });
   }
 
+  /**
+   * Notify backpressure handlers
+   */
+  private notifyBackpressure(hint: BackpressureHint): void {
+    this.backpressureHandlers.forEach((handler) => {
+      try {
+        handler(hint);
+      } catch (err) {
+        log.error('[WebSocket] Backpressure handler error:', err);
+      }
+    });
+  }
+
   /**
    * Notify status handlers
    */